@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from multiprocessing import Pool
+import csv, glob, json, os, sys
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.SPLAT import SPLAT
+from splat.Extractor import Extractor
+from splat.parsers.ParserPool import ParserManager
+from splat.parsers.TreeStringParser import TreeStringParser
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+##### GLOBAL VARIABLES #################################################################################################
+# The features computed by each worker process, and the FeatureStore it uses (if any), set by _init_worker().
+worker_features = []
+worker_store = None
+
+def _init_worker(features, parser_pool, store):
+	""" Prepares a worker process to extract the given features, using the given shared ParserPool and FeatureStore. """
+	global worker_features, worker_store
+	worker_features = features
+	worker_store = store
+	if parser_pool is not None:
+		TreeStringParser.pool = parser_pool
+
+def _extract_file(path):
+	""" Returns the row for a single document. Errors are reported in the row rather than stopping the batch. """
+	row = {"file": path}
+	try:
+		doc = worker_store.load(path) if worker_store is not None else SPLAT(path)
+		row.update(Extractor().extract(doc, worker_features))
+		if worker_store is not None:
+			worker_store.save(doc)
+	except Exception as e:
+		row["error"] = str(e)
+	return row
+
+class Batch:
+	"""
+	A Batch computes a set of SPLAT features for every document of a corpus, using a pool of worker processes. Workers
+	that need parse trees share a single pool of running Berkeley Parsers. Rows are produced in the order of the
+	documents, as soon as each one is ready. With a FeatureStore, features computed by earlier runs are read from the
+	store, and the features computed by this run are added to it.
+	"""
+	def __init__(self, features, processes=None, parsers=1, store=None):
+		"""
+		Creates a Batch object.
+		:param features:a list of feature names (see Extractor.features)
+		:type features:list
+		:param processes:the number of worker processes (by default, the number of CPUs)
+		:type processes:int
+		:param parsers:the number of Berkeley Parser processes shared by the workers
+		:type parsers:int
+		:param store:the FeatureStore to read and add features to, if any
+		:type store:FeatureStore
+		"""
+		self.__branches = Extractor().plan(features)
+		self.__features = list(features)
+		self.__processes = processes
+		self.__parsers = parsers
+		self.__store = store
+
+	@staticmethod
+	def documents(sources):
+		"""
+		Returns the files named by the given sources, in order.
+		:param sources:a list of directories (every file directly inside them), glob patterns, or filenames
+		:type sources:list
+		:return:a list of filenames
+		:rtype:list
+		"""
+		documents = []
+		for source in sources:
+			if os.path.isdir(source):
+				documents.extend(sorted(path for path in glob.glob(os.path.join(source, "*")) if os.path.isfile(path)))
+			elif os.path.isfile(source):
+				documents.append(source)
+			else:
+				matches = sorted(path for path in glob.glob(source) if os.path.isfile(path))
+				if len(matches) == 0:
+					raise ValueError("WARNING: No such file, directory, or pattern: " + str(source) + ".")
+				documents.extend(matches)
+
+		return documents
+
+	def rows(self, sources):
+		"""
+		Yields one row per document: a dictionary mapping "file" to the filename and each feature name to its value. A
+		document that cannot be processed has an "error" entry instead of its features.
+		:param sources:a list of directories, glob patterns, or filenames
+		:type sources:list
+		:return:a generator of dictionaries
+		:rtype:generator
+		"""
+		documents = self.documents(sources)
+		manager, parser_pool = None, None
+		if any("treestrings" in branch for branch in self.__branches):
+			manager = ParserManager()
+			manager.start()
+			parser_pool = manager.ParserPool(self.__parsers)
+
+		try:
+			initargs = (self.__features, parser_pool, self.__store)
+			with Pool(self.__processes, initializer=_init_worker, initargs=initargs) as pool:
+				for row in pool.imap(_extract_file, documents):
+					yield row
+		finally:
+			if manager is not None:
+				parser_pool.close()
+				manager.shutdown()
+
+	def run(self, sources, out_file=sys.stdout, out_format="jsonl"):
+		"""
+		Writes one row per document to out_file, as JSON lines or CSV, and returns the number of documents.
+		:param sources:a list of directories, glob patterns, or filenames
+		:type sources:list
+		:param out_file:an open text file
+		:type out_file:file
+		:param out_format:either "jsonl" or "csv"
+		:type out_format:str
+		:return:the number of documents
+		:rtype:int
+		"""
+		if out_format not in ["jsonl", "csv"]:
+			raise ValueError("WARNING: Unknown output format: " + str(out_format) + ".")
+
+		writer = None
+		if out_format == "csv":
+			writer = csv.writer(out_file)
+			writer.writerow(["file"] + self.__features + ["error"])
+
+		count = 0
+		for row in self.rows(sources):
+			if writer is None:
+				out_file.write(json.dumps(row, default=self.__jdefault) + "\n")
+			else:
+				writer.writerow([row["file"]] + [self.__csv_value(row.get(name, "")) for name in self.__features] +
+								[row.get("error", "")])
+			out_file.flush()
+			count += 1
+
+		return count
+
+	@staticmethod
+	def __jdefault(o):
+		""" Converts the sets, tuples and arrays found in feature values into JSON lists. """
+		if isinstance(o, set):
+			return sorted(o)
+		return list(o)
+
+	@staticmethod
+	def __csv_value(value):
+		""" Numbers and strings are written as they are; anything else is written as JSON. """
+		if isinstance(value, (int, float, str)):
+			return value
+		return json.dumps(value, default=Batch.__jdefault)
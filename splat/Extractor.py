@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from concurrent.futures import ThreadPoolExecutor
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.SPLAT import SPLAT
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class Extractor:
+	"""
+	An Extractor computes a set of SPLAT features at once. It plans the intermediate features that are needed (tokens,
+	syllables, parse trees, POS tags, ...) so that each is computed exactly once, and computes independent branches of
+	the plan, such as parsing and lexical counts, at the same time.
+	"""
+	# Each feature name (as used by the command line) maps to the SPLAT method that returns it, and to the node of the
+	# SPLAT feature graph that the method reads.
+	features = {"wc": ("wordcount", "wordcount"), "uwc": ("unique_wordcount", "unique_wordcount"),
+				"tokens": ("tokens", "token_ids"), "types": ("types", "types"), "sents": ("sents", "sentences"),
+				"sentcount": ("sentcount", "sentcount"), "utts": ("utts", "utterances"),
+				"uttcount": ("uttcount", "uttcount"), "ttr": ("type_token_ratio", "ttr"),
+				"mattr": ("mattr", "mattr"), "mtld": ("mtld", "mtld"), "hdd": ("hdd", "hdd"),
+				"yulek": ("yules_k", "yules_k"), "honore": ("honore", "honore"),
+				"alu": ("average_utterance_length", "alu"), "als": ("average_sentence_length", "als"),
+				"cfr": ("content_function_ratio", "cfr"), "content": ("content_words", "content_words"),
+				"function": ("function_words", "function_words"),
+				"ucontent": ("unique_content_words", "unique_content_words"),
+				"ufunction": ("unique_function_words", "unique_function_words"), "pos": ("pos", "pos"),
+				"poscounts": ("pos_counts", "pos_counts"), "trees": ("treestrings", "treestrings"),
+				"maxdepth": ("max_depth", "maxdepth"), "cdensity": ("content_density", "content_density"),
+				"mincdensity": ("min_content_density", "content_density"),
+				"maxcdensity": ("max_content_density", "content_density"),
+				"idensity": ("idea_density", "idea_density"), "minidensity": ("min_idea_density", "idea_density"),
+				"maxidensity": ("max_idea_density", "idea_density"),
+				"spidensity": ("speech_idea_density", "speech_idea_density"),
+				"yngve": ("tree_based_yngve_score", "yngve"),
+				"syngve": ("string_based_yngve_score", "string_yngve"),
+				"frazier": ("tree_based_frazier_score", "frazier"), "syllables": ("syllables", "syllables"),
+				"asps": ("average_sps", "asps"), "aspu": ("average_spu", "aspu"),
+				"flesch": ("flesch_readability", "flesch"), "kincaid": ("kincaid_grade_level", "kincaid"),
+				"readability": ("readability", "readability"), "fog": ("gunning_fog", "readability"),
+				"smog": ("smog", "readability"), "cli": ("coleman_liau", "readability"),
+				"ari": ("automated_readability_index", "readability"), "dalechall": ("dale_chall", "dale_chall"),
+				"lix": ("lix", "readability"),
+				"adpu": ("average_dpu", "adpu"), "adps": ("average_dps", "adps"),
+				"disfluencies": ("dis", "disfluencies"), "repetitions": ("repetitions", "repetitions"),
+				"acts": ("dialog_acts", "dialog_acts"),
+				"unigrams": ("unigrams", "unigrams"),
+				"bigrams": ("bigrams", "bigrams"), "trigrams": ("trigrams", "trigrams"),
+				"lwords": ("longest_words", "char_features"), "swords": ("shortest_words", "char_features"),
+				"awl": ("average_word_length", "char_features"), "wlhist": ("word_length_histogram", "char_features"),
+				"mostfreq": ("get_most_freq", "freq_dist")}
+
+	def __init__(self):
+		"""
+		Creates an Extractor object.
+		"""
+		pass
+
+	def plan(self, features):
+		"""
+		Returns the feature graph nodes needed for the given features, grouped into independent branches. Every node
+		appears in exactly one branch, after all of its prerequisites, and two branches never share a computed node, so
+		branches can be computed at the same time.
+		:param features:a list of feature names (see Extractor.features)
+		:type features:list
+		:return:a list of branches, each a list of node names in the order they should be computed
+		:rtype:list
+		"""
+		for name in features:
+			if name not in self.features:
+				raise ValueError("WARNING: Unknown feature: " + str(name) + ".")
+		graph = SPLAT.feature_graph()
+
+		# Order the needed nodes so that every node comes after its prerequisites.
+		order, seen = [], set()
+		stack = [(self.features[name][1], False) for name in reversed(features)]
+		while len(stack) > 0:
+			(node, expanded) = stack.pop()
+			if expanded:
+				order.append(node)
+			elif node not in seen:
+				seen.add(node)
+				stack.append((node, True))
+				if graph[node] is not None:
+					stack.extend((prerequisite, False) for prerequisite in reversed(graph[node]))
+
+		# Nodes that share a computed prerequisite belong to the same branch. Inputs are already set, so they are left
+		# out of the plan and do not join branches together.
+		branch_of = {}
+		for node in order:
+			if graph[node] is None:
+				continue
+			branches = {branch_of[p] for p in graph[node] if p in branch_of}
+			branch = min(branches) if len(branches) > 0 else len(branch_of)
+			for other in branches:
+				for (n, b) in branch_of.items():
+					if b == other:
+						branch_of[n] = branch
+			branch_of[node] = branch
+
+		branches = {}
+		for node in order:
+			if node in branch_of:
+				branches.setdefault(branch_of[node], []).append(node)
+
+		return list(branches.values())
+
+	def extract(self, doc, features, parallel=True):
+		"""
+		Computes the given features for the given document.
+		:param doc:a SPLAT, or a text or filename to create one from
+		:type doc:SPLAT,str,filename
+		:param features:a list of feature names (see Extractor.features)
+		:type features:list
+		:param parallel:whether to compute independent branches of the plan in separate threads
+		:type parallel:bool
+		:return:a dictionary mapping each feature name to its value
+		:rtype:dict
+		"""
+		if not isinstance(doc, SPLAT):
+			doc = SPLAT(doc)
+
+		branches = self.plan(features)
+		if parallel and len(branches) > 1:
+			with ThreadPoolExecutor(max_workers=len(branches)) as executor:
+				futures = [executor.submit(self.__compute, doc, branch) for branch in branches]
+				for future in futures:
+					future.result()
+		else:
+			for branch in branches:
+				self.__compute(doc, branch)
+
+		return {name: getattr(doc, self.features[name][0])() for name in features}
+
+	@staticmethod
+	def __compute(doc, branch):
+		""" Computes each node of the given branch, in order. """
+		for node in branch:
+			doc.feature(node)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+import hashlib, json, os
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.SPLAT import SPLAT
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class FeatureStore:
+	"""
+	A FeatureStore keeps the features of every SPLAT it has seen in a single directory, shared by every file and every
+	run. Each SPLAT is stored as a SplatFile named by a hash of its text, of the configuration it was computed with, and
+	of the SPLAT source code, so an edited file or an upgraded SPLAT never reads stale features, and identical texts
+	under different names share their features. When the store grows beyond max_size bytes, the entries that were used
+	least recently are removed.
+	"""
+	# A hash of the SPLAT source code, computed the first time a FeatureStore needs it.
+	__code_version = None
+
+	def __init__(self, directory=None, max_size=1073741824, config=None):
+		"""
+		Creates a FeatureStore object.
+		:param directory:the directory of the store (by default $SPLAT_CACHE_DIR, or splat/ in the user's cache
+		directory)
+		:type directory:str
+		:param max_size:the number of bytes the store may hold before its least recently used entries are removed
+		:type max_size:int
+		:param config:any settings that change the features computed, which become part of every key
+		:type config:dict
+		"""
+		if directory is None:
+			directory = os.environ.get("SPLAT_CACHE_DIR")
+		if directory is None:
+			cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+			directory = os.path.join(cache_home, "splat")
+		self.directory = directory
+		self.max_size = max_size
+		self.__config = json.dumps(config if config is not None else {}, sort_keys=True)
+		# The number of bytes in the store, counted when it is first needed and then kept up to date by save().
+		self.__size = None
+
+	@classmethod
+	def code_version(cls):
+		""" Returns a hash of the source code of the splat package, which changes whenever SPLAT is changed. """
+		if cls.__code_version is None:
+			digest = hashlib.sha256()
+			root = os.path.dirname(os.path.abspath(__file__))
+			for (dirpath, dirnames, filenames) in os.walk(root):
+				dirnames.sort()
+				for filename in sorted(filenames):
+					if filename.endswith(".py"):
+						digest.update(os.path.relpath(os.path.join(dirpath, filename), root).encode("utf-8"))
+						with open(os.path.join(dirpath, filename), 'rb') as f:
+							digest.update(f.read())
+			cls.__code_version = digest.hexdigest()
+		return cls.__code_version
+
+	def key(self, doc):
+		"""
+		Returns the key of the given SPLAT in this store.
+		:param doc:a SPLAT that was not built by streaming
+		:type doc:SPLAT
+		:return:a hexadecimal hash
+		:rtype:str
+		"""
+		digest = hashlib.sha256()
+		digest.update(self.code_version().encode("utf-8"))
+		digest.update(self.__config.encode("utf-8"))
+		digest.update(doc.splat().encode("utf-8"))
+		return digest.hexdigest()
+
+	def path(self, doc):
+		""" Returns the path of the entry for the given SPLAT. """
+		return self.__entry_path(self.key(doc))
+
+	def __entry_path(self, key):
+		""" Returns the path of the entry with the given key. """
+		return os.path.join(self.directory, key[:2], key + ".splat")
+
+	def load(self, doc):
+		"""
+		Returns a SPLAT for the given document that reads any features already in the store instead of computing them.
+		If the document is a file that has only been appended to since it was last loaded, the features of its previous
+		version are extended with the new lines instead (see SPLAT.extend_from_file()).
+		:param doc:a SPLAT, or a text or filename to create one from
+		:type doc:SPLAT,str,filename
+		:return:a SPLAT
+		:rtype:SPLAT
+		"""
+		filename = None
+		if not isinstance(doc, SPLAT):
+			if os.path.isfile(doc):
+				filename = doc
+			doc = SPLAT(doc)
+		key = self.key(doc)
+		path = self.__entry_path(key)
+		if os.path.exists(path):
+			try:
+				doc.attach_cache(path)
+				os.utime(path)
+			except (OSError, ValueError):
+				# The entry was removed, written by a different version of SPLAT, or damaged; save() replaces it.
+				pass
+		elif filename is not None:
+			doc = self.__extend_previous(filename) or doc
+
+		if filename is not None:
+			self.__set_previous(filename, key)
+		return doc
+
+	def __previous_path(self, filename):
+		""" Returns the path of the file that records the key of the last version of filename that was loaded. """
+		name = hashlib.sha256(os.path.abspath(filename).encode("utf-8")).hexdigest()
+		return os.path.join(self.directory, "files", name)
+
+	def __set_previous(self, filename, key):
+		""" Records that the version of filename with the given key was the last one loaded. """
+		try:
+			os.makedirs(os.path.join(self.directory, "files"), exist_ok=True)
+			with open(self.__previous_path(filename), 'w') as f:
+				f.write(key)
+		except OSError:
+			# Without the record, the next version of the file is simply computed from scratch.
+			pass
+
+	def __extend_previous(self, filename):
+		"""
+		Returns the SPLAT of the last version of filename that was stored, extended to its current lines, or None.
+		"""
+		try:
+			with open(self.__previous_path(filename), 'r') as f:
+				key = f.read().strip()
+			previous = SPLAT.load_cache(self.__entry_path(key))
+			previous.extend_from_file(filename)
+			return previous
+		except (OSError, ValueError):
+			# There is no previous version, or the file was changed rather than appended to.
+			return None
+
+	def save(self, doc):
+		"""
+		Adds the features of the given SPLAT that are not in the store yet, and then removes the least recently used
+		entries if the store has grown beyond max_size.
+		:param doc:a SPLAT that was not built by streaming
+		:type doc:SPLAT
+		"""
+		path = self.path(doc)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		old_size = os.path.getsize(path) if os.path.exists(path) else 0
+		try:
+			doc.save_cache(path)
+		except ValueError:
+			# The entry was written by a different version of SPLAT, or was damaged, so it is written again.
+			os.remove(path)
+			doc.save_cache(path)
+
+		if self.__size is None:
+			self.__size = self.size()
+		else:
+			self.__size += os.path.getsize(path) - old_size
+		if self.__size > self.max_size:
+			self.evict()
+
+	def size(self):
+		""" Returns the number of bytes held by the store. """
+		return sum(size for (used, size, path) in self.__entries())
+
+	def evict(self):
+		""" Removes the least recently used entries until the store holds at most max_size bytes. """
+		entries = sorted(self.__entries())
+		total = sum(size for (used, size, path) in entries)
+		for (used, size, path) in entries:
+			if total <= self.max_size:
+				break
+			try:
+				os.remove(path)
+			except OSError:
+				# Another process removed it first.
+				pass
+			total -= size
+		self.__size = total
+
+	def __entries(self):
+		""" Returns a (last used, size, path) triple for every entry in the store. """
+		entries = []
+		if not os.path.isdir(self.directory):
+			return entries
+		for (dirpath, dirnames, filenames) in os.walk(self.directory):
+			for filename in filenames:
+				if filename.endswith(".splat"):
+					path = os.path.join(dirpath, filename)
+					try:
+						stat = os.stat(path)
+					except OSError:
+						continue
+					entries.append((stat.st_mtime, stat.st_size, path))
+		return entries
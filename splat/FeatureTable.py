@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from array import array
+import csv, math
+
+##### NLTK IMPORTS #####################################################################################################
+from nltk.tree import Tree
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.sentenizers.Sentenizer import Sentenizer
+from splat.tokenizers.CleanTokenizer import CleanTokenizer
+from splat.tokenizers.RawTokenizer import RawTokenizer
+import splat.Util as Util
+import splat.complexity as cUtil
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+##### GLOBAL VARIABLES #################################################################################################
+# The value of a feature that cannot be computed for a unit (math.nan only exists from Python 3.5).
+NAN = float("nan")
+
+########################################################################################################################
+
+class FeatureTable:
+	"""
+	A FeatureTable holds the features of each utterance (or each sentence) of a SPLAT: one row per unit and one column
+	per feature. Each column is a single array of numbers, computed for every unit at once, so no row is ever held as a
+	Python object; rows are only put together when the table is written out as CSV.
+
+	The columns are the counts behind the Flesch scores (words, syllables and sentences), the Flesch scores themselves,
+	the count of each kind of disfluency (see Util.disfluency_categories), and the features of each parse tree: Yngve
+	and Frazier scores, depth, content density and idea density. Parse trees are only available for utterances. A
+	value that cannot be computed for a unit, such as the idea density of an utterance without tagged words, is NaN.
+	"""
+	counts = ["words", "syllables", "sentences", "flesch", "kincaid"]
+	disfluencies = [category for category in Util.disfluency_categories if category != "Words"]
+	trees = ["yngve", "frazier", "depth", "cdensity", "idensity"]
+
+	def __init__(self, doc, unit="utterances", columns=None):
+		"""
+		Creates a FeatureTable object, computing each of its columns.
+		:param doc:the SPLAT to tabulate
+		:type doc:SPLAT
+		:param unit:either "utterances" or "sentences"
+		:type unit:str
+		:param columns:the names of the columns to compute (by default, every column available for the unit)
+		:type columns:list
+		"""
+		if unit not in ["utterances", "sentences"]:
+			raise ValueError("WARNING: A feature table has a row per \"utterances\" or \"sentences\", not " +
+							 str(unit) + ".")
+		available = FeatureTable.counts + FeatureTable.disfluencies
+		if unit == "utterances":
+			available = available + FeatureTable.trees
+		if columns is None:
+			columns = available
+		for name in columns:
+			if name not in available:
+				if name in FeatureTable.trees:
+					raise ValueError("WARNING: " + name + " is only available for a table of utterances.")
+				raise ValueError("WARNING: Unknown feature table column: " + str(name) + ".")
+		self.unit = unit
+		self.columns = list(columns)
+		self.__units = doc.utts() if unit == "utterances" else doc.sents()
+		self.__data = {}
+
+		needs = set(columns)
+		if needs & set(FeatureTable.counts):
+			self.__data.update(self.__count_columns(needs))
+		if needs & set(FeatureTable.disfluencies):
+			matrix = doc.disfluency_matrix(sentences=(unit == "sentences"))
+			width = len(Util.disfluency_categories)
+			for (i, category) in enumerate(Util.disfluency_categories):
+				if category in needs:
+					self.__data[category] = array('I', matrix[i::width])
+		if needs & set(FeatureTable.trees):
+			self.__data.update(self.__tree_columns(doc, needs))
+
+	def __count_columns(self, needs):
+		""" Returns the word, syllable and sentence counts of each unit, and its Flesch scores. """
+		words, syllables, sentences = array('I'), array('I'), array('I')
+		# Syllables are counted once per type, and only when a column needs them.
+		type_syllables = {} if needs & {"syllables", "flesch", "kincaid"} else None
+		for unit in self.__units:
+			tokens = RawTokenizer().tokenize(unit)
+			words.append(len(tokens))
+			sentences.append(sum(1 for token in tokens if any(punct in token for punct in Sentenizer.punctlist)))
+			if type_syllables is not None:
+				count = 0
+				for token in tokens:
+					word = CleanTokenizer.normalize(token)
+					if word not in type_syllables:
+						type_syllables[word] = cUtil.word_syllables(word)
+					count += type_syllables[word]
+				syllables.append(count)
+		data = {"words": words, "sentences": sentences}
+		if type_syllables is None:
+			return data
+
+		data["syllables"] = syllables
+		# A unit without sentence-ending punctuation is still a single sentence.
+		data["flesch"] = array('d', (cUtil.calc_flesch_readability(w, max(s, 1), y) if w != 0 else 0.0
+									 for (w, s, y) in zip(words, sentences, syllables)))
+		data["kincaid"] = array('d', (cUtil.calc_flesch_kincaid(w, max(s, 1), y) if w != 0 else 0.0
+									  for (w, s, y) in zip(words, sentences, syllables)))
+		return data
+
+	def __aligned(self, values):
+		""" Returns the given values of each parse tree, aligned with the utterances (the parser skips empty ones). """
+		if len(values) == len(self.__units):
+			return values
+		values, aligned = iter(values), []
+		for utt in self.__units:
+			aligned.append(next(values, None) if utt != "" else None)
+		return aligned
+
+	def __tree_columns(self, doc, needs):
+		""" Returns the Yngve and Frazier scores, depth, and content and idea densities of each utterance's tree. """
+		data = {}
+		if needs & {"yngve", "frazier", "depth"}:
+			yngve, frazier, depth = array('d'), array('d'), array('d')
+			for treestring in self.__aligned(doc.treestrings()):
+				if treestring is None or treestring.strip() == "":
+					yngve.append(NAN)
+					frazier.append(NAN)
+					depth.append(NAN)
+					continue
+				# Each tree is read once, for both of its scores.
+				tree = Tree.fromstring(treestring)
+				words = float(cUtil.get_word_score(tree))
+				yngve.append(cUtil.calc_yngve_score(tree, 0) / words if words != 0 else NAN)
+				frazier.append(cUtil.calc_frazier_score(tree, 0, "") / words if words != 0 else NAN)
+				depth.append(Util.get_max_depth([treestring]))
+			data.update({"yngve": yngve, "frazier": frazier, "depth": depth})
+		for (name, node) in [("cdensity", "content_densities"), ("idensity", "idea_densities")]:
+			if name in needs:
+				data[name] = array('d', (value if value is not None else NAN
+										 for value in self.__aligned(doc.feature(node))))
+		return data
+
+	def __len__(self):
+		""" Returns the number of rows. """
+		return len(self.__units)
+
+	def units(self):
+		""" Returns the utterance or sentence of each row. """
+		return list(self.__units)
+
+	def column(self, name):
+		"""
+		Returns the named column.
+		:param name:the name of a column of this table
+		:type name:str
+		:return:an array with the value of each row
+		:rtype:array
+		"""
+		if name not in self.__data:
+			raise ValueError("WARNING: This feature table has no column " + str(name) + ".")
+		return self.__data[name]
+
+	def to_csv(self, out_file, text=False):
+		"""
+		Writes the table to out_file as CSV, with a header of column names. Values that could not be computed are left
+		empty.
+		:param out_file:an open text file
+		:type out_file:file
+		:param text:whether to add a last column holding the text of each unit
+		:type text:bool
+		"""
+		writer = csv.writer(out_file)
+		writer.writerow(self.columns + (["text"] if text else []))
+		columns = [self.__data[name] for name in self.columns] + ([self.__units] if text else [])
+		for row in zip(*columns):
+			writer.writerow(["" if isinstance(value, float) and math.isnan(value) else value for value in row])
+
+	def to_npz(self, path):
+		"""
+		Writes the table to path as a NumPy .npz archive, with one array per column. NumPy is only needed here.
+		:param path:the file to write
+		:type path:filename
+		"""
+		try:
+			import numpy
+		except ImportError:
+			raise ValueError("WARNING: Writing a feature table as .npz requires NumPy; try 'pip3 install numpy'.")
+		numpy.savez(path, **{name: numpy.frombuffer(self.__data[name], dtype=self.__data[name].typecode)
+							 for name in self.columns})
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.sentenizers.Sentenizer import Sentenizer
+from splat.tokenizers.CleanTokenizer import CleanTokenizer
+from splat.tokenizers.RawTokenizer import RawTokenizer
+from splat.Vocabulary import Vocabulary
+import splat.Util as Util
+import splat.complexity as cUtil
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class MovingWindow:
+	"""
+	A MovingWindow computes features over a window of size tokens (or size utterances) that slides through a SPLAT,
+	stride tokens (or utterances) at a time. The counts behind each feature are updated as tokens enter and leave the
+	window, so the whole document is processed in a single pass rather than creating a SPLAT for each window.
+
+	The features are those of the command line: wc, uwc, ttr, cfr, syllables, flesch and kincaid, as well as drate (the
+	ratio of disfluencies to words). The densities, cdensity and idensity, need a parse tree for each utterance, so
+	they are only available for windows of utterances; they are the mean density of the utterances in the window that
+	have one.
+	"""
+	features = ["wc", "uwc", "ttr", "cfr", "drate", "syllables", "flesch", "kincaid", "cdensity", "idensity"]
+
+	def __init__(self, doc, size, stride=1, unit="tokens"):
+		"""
+		Creates a MovingWindow object.
+		:param doc:the SPLAT to slide through
+		:type doc:SPLAT
+		:param size:the number of tokens or utterances in each window
+		:type size:int
+		:param stride:the number of tokens or utterances that each window starts after the one before it
+		:type stride:int
+		:param unit:either "tokens" or "utterances"
+		:type unit:str
+		"""
+		if unit not in ["tokens", "utterances"]:
+			raise ValueError("WARNING: A moving window is made of \"tokens\" or \"utterances\", not " + str(unit) + ".")
+		if size < 1 or stride < 1:
+			raise ValueError("WARNING: The size and stride of a moving window must be positive.")
+		self.__doc = doc
+		self.size = size
+		self.stride = stride
+		self.unit = unit
+
+	def __units(self):
+		"""
+		Returns the vocabulary, the ID and raw string of every token, and the index of the first token of each unit
+		(followed by the number of tokens).
+		"""
+		if self.unit == "tokens":
+			vocab = self.__doc.feature("vocab")
+			ids = self.__doc.feature("token_ids")
+			raw = self.__doc.rawtokens()
+			return vocab, ids, raw, list(range(len(ids) + 1))
+
+		# Each utterance is tokenized on its own, so that no token spans two utterances.
+		vocab, ids, raw, bounds = Vocabulary(), [], [], [0]
+		for utt in self.__doc.utts():
+			tokens = RawTokenizer().tokenize(utt)
+			raw.extend(tokens)
+			ids.extend(vocab.encode(map(CleanTokenizer.normalize, tokens)))
+			bounds.append(len(ids))
+		return vocab, ids, raw, bounds
+
+	def __densities(self, name):
+		""" Returns the content or idea density of each utterance, with None for an utterance without tagged words. """
+		densities = self.__doc.feature(name)
+		utts = self.__doc.utts()
+		if len(densities) == len(utts):
+			return densities
+		# The parser leaves out empty utterances, which are given no density.
+		densities, aligned = iter(densities), []
+		for utt in utts:
+			aligned.append(next(densities, None) if utt != "" else None)
+		return aligned
+
+	def windows(self, count):
+		"""
+		Returns the (start, end) of each window over count units, where end is exclusive. A document shorter than a
+		single window has a single window holding all of it.
+		:param count:the number of tokens or utterances in the document
+		:type count:int
+		:return:a list of (start, end) pairs
+		:rtype:list
+		"""
+		if count <= self.size:
+			return [(0, count)]
+		return [(start, start + self.size) for start in range(0, count - self.size + 1, self.stride)]
+
+	def rows(self, features):
+		"""
+		Yields one row per window: a dictionary mapping "start" and "end" to the first unit of the window and the unit
+		after its last, and each feature name to its value over the window.
+		:param features:a list of feature names (see MovingWindow.features)
+		:type features:list
+		:return:a generator of dictionaries
+		:rtype:generator
+		"""
+		for name in features:
+			if name not in MovingWindow.features:
+				raise ValueError("WARNING: Unknown moving window feature: " + str(name) + ".")
+			if name in ["cdensity", "idensity"] and self.unit != "utterances":
+				raise ValueError("WARNING: " + name + " is only available for windows of utterances.")
+
+		(vocab, ids, raw, bounds) = self.__units()
+		needs = set(features)
+		flags = Util.get_function_word_flags(vocab.words()) if "cfr" in needs else None
+		disfluent = None
+		if "drate" in needs:
+			# A disfluency is classified as in Util.disfluency_matrix(), which starts again with each utterance.
+			disfluent, last_word = [False] * len(ids), ""
+			starts = set(bounds) if self.unit == "utterances" else set()
+			for (i, word) in enumerate(raw):
+				if i in starts:
+					last_word = ""
+				index = Util.classify_disfluency(word, last_word)
+				disfluent[i] = index != -1
+				last_word = word
+		syllables, ends = None, None
+		if needs & {"syllables", "flesch", "kincaid"}:
+			type_syllables = {}
+			syllables = []
+			for i in ids:
+				if i not in type_syllables:
+					type_syllables[i] = cUtil.word_syllables(vocab.word(i))
+				syllables.append(type_syllables[i])
+		if needs & {"flesch", "kincaid"}:
+			ends = [any(punct in word for punct in Sentenizer.punctlist) for word in raw]
+		densities = {name: self.__densities(node) for (name, node) in [("cdensity", "content_densities"),
+																		  ("idensity", "idea_densities")]
+					 if name in needs}
+
+		# The window holds the tokens [lo, hi) and the units [unit_lo, unit_hi), with their counts.
+		counts = [0] * len(vocab)
+		state = {"types": 0, "function": 0, "disfluent": 0, "syllables": 0, "ends": 0}
+		density_sums = {name: [0.0, 0] for name in densities}
+		lo = hi = unit_lo = unit_hi = 0
+
+		def add(i):
+			counts[ids[i]] += 1
+			if counts[ids[i]] == 1:
+				state["types"] += 1
+			if flags is not None and flags[ids[i]]:
+				state["function"] += 1
+			if disfluent is not None and disfluent[i]:
+				state["disfluent"] += 1
+			if syllables is not None:
+				state["syllables"] += syllables[i]
+			if ends is not None and ends[i]:
+				state["ends"] += 1
+
+		def remove(i):
+			counts[ids[i]] -= 1
+			if counts[ids[i]] == 0:
+				state["types"] -= 1
+			if flags is not None and flags[ids[i]]:
+				state["function"] -= 1
+			if disfluent is not None and disfluent[i]:
+				state["disfluent"] -= 1
+			if syllables is not None:
+				state["syllables"] -= syllables[i]
+			if ends is not None and ends[i]:
+				state["ends"] -= 1
+
+		def slide_units(first, last, sign):
+			for (name, values) in densities.items():
+				for value in values[first:last]:
+					if value is not None:
+						density_sums[name][0] += sign * value
+						density_sums[name][1] += sign
+
+		for (start, end) in self.windows(len(bounds) - 1):
+			if start >= unit_hi:
+				# The new window does not overlap the old one, so the tokens in between are skipped.
+				for i in range(lo, hi):
+					remove(i)
+				slide_units(unit_lo, unit_hi, -1)
+				lo = hi = bounds[start]
+				unit_lo = unit_hi = start
+			for i in range(hi, bounds[end]):
+				add(i)
+			slide_units(unit_hi, end, 1)
+			for i in range(lo, bounds[start]):
+				remove(i)
+			slide_units(unit_lo, start, -1)
+			(lo, hi, unit_lo, unit_hi) = (bounds[start], bounds[end], start, end)
+
+			wordcount = hi - lo
+			sentcount = max(state["ends"], 1)
+			row = {"start": start, "end": end}
+			for name in features:
+				if name == "wc":
+					row[name] = wordcount
+				elif name == "uwc":
+					row[name] = state["types"]
+				elif name == "ttr":
+					row[name] = round(float(state["types"]) / float(wordcount), 4) if wordcount != 0 else 0.0
+				elif name == "cfr":
+					row[name] = Util.get_content_function_ratio(wordcount - state["function"], state["function"])
+				elif name == "drate":
+					row[name] = round(float(state["disfluent"]) / float(wordcount), 4) if wordcount != 0 else 0.0
+				elif name == "syllables":
+					row[name] = state["syllables"]
+				elif name == "flesch":
+					row[name] = cUtil.calc_flesch_readability(wordcount, sentcount, state["syllables"]) \
+						if wordcount != 0 else 0.0
+				elif name == "kincaid":
+					row[name] = cUtil.calc_flesch_kincaid(wordcount, sentcount, state["syllables"]) \
+						if wordcount != 0 else 0.0
+				else:
+					(total, count) = density_sums[name]
+					row[name] = float(total / count) if count != 0 else 0.0
+			yield row
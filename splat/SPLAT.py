@@ -2,16 +2,26 @@
 
 ##### PYTHON IMPORTS ###################################################################################################
 import os.path, sys, json
+from array import array
+from collections import Counter, OrderedDict
 
 ##### SPLAT IMPORTS ####################################################################################################
+from splat.FeatureTable import FeatureTable
 from splat.gramminators.FullNGramminator import FullNGramminator
+from splat.MovingWindow import MovingWindow
 from splat.parsers.TreeStringParser import TreeStringParser
 from splat.sentenizers.CleanSentenizer import CleanSentenizer
+from splat.sentenizers.Sentenizer import Sentenizer
 from splat.taggers.NLTKPOSTagger import NLTKPOSTagger
 from splat.tokenizers.RawTokenizer import RawTokenizer
 from splat.tokenizers.CleanTokenizer import CleanTokenizer
+from splat.Vocabulary import Vocabulary
+from splat.SplatFile import SplatFile
 import splat.Util as Util
 import splat.complexity as cUtil
+import splat.complexity.char_features as charUtil
+import splat.complexity.readability as rUtil
+import splat.complexity.lexical_diversity as ldUtil
 
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
@@ -29,75 +39,252 @@ class SPLAT:
     A SPLAT is a selection of text. It can be a single word, a paragraph, or even a whole novel!
     The SPLAT object makes it super simple to extract features from a selection of text.
     """
-    # Basic Feature Variables
-    __wordcount, __unique_wordcount, __sentcount, __uttcount = (0,) * 4
-    __rawtokens, __tokens, __rawtypes, __types, __sentences, __utterances = ([],) * 6
-    __shortest_words, __longest_words = (None,) * 2
-    __alu, __ttr, __als = (0.0,) * 3
-
-    # Syntactic Complexity Variables
-    __yngve_score, __frazier_score, __string_yngve, __string_frazier, __cdensity, __min_cdensity, __max_cdensity,\
-    __idensity, __min_idensity, __max_idensity = (None,) * 10
-    __flesch, __kincaid, __syllables, __asps, __aspu = (None,) * 5
-
-    # Parsing Variables
-    __treestrings, __maxdepth = (None,) * 2
-
-    # Part-Of-Speech Variables
-    __poscounts, __pos, __cwords, __fwords, __cfr, __u_cwords, __u_fwords = (None,) * 7
-
-    # Language Modeling Variables
-    __unigrams, __bigrams, __trigrams = (None,) * 3
-
-    # Discourse Based Variables
-    __adpu, __adps = (None,) * 2
-    __splat = ""
-    __dpu, __dps, __disfluencies = ({},) * 3
-
-    # Frequency Distribution Variables
-    __freq_dist = None
+    # Feature Graph: each feature maps to a tuple (prerequisites, function). A feature is computed the first time it is
+    # needed, by calling its function with the values of its prerequisites, and is then memoized in self.__cache.
+    # Features without a function are inputs, which are set when the SPLAT is created.
+    __graph = {
+        # Basic Features
+        "text": ((), None),
+        "utterances": ((), None),
+        "vocab": ((), Vocabulary),
+        "sentences": (("text", "utterances"), lambda text, utts: CleanSentenizer().sentenize(text) or utts),
+        "rawtoken_ids": (("vocab", "text"), lambda vocab, text: vocab.encode(RawTokenizer().tokenize(text))),
+        "token_ids": (("vocab", "text"), lambda vocab, text: vocab.encode(CleanTokenizer().tokenize(text))),
+        "rawtypes": (("vocab", "rawtoken_ids"), lambda vocab, ids: vocab.typify(ids)),
+        "types": (("vocab", "token_ids"), lambda vocab, ids: vocab.typify(ids)),
+        "wordcount": (("rawtoken_ids",), len),
+        "unique_wordcount": (("types",), len),
+        "uttcount": (("utterances",), len),
+        "sentcount": (("sentences",), len),
+        "ttr": (("types", "token_ids"), Util.type_token_ratio),
+        "mattr": (("vocab", "token_ids"), lambda vocab, ids: ldUtil.calc_mattr(ids, vocab_size=len(vocab))),
+        "mtld": (("vocab", "token_ids"), lambda vocab, ids: ldUtil.calc_mtld(ids, vocab_size=len(vocab))),
+        "hdd": (("types",), ldUtil.calc_hdd),
+        "yules_k": (("types",), ldUtil.calc_yules_k),
+        "honore": (("types",), ldUtil.calc_honore),
+        "alu": (("wordcount", "uttcount"),
+                lambda words, utts: round(float(words) / float(utts), 4) if utts != 0 else 0.0),
+        "als": (("wordcount", "sentcount"),
+                lambda words, sents: round(float(words) / float(sents), 4) if sents != 0 else 0.0),
+        "char_features": (("types",), charUtil.calc_char_features),
+
+        # Syllable Features
+        "syllables": (("types",), cUtil.num_type_syllables),
+        "asps": (("syllables", "sentcount"), lambda syllables, sents: float(syllables / sents)),
+        "aspu": (("syllables", "uttcount"), lambda syllables, utts: float(syllables / utts)),
+        "flesch": (("wordcount", "sentcount", "syllables"), cUtil.calc_flesch_readability),
+        "kincaid": (("wordcount", "sentcount", "syllables"), cUtil.calc_flesch_kincaid),
+        "readability_counts": (("types", "wordcount", "sentcount"), rUtil.count_readability),
+        "readability": (("readability_counts",), rUtil.calc_readability),
+        "difficult_words": (("types",), rUtil.count_difficult_words),
+        "dale_chall": (("readability_counts", "difficult_words"),
+                       lambda counts, difficult:
+                       rUtil.calc_readability(dict(counts, difficult_words=difficult))["dale_chall"]),
+
+        # Parsing and Syntactic Complexity Features
+        "treestrings": (("utterances",), lambda utts: TreeStringParser().get_parse_trees(utts)),
+        "maxdepth": (("treestrings",), Util.get_max_depth),
+        "content_densities": (("treestrings",), cUtil.calc_content_densities),
+        "idea_densities": (("treestrings",), cUtil.idea_density.calc_ideas),
+        "speech_idea_densities": (("treestrings",), lambda trees: cUtil.idea_density.calc_ideas(trees, True)),
+        "content_density": (("content_densities",), cUtil.summarize_densities),
+        "idea_density": (("idea_densities",), cUtil.summarize_densities),
+        "speech_idea_density": (("speech_idea_densities",), cUtil.summarize_densities),
+        "yngve": (("treestrings",), lambda trees: cUtil.get_mean_yngve(list(trees))),
+        "string_yngve": (("treestrings",), lambda trees: cUtil.get_total_mean_yngve(list(trees))),
+        "frazier": (("treestrings",), lambda trees: cUtil.get_frazier_score(list(trees))),
+
+        # Part-Of-Speech Features
+        "pos": (("text",), lambda text: NLTKPOSTagger().tag(text)),
+        "pos_counts": (("pos",), Util.get_pos_counts),
+        "function_flags": (("vocab", "token_ids"), lambda vocab, ids: Util.get_function_word_flags(vocab.words())),
+        "content_words": (("vocab", "token_ids", "function_flags"),
+                          lambda vocab, ids, flags: vocab.decode(i for i in ids if not flags[i])),
+        "function_words": (("vocab", "token_ids", "function_flags"),
+                           lambda vocab, ids, flags: vocab.decode(i for i in ids if flags[i])),
+        "cfr": (("content_words", "function_words"), Util.get_content_function_ratio),
+        "unique_content_words": (("types",), Util.get_unique_content_words),
+        "unique_function_words": (("types",), Util.get_unique_function_words),
+
+        # Language Modeling Features
+        "unigrams": (("text",), lambda text: FullNGramminator().unigrams(text)),
+        "bigrams": (("text",), lambda text: FullNGramminator().bigrams(text)),
+        "trigrams": (("text",), lambda text: FullNGramminator().trigrams(text)),
+        "freq_dist": (("vocab", "token_ids"), lambda vocab, ids: Util.get_freq_dist(vocab.view(ids))),
+
+        # Discourse Based Features
+        "utt_disfluencies": (("utterances",), Util.disfluency_matrix),
+        "sent_disfluencies": (("sentences",), Util.disfluency_matrix),
+        "dpu": (("utterances", "utt_disfluencies"), lambda utts, matrix: list(zip(utts, Util.disfluency_rows(matrix)))),
+        "adpu": (("utt_disfluencies",), Util.average_disfluencies),
+        "dps": (("sentences", "sent_disfluencies"),
+                lambda sents, matrix: list(zip(sents, Util.disfluency_rows(matrix)))),
+        "adps": (("sent_disfluencies",), Util.average_disfluencies),
+        "disfluencies": (("utt_disfluencies",), Util.total_disfluencies),
+        "repetitions": (("utterances",),
+                        lambda utts: [(i, start, end, kind) for (i, utt) in enumerate(utts)
+                                      for (start, end, kind) in Util.find_repetitions(utt.split(" "))]),
+        "dialog_acts": (("utterances",), Util.count_dialog_acts),
+    }
+    __cache = None
+    __streaming = False
+    # Whether the SPLAT was read from a file, whose lines are joined with spaces rather than newlines (see extend()).
+    __from_file = False
+    # The binary cache (see load_cache()) that features are read from before they are computed, if any.
+    __sections = None
 
     def __init__(self, text):
         """
         Creates a SPLAT Object.
+        No features are computed until they are asked for.
         """
         if os.path.exists(text):
-            temp_text = ""
             temp_utts = []
-            for line in open(text, 'r'):
-                temp_utts.append(line.strip())
-                temp_text += line.strip() + " "
-            self.__splat = temp_text
-            self.__utterances = temp_utts
+            with open(text, 'r') as f:
+                for line in f:
+                    temp_utts.append(line.strip())
+            temp_text = "".join(utt + " " for utt in temp_utts)
+            self.__from_file = True
         elif type(text) == str:
-            self.__splat = text
+            temp_text = text
             temp_utts = []
             for line in text.split("\n"):
                 temp_utts.append(line.strip())
-            self.__utterances = temp_utts
         else:
             raise ValueError("WARNING: SPLAT must be of type str or file.")
 
-        self.__uttcount = len(self.__utterances)
-        self.__sentences = CleanSentenizer().sentenize(self.__splat)
-        if self.__sentences == []: self.__sentences = self.__utterances
-        self.__sentcount = len(self.__sentences)
-        self.__rawtokens = RawTokenizer().tokenize(self.__splat)
-        self.__tokens = CleanTokenizer().tokenize(self.__splat)
-        self.__rawtypes = Util.typify(self.__rawtokens)
-        self.__types = Util.typify(self.__tokens)
-        self.__wordcount = Util.wordcount(self.__rawtokens)
-        self.__unique_wordcount = Util.wordcount(self.__types)
-        self.__ttr = Util.type_token_ratio(self.__types, self.__tokens)
-        self.__alu = round(float(self.__wordcount) / float(self.__uttcount), 4) if self.__uttcount != 0 else 0.0
-        self.__als = round(float(self.__wordcount) / float(self.__sentcount), 4) if self.__sentcount != 0 else 0.0
-        temp_dpu = Util.count_disfluencies(self.__utterances)
-        self.__dpu = temp_dpu[0]
-        self.__adpu = temp_dpu[1]
-        temp_dps = Util.count_disfluencies(self.__sentences)
-        self.__dps = temp_dps[0]
-        self.__adps = temp_dps[1]
-        self.__disfluencies = Util.total_disfluencies(self.__dpu)
+        self.__cache = {"text": temp_text, "utterances": temp_utts}
+
+    @classmethod
+    def from_file(cls, path, streaming=False, chunk_size=1048576):
+        """
+        Creates a SPLAT from the given file.
+        With streaming=True the file is read chunk_size characters at a time, and counts, types, disfluencies, n-gram
+        counts (up to trigrams) and dialog act counts are updated line by line, so the full text is never held in
+        memory. Features that need the full text (tokens, sentences, parse trees, part-of-speech tags) are not available
+        on a streaming SPLAT.
+        :param path: the file to read
+        :param streaming: whether to build the SPLAT incrementally
+        :param chunk_size: the number of characters to read at a time when streaming
+        """
+        if not os.path.exists(path):
+            raise ValueError("WARNING: SPLAT file " + str(path) + " does not exist.")
+        if not streaming:
+            return cls(path)
+
+        new_splat = cls.__new__(cls)
+        new_splat.__stream(path, chunk_size)
+        return new_splat
+
+    def __stream(self, path, chunk_size):
+        """ Builds the features of this SPLAT one line at a time from the given file. """
+        vocab = Vocabulary()
+        raw_counts, counts = Counter(), Counter()
+        ngram_counts, history = [Counter(), Counter(), Counter()], []
+        gramminator = FullNGramminator()
+        width = len(Util.disfluency_categories)
+        utt_totals, sent_totals, sent_row = [0] * width, [0] * 8, [0] * 9
+        uttcount, sentcount, sent_last_word = 0, 0, ""
+        dialog_acts = OrderedDict()
+
+        for line in Util.read_lines(path, chunk_size):
+            utt = line.strip()
+            uttcount += 1
+            raw = RawTokenizer.word_pattern.findall(utt)
+            raw_counts.update(vocab.encode(raw))
+            counts.update(vocab.encode(map(CleanTokenizer.normalize, raw)))
+
+            # N-grams may span lines, so the last two words of the previous line are carried over.
+            words = history + gramminator.words(utt)
+            for n in range(1, 4):
+                ngram_counts[n - 1].update(" ".join(words[i:i + n]) for i in range(max(len(history) - n + 1, 0),
+                                                                                  len(words) - n + 1))
+            history = words[-2:]
+
+            # Sentences may also span lines, so the counts for the current sentence are carried over.
+            utt_row, last_word = [0] * width, ""
+            for word in utt.split(" "):
+                utt_row[8] += 1
+                sent_row[8] += 1
+                index = Util.classify_disfluency(word, last_word)
+                if index != -1:
+                    utt_row[index] += 1
+                index = Util.classify_disfluency(word, sent_last_word)
+                if index != -1:
+                    sent_row[index] += 1
+                (last_word, sent_last_word) = (word, word)
+                if any(punct in word for punct in Sentenizer.punctlist):
+                    sentcount += 1
+                    sent_totals = [a + b for (a, b) in zip(sent_totals, sent_row)]
+                    sent_row, sent_last_word = [0] * 9, ""
+            for (start, end, kind) in Util.find_repetitions(utt.split(" ")):
+                utt_row[10 if kind == "restart" else 9] += 1
+            utt_totals = [a + b for (a, b) in zip(utt_totals, utt_row)]
+            Util.count_dialog_act(dialog_acts, utt)
+
+        # Everything that would otherwise be computed from the text is stored directly in the cache.
+        self.__streaming = True
+        flags = Util.get_function_word_flags(vocab.words())
+        function = sum(c for (i, c) in counts.items() if flags[i])
+        tokencount = sum(counts.values())
+        adpu = float(sum(utt_totals[:8]) / uttcount) if uttcount != 0 else 0.0
+        adps = float(sum(sent_totals) / sentcount) if sentcount != 0 else adpu
+        sentcount = sentcount if sentcount != 0 else uttcount
+        wordcount = sum(raw_counts.values())
+        types = vocab.types(counts)
+        self.__cache = {
+            "vocab": vocab, "rawtoken_counts": dict(raw_counts), "token_counts": dict(counts),
+            "ngram_counts": [dict(c) for c in ngram_counts], "rawtypes": vocab.types(raw_counts), "types": types,
+            "uttcount": uttcount, "sentcount": sentcount, "wordcount": wordcount, "unique_wordcount": len(types),
+            "ttr": round(float(len(types)) / float(tokencount), 4) if tokencount != 0 else 0.0,
+            "alu": round(float(wordcount) / float(uttcount), 4) if uttcount != 0 else 0.0,
+            "als": round(float(wordcount) / float(sentcount), 4) if sentcount != 0 else 0.0,
+            "cfr": Util.get_content_function_ratio(tokencount - function, function),
+            "freq_dist": Util.get_freq_dist({vocab.word(i): c for (i, c) in counts.items()}),
+            "adpu": adpu, "adps": adps, "disfluencies": Util.total_disfluencies([utt_totals]),
+            "dialog_acts": dialog_acts,
+        }
+
+    @classmethod
+    def feature_graph(cls):
+        """
+        Returns a dictionary mapping the name of each feature in the graph to the names of its prerequisites. Inputs,
+        which are set when a SPLAT is created rather than computed, map to None.
+        """
+        return {name: (prerequisites if function is not None else None)
+                for (name, (prerequisites, function)) in cls.__graph.items()}
+
+    def feature(self, name):
+        """
+        Returns the value of the named feature in the feature graph, computing it and its prerequisites if needed.
+        :param name: the name of a feature, as given by feature_graph()
+        """
+        if name not in SPLAT.__graph:
+            raise ValueError("WARNING: Unknown feature: " + str(name) + ".")
+        return self.__feature(name)
+
+    def __feature(self, name):
+        """
+        Returns the value of the named feature, computing it (and, first, any of its prerequisites that are missing) if
+        it has not been computed before.
+        """
+        try:
+            return self.__cache[name]
+        except KeyError:
+            if self.__sections is not None and name in self.__sections:
+                try:
+                    value = self.__sections.read(name)
+                    self.__cache[name] = value
+                    return value
+                except (OSError, ValueError):
+                    # The cache was removed or replaced since it was opened, so the feature is computed instead.
+                    self.__sections = None
+            prerequisites, function = SPLAT.__graph[name]
+            if function is None:
+                raise ValueError("WARNING: This SPLAT was built by streaming, so its " + name + " is not available.")
+            value = function(*[self.__feature(prerequisite) for prerequisite in prerequisites])
+            self.__cache[name] = value
+            return value
 
     ##### SYNTACTIC COMPLEXITY #########################################################################################
 
@@ -106,80 +293,74 @@ class SPLAT:
         Returns the Mean Content Density.
         Content Density is the ratio of open class words to closed class words.
         """
-        if self.__cdensity is None:
-            if self.__treestrings is None:
-                self.__treestrings = self.treestrings()
-            self.__cdensity, self.__min_cdensity, self.__max_cdensity = cUtil.calc_content_density(self.treestrings())
-        return self.__cdensity
+        return self.__feature("content_density")[0]
 
     def min_content_density(self):
         """
         Returns the Min Content Density.
         Content Density is the ratio of open class words to closed class words.
         """
-        if self.__min_cdensity is None:
-            if self.__treestrings is None:
-                self.__treestrings = self.treestrings()
-            self.__cdensity, self.__min_cdensity, self.__max_cdensity = cUtil.calc_content_density(self.treestrings())
-        return self.__min_cdensity
+        return self.__feature("content_density")[1]
 
     def max_content_density(self):
         """
         Returns the Max Content Density.
         Content Density is the ratio of open class words to closed class words.
         """
-        if self.__max_cdensity is None:
-            if self.__treestrings is None:
-                self.__treestrings = self.treestrings()
-            self.__cdensity, self.__min_cdensity, self.__max_cdensity = cUtil.calc_content_density(self.treestrings())
-        return self.__max_cdensity
+        return self.__feature("content_density")[2]
 
-    def idea_density(self):
+    def idea_density(self, speech_mode=False):
         """
         Returns the Idea Density.
         Idea Density is the ratio of propositions to total word count.
+        :param speech_mode: whether to count ideas as in transcribed speech, which ignores repetitions and fillers
         """
-        if self.__idensity is None:
-            if self.__treestrings is None:
-                self.__treestrings = self.treestrings()
-            self.__idensity, self.__min_idensity, self.__max_idensity = cUtil.calc_idea_density(self.treestrings())
-        return self.__idensity
+        return self.__feature("speech_idea_density" if speech_mode else "idea_density")[0]
 
-    def min_idea_density(self):
+    def min_idea_density(self, speech_mode=False):
         """
         Returns the Min Idea Density.
         Idea Density is the ratio of propositions to total word count.
+        :param speech_mode: whether to count ideas as in transcribed speech, which ignores repetitions and fillers
         """
-        if self.__min_idensity is None:
-            if self.__treestrings is None:
-                self.__treestrings = self.treestrings()
-            self.__idensity, self.__min_idensity, self.__max_idensity = cUtil.calc_idea_density(self.treestrings())
-        return self.__min_idensity
+        return self.__feature("speech_idea_density" if speech_mode else "idea_density")[1]
 
-    def max_idea_density(self):
+    def max_idea_density(self, speech_mode=False):
         """
         Returns the Max Idea Density.
         Idea Density is the ratio of propositions to total word count.
+        :param speech_mode: whether to count ideas as in transcribed speech, which ignores repetitions and fillers
+        """
+        return self.__feature("speech_idea_density" if speech_mode else "idea_density")[2]
+
+    def speech_idea_density(self):
+        """ Returns the Idea Density, counting ideas as in transcribed speech. """
+        return self.idea_density(speech_mode=True)
+
+    def densities(self, processes=None, speech_mode=False):
         """
-        if self.__max_idensity is None:
-            if self.__treestrings is None:
-                self.__treestrings = self.treestrings()
-            self.__idensity, self.__min_idensity, self.__max_idensity = cUtil.calc_idea_density(self.treestrings())
-        return self.__max_idensity
+        Returns the content and idea density of each utterance, along with their (mean, min, max), as a dictionary; see
+        cUtil.calc_densities(). Densities that have not been computed yet are computed across a pool of processes.
+        :param processes: the number of processes (by default, the number of CPUs)
+        :param speech_mode: whether to count ideas as in transcribed speech
+        """
+        idea = "speech_idea_densities" if speech_mode else "idea_densities"
+        if any(name not in self.__cache and (self.__sections is None or name not in self.__sections)
+               for name in ("content_densities", idea)):
+            results = cUtil.calc_densities(self.__feature("treestrings"), processes, speech_mode=speech_mode)
+            self.__cache.setdefault("content_densities", results["content_densities"])
+            self.__cache.setdefault(idea, results["idea_densities"])
+
+        return {"content_densities": self.__feature("content_densities"), "idea_densities": self.__feature(idea),
+                "content_density": self.__feature("content_density"),
+                "idea_density": self.__feature("speech_idea_density" if speech_mode else "idea_density")}
 
     def tree_based_yngve_score(self):
         """
         Returns the mean Yngve Score.
         Yngve score is... http://www.m-mitchell.com/papers/RoarkEtAl-07-SynplexityforMCI.pdf
         """
-        if self.__yngve_score is None:
-            trees = []
-            for treestring in self.treestrings():
-                trees.append(treestring)
-            self.__yngve_score = cUtil.get_mean_yngve(trees)
-            return self.__yngve_score
-        else:
-            return self.__yngve_score
+        return self.__feature("yngve")
 
     def string_based_yngve_score(self):
         """
@@ -187,28 +368,14 @@ class SPLAT:
         Yngve score is... http://www.m-mitchell.com/papers/RoarkEtAl-07-SynplexityforMCI.pdf
         """
         print("WARNING: String-Based Yngve Score calculation is under review. Results may be inaccurate.")
-        if self.__string_yngve is None:
-            trees = []
-            for treestring in self.treestrings():
-                trees.append(treestring)
-            self.__string_yngve = cUtil.get_total_mean_yngve(trees)
-            return self.__string_yngve
-        else:
-            return self.__string_yngve
+        return self.__feature("string_yngve")
 
     def tree_based_frazier_score(self):
         """
         Returns the Frazier Score.
         Frazier score is... http://www.m-mitchell.com/papers/RoarkEtAl-07-SynplexityforMCI.pdf
         """
-        if self.__frazier_score is None:
-            trees = []
-            for treestring in self.treestrings():
-                trees.append(treestring)
-            self.__frazier_score = cUtil.get_frazier_score(trees)
-            return self.__frazier_score
-        else:
-            return self.__frazier_score
+        return self.__feature("frazier")
 
     def string_based_frazier_score(self):
         """
@@ -222,145 +389,246 @@ class SPLAT:
 
     def syllables(self):
         """ Returns the number of syllables in the SPLAT. """
-        if self.__syllables is None:
-            self.__syllables = cUtil.num_syllables(self.__tokens)
-        return self.__syllables
+        return self.__feature("syllables")
 
     def average_sps(self):
         """ Returns the average number of syllables per sentence. """
-        if self.__asps is None:
-            self.__asps = float(self.syllables() / self.__sentcount)
-        return self.__asps
+        return self.__feature("asps")
 
     def average_spu(self):
         """ Returns the average number of syllables per utterance. """
-        if self.__aspu is None:
-            self.__aspu = float(self.syllables() / self.__uttcount)
-        return self.__aspu
+        return self.__feature("aspu")
 
     def flesch_readability(self):
         """ Returns the flesch readability score. """
-        if self.__flesch is None:
-            self.__flesch = cUtil.calc_flesch_readability(self.__wordcount, self.__sentcount, self.syllables())
-            return self.__flesch
-        else:
-            return self.__flesch
+        return self.__feature("flesch")
 
     def kincaid_grade_level(self):
         """ Returns the flesch-kincaid grade level score. """
-        if self.__kincaid is None:
-            self.__kincaid = cUtil.calc_flesch_kincaid(self.__wordcount, self.__sentcount, self.syllables())
-            return self.__kincaid
-        else:
-            return self.__kincaid
+        return self.__feature("kincaid")
+
+    ##### READABILITY ##################################################################################################
+
+    def readability(self):
+        """
+        Returns a dictionary mapping the name of each readability score to its value (see
+        splat/complexity/readability.py). All of the scores are computed from the same counts, which are collected in a
+        single pass over the types. The Dale-Chall score is left out, because it needs the Brown Corpus; see
+        dale_chall().
+        """
+        return self.__feature("readability")
+
+    def gunning_fog(self):
+        """ Returns the Gunning Fog Index. """
+        return self.readability()["fog"]
+
+    def smog(self):
+        """ Returns the SMOG Grade. """
+        return self.readability()["smog"]
+
+    def coleman_liau(self):
+        """ Returns the Coleman-Liau Index. """
+        return self.readability()["coleman_liau"]
+
+    def automated_readability_index(self):
+        """ Returns the Automated Readability Index. """
+        return self.readability()["ari"]
+
+    def dale_chall(self):
+        """
+        Returns an approximation of the Dale-Chall Readability Score. SPLAT does not ship the Dale-Chall list of
+        familiar words, so the 3000 most frequent words of the Brown Corpus stand in for it, and the corpus is read the
+        first time this is called.
+        """
+        return self.__feature("dale_chall")
+
+    def lix(self):
+        """ Returns the LIX Score. """
+        return self.readability()["lix"]
 
     ##### BASICS #######################################################################################################
 
     def sents(self):
         """ Returns a list of all sentences contained within the SPLAT. """
-        return self.__sentences
+        return self.__feature("sentences")
 
     def utts(self):
         """ Returns a list of all utterances contained within the SPLAT. """
-        return self.__utterances
+        return self.__feature("utterances")
 
     def rawtokens(self):
         """ Returns a list of unnormalized tokens. """
-        return self.__rawtokens
+        return self.__feature("vocab").decode(self.__feature("rawtoken_ids"))
 
     def tokens(self):
         """ Returns a list of normalized tokens. """
-        return self.__tokens
+        return self.__feature("vocab").decode(self.__feature("token_ids"))
 
     def rawtypes(self):
         """ Returns a list of unnormalized types. """
-        return self.__rawtypes
+        return self.__feature("rawtypes")
 
     def types(self):
         """ Returns a list of normalized types. """
-        return self.__types
+        return self.__feature("types")
+
+    def token_spans(self):
+        """ Returns the (start, end) offsets of each normalized token within the text of the SPLAT. """
+        return CleanTokenizer().spans(self.__feature("text"))
+
+    def sent_spans(self):
+        """ Returns the (start, end) offsets of each sentence within the text of the SPLAT. """
+        return CleanSentenizer().spans(self.__feature("text"))
 
     def wordcount(self):
         """ Returns the total word (token) count. """
-        return self.__wordcount
+        return self.__feature("wordcount")
 
     def unique_wordcount(self):
         """ Returns the unique word (type) count. """
-        return self.__unique_wordcount
+        return self.__feature("unique_wordcount")
 
     def sentcount(self):
         """ Returns the total sentence count. """
-        return self.__sentcount
+        return self.__feature("sentcount")
 
     def uttcount(self):
         """ Returns the total utterance count. """
-        return self.__uttcount
+        return self.__feature("uttcount")
 
     def type_token_ratio(self):
         """ Returns the ratio of types to tokens. """
-        return self.__ttr
+        return self.__feature("ttr")
+
+    def mattr(self, window=ldUtil.mattr_window):
+        """
+        Returns the Moving-Average Type-Token Ratio: the mean type-token ratio of every window of tokens.
+        :param window: the number of tokens in each window
+        """
+        if window == ldUtil.mattr_window:
+            return self.__feature("mattr")
+        return ldUtil.calc_mattr(self.__feature("token_ids"), window, len(self.__feature("vocab")))
+
+    def mtld(self, threshold=ldUtil.mtld_threshold):
+        """
+        Returns the Measure of Textual Lexical Diversity: the mean number of tokens it takes for the type-token ratio
+        to fall to the threshold.
+        :param threshold: the type-token ratio at which a factor ends
+        """
+        if threshold == ldUtil.mtld_threshold:
+            return self.__feature("mtld")
+        return ldUtil.calc_mtld(self.__feature("token_ids"), threshold, len(self.__feature("vocab")))
+
+    def hdd(self, sample=ldUtil.hdd_sample):
+        """
+        Returns HD-D, the expected type-token ratio of a random sample of tokens.
+        :param sample: the number of tokens in the sample
+        """
+        if sample == ldUtil.hdd_sample:
+            return self.__feature("hdd")
+        return ldUtil.calc_hdd(self.__feature("types"), sample)
+
+    def yules_k(self):
+        """ Returns Yule's Characteristic K. """
+        return self.__feature("yules_k")
+
+    def honore(self):
+        """ Returns Honore's Statistic. """
+        return self.__feature("honore")
 
     def average_utterance_length(self):
         """ Returns the average utterance length. """
-        return self.__alu
+        return self.__feature("alu")
 
     def average_sentence_length(self):
         """ Returns the average sentence length. """
-        return self.__als
+        return self.__feature("als")
 
     def words_per_utterance(self):
         """ Prints the number of words in each utterance. """
-        for item in self.__utterances:
+        for item in self.__feature("utterances"):
             print(len(item.split(" ")))
         return ''
 
     def words_per_sentence(self):
         """ Prints the number of words in each sentence. """
-        for item in self.__sentences:
+        for item in self.__feature("sentences"):
             print(len(item.split(" ")))
         return ''
 
     def longest_words(self):
         """ Returns the longest words in the text."""
-        if self.__longest_words is None:
-            self.__longest_words = set([word for word in self.__tokens if len(word) == max(len(word) for word in self.__tokens)])
-            return self.__longest_words
-        else:
-            return self.__longest_words
+        return self.char_features()["longest"]
 
     def shortest_words(self):
         """ Returns the shortest words in the text."""
-        if self.__shortest_words is None:
-            self.__shortest_words = set([word for word in self.__tokens if len(word) == min(len(word) for word in self.__tokens)])
-            return self.__shortest_words
-        else:
-            return self.__shortest_words
+        return self.char_features()["shortest"]
+
+    ##### CHARACTER BASED ##############################################################################################
+
+    def char_features(self):
+        """ Returns a dictionary of word-length features, computed in a single pass over the types. """
+        return self.__feature("char_features")
+
+    def word_length_histogram(self):
+        """ Returns a list of tuple pairs: (word length, frequency). """
+        return sorted(self.char_features()["histogram"].items())
+
+    def average_word_length(self):
+        """ Returns the average word length. """
+        return self.char_features()["mean"]
+
+    def word_length_percentile(self, p=50):
+        """
+        Returns the word length at the given percentile.
+        :param p: a number between 0 and 100
+        """
+        return charUtil.get_length_percentile(self.char_features()["histogram"], p)
+
+    def char_ngrams(self, n=3):
+        """
+        Returns a list of tuple pairs: (character n-gram, frequency).
+        :param n: the size of the character n-grams to be generated
+        """
+        return sorted(charUtil.get_char_ngrams(self.__feature("types"), n).items())
+
+    ##### MOVING WINDOWS ###############################################################################################
+
+    def moving_window(self, features, size, stride=1, unit="tokens"):
+        """
+        Returns a list with a dictionary of the given features for each window of size tokens (or utterances), each
+        starting stride tokens (or utterances) after the one before it. See MovingWindow for the available features.
+        :param features: a list of feature names
+        :param size: the number of tokens or utterances in each window
+        :param stride: the number of tokens or utterances between the starts of two windows
+        :param unit: either "tokens" or "utterances"
+        """
+        return list(MovingWindow(self, size, stride, unit).rows(features))
+
+    ##### FEATURE TABLES ###############################################################################################
+
+    def feature_table(self, unit="utterances", columns=None):
+        """
+        Returns a FeatureTable with a row of features for each utterance (or sentence), which can be written out as CSV
+        or as a NumPy .npz archive. See FeatureTable for the available columns.
+        :param unit: either "utterances" or "sentences"
+        :param columns: the names of the columns to compute (by default, every column available for the unit)
+        """
+        return FeatureTable(self, unit, columns)
 
     ##### N-GRAMS ######################################################################################################
 
     def unigrams(self):
         """ Returns a list of unigrams. """
-        if self.__unigrams is None:
-            self.__unigrams = FullNGramminator().unigrams(self.__splat)
-            return self.__unigrams
-        else:
-            return self.__unigrams
+        return self.__feature("unigrams")
 
     def bigrams(self):
         """ Returns a list of bigrams. """
-        if self.__bigrams is None:
-            self.__bigrams = FullNGramminator().bigrams(self.__splat)
-            return self.__bigrams
-        else:
-            return self.__bigrams
+        return self.__feature("bigrams")
 
     def trigrams(self):
         """ Returns a list of trigrams. """
-        if self.__trigrams is None:
-            self.__trigrams = FullNGramminator().trigrams(self.__splat)
-            return self.__trigrams
-        else:
-            return self.__trigrams
+        return self.__feature("trigrams")
 
     def ngrams(self, n):
         """ Returns a list of n-grams.
@@ -373,59 +641,55 @@ class SPLAT:
         elif n == 3:
             return self.trigrams()
         else:
-            return FullNGramminator().ngrams(self.__splat, n)
+            return FullNGramminator().ngrams(self.__feature("text"), n)
+
+    def ngram_counts(self, n):
+        """ Returns a Counter mapping each n-gram to its frequency.
+        :param n: the size of the n-grams to be counted (at most 3 for a streaming SPLAT)
+        """
+        if self.__streaming:
+            ngram_counts = self.__feature("ngram_counts")
+            if not 1 <= n <= len(ngram_counts):
+                raise ValueError("WARNING: Only n-grams up to size " + str(len(ngram_counts)) +
+                                 " are counted for a streaming SPLAT.")
+            return Counter({tuple(k.split(" ")): v for (k, v) in ngram_counts[n - 1].items()})
+        return Counter(self.ngrams(n))
 
     ##### PART-OF-SPEECH BASED #########################################################################################
 
     def pos(self):
         """ Returns a list of tuple pairs: (word, POS taggers). """
-        if self.__pos is None:
-            self.__pos = NLTKPOSTagger().tag(self.__splat)
-        return self.__pos
+        return self.__feature("pos")
 
     def content_function_ratio(self):
         """ Returns the ratio of content words to function words. """
-        if self.__cfr is None:
-            self.__cfr = Util.get_content_function_ratio(self.content_words(), self.function_words())
-        return self.__cfr
+        return self.__feature("cfr")
 
     def content_words(self):
         """ Returns a list of content words. """
-        if self.__cwords is None:
-            self.__cwords = Util.get_content_words(self.__tokens)
-        return self.__cwords
+        return self.__feature("content_words")
 
     def function_words(self):
         """ Returns a list of function words. """
-        if self.__fwords is None:
-            self.__fwords = Util.get_function_words(self.__tokens)
-        return self.__fwords
+        return self.__feature("function_words")
 
     def unique_content_words(self):
         """ Returns a list of unique content words. """
-        if self.__u_cwords is None:
-            self.__u_cwords = Util.get_unique_content_words(self.__types)
-        return self.__u_cwords
+        return self.__feature("unique_content_words")
 
     def unique_function_words(self):
         """ Returns a list of unique function words. """
-        if self.__u_fwords is None:
-            self.__u_fwords = Util.get_unique_function_words(self.__types)
-        return self.__u_fwords
+        return self.__feature("unique_function_words")
 
     def pos_counts(self):
         """ Returns a dictionary with POS tags as keys and their frequencies as values. """
-        if self.__poscounts is None:
-            self.__poscounts = Util.get_pos_counts(self.pos())
-        return self.__poscounts
+        return self.__feature("pos_counts")
 
     ##### PARSING ######################################################################################################
 
     def treestrings(self):
         """ Returns a list of parsers trees. """
-        if self.__treestrings is None:
-            self.__treestrings = TreeStringParser().get_parse_trees(self.__utterances)
-        return self.__treestrings
+        return self.__feature("treestrings")
 
     def drawtrees(self):
         """ Uses matplotlib and nltk to draw syntactic parsers trees. """
@@ -434,9 +698,7 @@ class SPLAT:
 
     def max_depth(self):
         """ Returns the maxdepth of all syntactic parsers trees. """
-        if self.__maxdepth is None:
-            self.__maxdepth = Util.get_max_depth(self.treestrings())
-        return self.__maxdepth
+        return self.__feature("maxdepth")
 
     ##### FREQUENCY DISTRIBUTIONS ######################################################################################
 
@@ -446,14 +708,13 @@ class SPLAT:
         or all words with their frequencies if x is not specified.
         :param x: the number of most frequent words to return
         """
-        if self.__freq_dist is None:
-            self.__freq_dist = Util.get_freq_dist(self.__tokens)
+        freq_dist = self.__feature("freq_dist")
         if x is None:
-            return self.__freq_dist.most_common()
+            return freq_dist.most_common()
         elif x > 0:
-            return self.__freq_dist.most_common(x)
+            return freq_dist.most_common(x)
         else:
-            return self.__freq_dist.most_common()
+            return freq_dist.most_common()
 
     def get_least_freq(self, x=None):
         """
@@ -461,10 +722,7 @@ class SPLAT:
         or all words with their frequencies if x is not specified.
         :param x: the number of least frequent words to return
         """
-        if self.__freq_dist is None:
-            self.__freq_dist = Util.get_freq_dist(self.__tokens)
-
-        most_common = self.__freq_dist.most_common()
+        most_common = self.__feature("freq_dist").most_common()
         freq_dist = []
         count = 0
         for item in reversed(most_common):
@@ -487,79 +745,314 @@ class SPLAT:
         """ Uses matplotlib to graph the frequency distribution.
         :param x:
         """
-        if self.__freq_dist is None:
-            self.__freq_dist = Util.get_freq_dist(self.__tokens)
-        Util.plot_freq_dist(self.__freq_dist, x)
+        Util.plot_freq_dist(self.__feature("freq_dist"), x)
         return ''
 
     ##### DISCOURSE BASED ##############################################################################################
 
     def disfluencies_per_utterance(self):
         """ Displays the number of each type of disfluency per each utterance. """
-        template = "{0:7}{1:7}{2:7}{3:7}{4:7}{5:7}{6:7}{7:7}{8:7}{9:50}"
-        print(template.format("UM", "UH", "AH", "ER", "HM", "Pauses", "Reps", "Breaks", "Words", "Text"))
-        for (k, v) in self.__dpu.items():
-            print(template.format(str(v[0]), str(v[1]), str(v[2]), str(v[3]), str(v[4]), str(v[5]), str(v[6]), str(v[7]), str(v[8]), k))
+        template = "{0:7}{1:7}{2:7}{3:7}{4:7}{5:7}{6:7}{7:7}{8:7}{9:9}{10:9}{11:50}"
+        dpu = self.__feature("dpu")
+        print(template.format("UM", "UH", "AH", "ER", "HM", "Pauses", "Reps", "Breaks", "Words", "Phrases", "Restarts",
+                              "Text"))
+        for (k, v) in dpu:
+            print(template.format(*([str(count) for count in v] + [k])))
 
         return ''
 
     def average_dpu(self):
         """ Return the average disfluencies per utterance. """
-        return self.__adpu
+        return self.__feature("adpu")
 
     def disfluencies_per_sentence(self):
         """ Displays the number of each type of disfluency per each sentence. """
-        template = "{0:7}{1:7}{2:7}{3:7}{4:7}{5:7}{6:7}{7:7}{8:7}{9:50}"
-        print(template.format("UM", "UH", "AH", "ER", "HM", "Pauses", "Reps", "Breaks", "Words", "Text"))
-        for (k, v) in self.__dps.items():
-            print(template.format(str(v[0]), str(v[1]), str(v[2]), str(v[3]), str(v[4]), str(v[5]), str(v[6]), str(v[7]), str(v[8]), k))
+        template = "{0:7}{1:7}{2:7}{3:7}{4:7}{5:7}{6:7}{7:7}{8:7}{9:9}{10:9}{11:50}"
+        dps = self.__feature("dps")
+        print(template.format("UM", "UH", "AH", "ER", "HM", "Pauses", "Reps", "Breaks", "Words", "Phrases", "Restarts",
+                              "Text"))
+        for (k, v) in dps:
+            print(template.format(*([str(count) for count in v] + [k])))
 
         return ''
 
     def average_dps(self):
         """ Return the average disfluencies per sentence. """
-        return self.__adps
+        return self.__feature("adps")
 
     def disfluencies(self):
         """ Displays the total number of each type of disfluency. """
-        d = self.__disfluencies
-        print("Nasal\tUM\tHM\tNon-Nasal\tUH\tAH\tER\tSilent Pauses\tRepetitions\tBreaks")
+        d = self.__feature("disfluencies")
+        print("Nasal\tUM\tHM\tNon-Nasal\tUH\tAH\tER\tSilent Pauses\tRepetitions\tBreaks\tPhrase Repetitions\tRestarts")
         print(str(d["Nasal"]) + "\t" + str(d["UM"]) + "\t" + str(d["HM"]) + "\t" + str(d["Non-Nasal"]) +
               "\t\t" + str(d["UH"]) + "\t" + str(d["AH"]) + "\t" + str(d["ER"]) + "\t" + str(d["Pause"]) +
-              "\t\t" + str(d["Repetitions"]) + "\t\t" + str(d["Break"]))
+              "\t\t" + str(d["Repetitions"]) + "\t\t" + str(d["Break"]) + "\t" + str(d["Phrase Repetitions"]) +
+              "\t\t\t" + str(d["Restarts"]))
 
         return ''
 
     def dis(self):
         """ Return the raw disfluencies dictionary. """
-        return self.__disfluencies
+        return self.__feature("disfluencies")
+
+    def disfluency_matrix(self, sentences=False):
+        """
+        Returns the disfluency counts of each utterance (or sentence), as rows of a matrix stored in a single array; see
+        Util.disfluency_matrix().
+        :param sentences: whether to count per sentence rather than per utterance
+        """
+        return self.__feature("sent_disfluencies" if sentences else "utt_disfluencies")
+
+    def repetitions(self):
+        """
+        Returns the repeated phrases and restarts of each utterance, as (utterance index, start, end, kind) tuples,
+        where words start to end of the utterance (split on spaces) are the phrase that was repeated or cut off, and
+        kind is either "repetition" or "restart"; see Util.find_repetitions().
+        """
+        return self.__feature("repetitions")
+
+    def dialog_acts(self):
+        """
+        Returns the number of utterances, words and disfluencies of each dialog act, for a SPLAT whose utterances are
+        annotated with their acts, such as "um can you help me (Info-Request, Action-Request)"; see
+        Util.count_dialog_acts(). Utterances without acts are not counted.
+        """
+        return self.__feature("dialog_acts")
 
     ##### UNCATEGORIZED ################################################################################################
 
     def splat(self):
-        return self.__splat
+        return self.__feature("text")
 
     def __str__(self):
         """ Equivalent to Java's toString(). """
-        return self.splat()
+        return self.__cache.get("text", "")
+
+    ##### INCREMENTAL UPDATES ##########################################################################################
+
+    # The features that extend() brings up to date by processing only the new utterances. Every other feature is
+    # computed again, from these, the next time it is needed.
+    __incremental = ("text", "utterances", "vocab", "rawtoken_ids", "token_ids", "rawtypes", "types", "syllables",
+                     "freq_dist", "unigrams", "bigrams", "trigrams", "utt_disfluencies", "treestrings",
+                     "content_densities", "idea_densities", "speech_idea_densities", "dialog_acts")
+
+    def extend(self, new_text):
+        """
+        Appends the given text to this SPLAT, as if the SPLAT had been created from the longer text. Counts, types,
+        n-grams, syllables, utterance disfluencies, dialog acts and parse trees that have already been computed are
+        updated from the new utterances alone, rather than from the whole text.
+        :param new_text: the text to append, which starts a new utterance
+        """
+        if self.__streaming:
+            raise ValueError("WARNING: This SPLAT was built by streaming, so it cannot be extended.")
+        new_utts = [line.strip() for line in new_text.split("\n")]
+        if self.__from_file:
+            self.__extend(new_utts, "".join(utt + " " for utt in new_utts))
+        else:
+            self.__extend(new_utts, "\n" + new_text)
+
+    def extend_from_file(self, path):
+        """
+        Appends the lines that were added to the end of the file at path since this SPLAT was created from it.
+        :param path: the file this SPLAT was created from
+        """
+        old_utts = self.__feature("utterances")
+        # A SPLAT read from a binary cache does not know where its text came from, so it is checked once here.
+        if not self.__from_file and self.__feature("text") == "".join(utt + " " for utt in old_utts):
+            self.__from_file = True
+        if self.__streaming or not self.__from_file:
+            raise ValueError("WARNING: Only a SPLAT created from a file can be extended from a file.")
+        with open(path, 'r') as f:
+            utts = [line.strip() for line in f]
+        if utts[:len(old_utts)] != old_utts:
+            raise ValueError("WARNING: " + str(path) + " was changed, not only appended to, since this SPLAT was "
+                             "created.")
+        new_utts = utts[len(old_utts):]
+        if len(new_utts) > 0:
+            self.__extend(new_utts, "".join(utt + " " for utt in new_utts))
+
+    def __extend(self, new_utts, new_text):
+        """ Appends new_text, which holds new_utts, and updates the features that can be updated incrementally. """
+        # The binary cache holds the features of the old text, so the ones that are updated here are read from it first.
+        if self.__sections is not None:
+            for name in SPLAT.__incremental:
+                if name in self.__sections and name not in self.__cache:
+                    self.__feature(name)
+            self.__sections = None
+        old, new = self.__cache, {}
+        self.__cache = new
+        new["text"] = old["text"] + new_text
+        new["utterances"] = old["utterances"] + new_utts
+
+        # Tokens are only split at spaces, so the last token of the old text may run on into the new text. It is taken
+        # back out and tokenized again together with the new text.
+        tail = old["text"].rsplit(" ", 1)[-1]
+        if "vocab" in old:
+            vocab = new["vocab"] = old["vocab"]
+            for (name, types, tokenizer) in [("rawtoken_ids", "rawtypes", RawTokenizer()),
+                                             ("token_ids", "types", CleanTokenizer())]:
+                if name in old:
+                    # Features returned before extend() keep their values, so cached objects are copied, not changed.
+                    ids = old[name]
+                    kept = len(ids) - len(tokenizer.tokenize(tail))
+                    removed = array('I', ids[kept:])
+                    added = vocab.encode(tokenizer.tokenize(tail + new_text))
+                    new[name] = ids[:kept] + added
+                    if types in old:
+                        counts = dict(old[types])
+                        for (word, count) in vocab.typify(removed):
+                            counts[word] -= count
+                        for (word, count) in vocab.typify(added):
+                            counts[word] = counts.get(word, 0) + count
+                        new[types] = sorted((word, count) for (word, count) in counts.items() if count > 0)
+                    if name == "token_ids" and "freq_dist" in old:
+                        freq_dist = new["freq_dist"] = old["freq_dist"].copy()
+                        for word in vocab.view(removed):
+                            freq_dist[word] -= 1
+                            if freq_dist[word] == 0:
+                                del freq_dist[word]
+                        freq_dist.update(vocab.view(added))
+                    if name == "token_ids" and "syllables" in old:
+                        new["syllables"] = (old["syllables"] - cUtil.num_type_syllables(vocab.typify(removed)) +
+                                            cUtil.num_type_syllables(vocab.typify(added)))
+
+        # An n-gram may start in the old text, so its last n - 1 words are put in front of the new ones.
+        gramminator = FullNGramminator()
+        for (n, name) in [(1, "unigrams"), (2, "bigrams"), (3, "trigrams")]:
+            if name in old:
+                history = old["text"].rsplit(None, n - 1)[-(n - 1):] if n > 1 else []
+                new[name] = old[name] + gramminator.ngrams(gramminator.words(history) + gramminator.words(new_text), n)
+
+        if "utt_disfluencies" in old:
+            new["utt_disfluencies"] = old["utt_disfluencies"] + Util.disfluency_matrix(new_utts)
+
+        if "dialog_acts" in old:
+            new["dialog_acts"] = OrderedDict((act, dict(counts)) for (act, counts) in old["dialog_acts"].items())
+            for utt in new_utts:
+                Util.count_dialog_act(new["dialog_acts"], utt)
+
+        if "treestrings" in old:
+            new_trees = TreeStringParser().get_parse_trees(new_utts)
+            new["treestrings"] = old["treestrings"] + new_trees
+            if "content_densities" in old:
+                new["content_densities"] = old["content_densities"] + cUtil.calc_content_densities(new_trees)
+            if "idea_densities" in old:
+                new["idea_densities"] = old["idea_densities"] + cUtil.idea_density.calc_ideas(new_trees)
+            if "speech_idea_densities" in old:
+                new["speech_idea_densities"] = (old["speech_idea_densities"] +
+                                                cUtil.idea_density.calc_ideas(new_trees, True))
+
+    ##### BINARY CACHE #################################################################################################
+
+    @classmethod
+    def load_cache(cls, path):
+        """
+        Creates a SPLAT from the binary cache at path (see save_cache()). Only the cache's index is read here; each
+        feature is read from the cache the first time it is needed.
+        :param path: the path of the cache
+        """
+        if not os.path.exists(path):
+            raise ValueError("WARNING: SPLAT cache " + str(path) + " does not exist.")
+        new_splat = cls.__new__(cls)
+        new_splat.__cache = {}
+        new_splat.attach_cache(path)
+        return new_splat
+
+    def attach_cache(self, path):
+        """
+        Reads the features of this SPLAT that have not been computed yet from the binary cache at path, the first time
+        each one is needed, instead of computing them.
+        :param path: the path of the cache
+        """
+        self.__sections = SplatFile(path)
+        self.__streaming = self.__streaming or self.__sections.streaming
+
+    def save_cache(self, path):
+        """
+        Writes the features of this SPLAT to the binary cache at path. If that cache already exists, only the features
+        it does not hold yet are written.
+        :param path: the path of the cache
+        """
+        if self.__sections is not None and os.path.abspath(self.__sections.path) != os.path.abspath(path):
+            self.__read_sections()
+        SplatFile(path).write(self.__cache, self.__streaming)
+
+    def __read_sections(self):
+        """ Reads every feature of the binary cache that has not been read yet. """
+        if self.__sections is not None:
+            for name in self.__sections.names():
+                if name not in self.__cache:
+                    self.__cache[name] = self.__sections.read(name)
 
     ##### JSON SERIALIZATION ###########################################################################################
 
+    def __json_dict(self):
+        """ Returns the dictionary that is written as JSON, which includes every feature held in the binary cache. """
+        self.__read_sections()
+        json_dict = {k: v for (k, v) in self.__dict__.items() if k != "_SPLAT__sections"}
+        # JSON objects have no order, so the dialog acts are written as [act, counts] pairs, in the order they were
+        # seen.
+        if "dialog_acts" in self.__cache:
+            json_dict["_SPLAT__cache"] = dict(self.__cache, dialog_acts=list(self.__cache["dialog_acts"].items()))
+        return json_dict
+
     def dump(self, out_file):
         """ Dumps the JSON dictionary of this SPLAT to the specified file. """
-        json.dump(self.__dict__, out_file, default=jdefault)
+        json.dump(self.__json_dict(), out_file, default=jdefault)
 
     def dumps(self):
         """ Returns a string representation of the JSON dictionary for this SPLAT. """
-        return json.dumps(self.__dict__)
+        return json.dumps(self.__json_dict(), default=jdefault)
 
     def load(self, in_file):
         """ Given a file containing a JSON dictionary of a SPLAT, load that dictionary into a new SPLAT object. """
         self.__dict__ = json.load(in_file)
+        self.__restore()
 
     def loads(self, data_str):
         """ Given a string containing a JSON dictionary of a SPLAT, load that dictionary into a new SPLAT object. """
         self.__dict__ = json.loads(data_str)
+        self.__restore()
+
+    def __restore(self):
+        """
+        Rebuilds the cached features that JSON stores as plain lists and dictionaries. Dictionaries written before the
+        feature cache existed are reduced to their text and utterances, from which every other feature can be computed.
+        """
+        if self.__cache is None:
+            self.__cache = {"text": self.__dict__.get("_SPLAT__splat", ""),
+                            "utterances": self.__dict__.get("_SPLAT__utterances", [])}
+            return
+
+        cache = self.__cache
+        if "vocab" in cache:
+            cache["vocab"] = Vocabulary(cache["vocab"])
+        # Disfluencies that were written before they were counted as a matrix, or before phrase repetitions and
+        # restarts were counted, are counted again.
+        outdated = "disfluencies" in cache and "Restarts" not in cache["disfluencies"]
+        for name in ("utt_disfluencies", "sent_disfluencies", "dpu", "dps", "adpu", "adps", "disfluencies"):
+            if name in cache and (outdated or isinstance(cache[name], dict) and name != "disfluencies" or
+                                  isinstance(cache[name], list) and
+                                  any(not isinstance(count, (int, list)) for count in cache[name])):
+                del cache[name]
+        for name in ("rawtoken_ids", "token_ids", "utt_disfluencies", "sent_disfluencies"):
+            if name in cache:
+                cache[name] = array('I', cache[name])
+        for name in ("rawtoken_counts", "token_counts"):
+            if name in cache:
+                cache[name] = {int(k): v for (k, v) in cache[name].items()}
+        for name in ("rawtypes", "types"):
+            if name in cache:
+                cache[name] = [tuple(pair) for pair in cache[name]]
+        if "char_features" in cache:
+            cache["char_features"]["histogram"] = {int(k): v for (k, v) in cache["char_features"]["histogram"].items()}
+            cache["char_features"]["longest"] = set(cache["char_features"]["longest"])
+            cache["char_features"]["shortest"] = set(cache["char_features"]["shortest"])
+        if "freq_dist" in cache:
+            cache["freq_dist"] = Util.get_freq_dist(cache["freq_dist"])
+        if "dialog_acts" in cache:
+            acts = cache["dialog_acts"]
+            cache["dialog_acts"] = OrderedDict(acts if isinstance(acts, list) else acts.items())
 
 
 def jdefault(o):
@@ -567,4 +1060,8 @@ def jdefault(o):
     By default, JSON serialization doesn't do what I want it to do, so we have to explicitly tell it to serialize the
     Python dictionary representation of the SPLAT object.
     """
+    if isinstance(o, Vocabulary):
+        return o.words()
+    elif isinstance(o, (array, set)):
+        return list(o)
     return o.__dict__
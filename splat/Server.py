@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json, os, socketserver, threading
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.SPLAT import SPLAT, jdefault
+from splat.Extractor import Extractor
+from splat.parsers.ParserPool import ParserPool
+from splat.parsers.TreeStringParser import TreeStringParser
+from splat.taggers.NLTKPOSTagger import NLTKPOSTagger
+import splat.corpora as corpora
+import splat.Util as Util
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class Server:
+	"""
+	A Server keeps the NLTK corpora, the POS tagger and a pool of Berkeley Parsers loaded, and computes SPLAT features
+	for requests sent over a localhost HTTP port or a Unix socket. A request is a JSON object with either a "text" or a
+	"file", and a list of "features" (see Extractor.features); the reply is a JSON object with either the "features"
+	or an "error". At most workers requests are computed at once, and at most queue_size more may wait for their turn;
+	requests beyond that are refused straight away.
+	"""
+	# The reply to a request that was refused because the server is busy.
+	BUSY = {"error": "WARNING: The server is busy. Try again later."}
+
+	def __init__(self, workers=4, queue_size=16, parsers=1):
+		"""
+		Creates a Server object.
+		:param workers:the number of requests computed at the same time
+		:type workers:int
+		:param queue_size:the number of requests that may wait while every worker is busy
+		:type queue_size:int
+		:param parsers:the number of Berkeley Parser processes to keep running
+		:type parsers:int
+		"""
+		self.__extractor = Extractor()
+		self.__admitted = threading.BoundedSemaphore(workers + queue_size)
+		self.__workers = threading.BoundedSemaphore(workers)
+		self.__parser_pool = ParserPool(parsers)
+		self.__server = None
+
+	def warm(self):
+		"""
+		Loads the NLTK corpora and tagger model, and starts the Berkeley Parsers, so that the first request does not pay
+		for them. Anything that cannot be loaded is reported, and is loaded again by the first request that needs it.
+		"""
+		TreeStringParser.pool = self.__parser_pool
+		warm_up = SPLAT("This is a warm up sentence.")
+		for (name, warm) in [("POS tagger", NLTKPOSTagger.tagger), ("stopwords", Util.get_stopword_set),
+							 ("names", corpora.proper_names), ("CMUDICT", corpora.cmu_dict),
+							 ("Berkeley Parser", warm_up.treestrings)]:
+			try:
+				warm()
+			except Exception as e:
+				print("WARNING: Could not load the " + name + ": " + str(e))
+
+	def handle(self, request):
+		"""
+		Computes the features asked for by a single request.
+		:param request:a dictionary with a "text" or a "file", and a list (or comma-separated string) of "features"
+		:type request:dict
+		:return:a dictionary with either the "features" or an "error"
+		:rtype:dict
+		"""
+		if not self.__admitted.acquire(blocking=False):
+			return Server.BUSY
+		try:
+			with self.__workers:
+				if not isinstance(request, dict) or "features" not in request:
+					raise ValueError("WARNING: A request needs \"features\", and a \"text\" or a \"file\".")
+				features = request["features"]
+				if isinstance(features, str):
+					features = features.split(",")
+				if "text" in request:
+					doc = SPLAT(request["text"])
+				elif "file" in request:
+					if not os.path.isfile(request["file"]):
+						raise ValueError("WARNING: No such file: " + str(request["file"]) + ".")
+					doc = SPLAT(request["file"])
+				else:
+					raise ValueError("WARNING: A request needs \"features\", and a \"text\" or a \"file\".")
+				return {"features": self.__extractor.extract(doc, features)}
+		except Exception as e:
+			return {"error": str(e)}
+		finally:
+			self.__admitted.release()
+
+	def handle_json(self, data):
+		""" Handles a request given as a JSON string, and returns the reply dictionary. """
+		try:
+			request = json.loads(data)
+		except ValueError:
+			return {"error": "WARNING: The request is not valid JSON."}
+		return self.handle(request)
+
+	@staticmethod
+	def encode(reply):
+		""" Returns the given reply dictionary as a JSON string. """
+		return json.dumps(reply, default=jdefault)
+
+	def serve_http(self, port=8340, host="127.0.0.1"):
+		"""
+		Answers requests POSTed to http://host:port/ until shutdown() is called.
+		:param port:the port to listen on
+		:type port:int
+		:param host:the address to listen on (localhost by default)
+		:type host:str
+		"""
+		self.__server = _ThreadingHTTPServer((host, port), _HTTPHandler)
+		self.__server.splat_server = self
+		self.__serve()
+
+	def serve_unix(self, path):
+		"""
+		Answers requests sent to the Unix socket at path, one JSON request per line, until shutdown() is called.
+		:param path:the path of the socket, which is replaced if it already exists
+		:type path:str
+		"""
+		if os.path.exists(path):
+			os.remove(path)
+		self.__server = socketserver.ThreadingUnixStreamServer(path, _UnixHandler)
+		self.__server.splat_server = self
+		try:
+			self.__serve()
+		finally:
+			os.remove(path)
+
+	def __serve(self):
+		""" Runs the current server until shutdown() is called, then stops the Berkeley Parsers. """
+		self.__server.daemon_threads = True
+		try:
+			self.__server.serve_forever()
+		finally:
+			self.__server.server_close()
+			self.__parser_pool.close()
+
+	def shutdown(self):
+		""" Stops serving. This must be called from a different thread than the one serving. """
+		if self.__server is not None:
+			self.__server.shutdown()
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+	""" An HTTPServer that handles each request in its own thread (http.server only has one from Python 3.7). """
+	daemon_threads = True
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+	""" Answers each POST with the JSON reply to its JSON body, and GET with the list of available features. """
+	def do_GET(self):
+		self.__reply(200, json.dumps({"features": sorted(Extractor.features)}))
+
+	def do_POST(self):
+		length = int(self.headers.get("Content-Length", 0))
+		reply = self.server.splat_server.handle_json(self.rfile.read(length).decode("utf-8"))
+		self.__reply(503 if reply is Server.BUSY else 200, Server.encode(reply))
+
+	def __reply(self, status, body):
+		data = body.encode("utf-8")
+		self.send_response(status)
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(data)))
+		self.end_headers()
+		self.wfile.write(data)
+
+	def log_message(self, format, *args):
+		pass
+
+
+class _UnixHandler(socketserver.StreamRequestHandler):
+	""" Answers each line, a JSON request, with a line holding its JSON reply. """
+	def handle(self):
+		for line in self.rfile:
+			line = line.decode("utf-8").strip()
+			if line != "":
+				reply = Server.encode(self.server.splat_server.handle_json(line))
+				self.wfile.write((reply + "\n").encode("utf-8"))
+				self.wfile.flush()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from array import array
+from collections.abc import Sequence
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class SpanList(Sequence):
+	"""
+	A SpanList is a read-only sequence of (start, end) character offsets into a text. Offsets are stored in a single
+	compact array, and the substring for a span is only created when it is asked for.
+	"""
+	def __init__(self, text, offsets=None, normalize=None):
+		"""
+		Creates a SpanList object.
+		:param text:the text that the spans point into
+		:type text:str
+		:param offsets:a flat array of offsets: start0, end0, start1, end1, ...
+		:type offsets:array
+		:param normalize:an optional function applied to each substring when it is created
+		:type normalize:function
+		"""
+		self.__text = text
+		self.__offsets = offsets if offsets is not None else array('L')
+		self.__normalize = normalize
+
+	def __len__(self):
+		return len(self.__offsets) // 2
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return [self[i] for i in range(*index.indices(len(self)))]
+		if index < 0:
+			index += len(self)
+		if index < 0 or index >= len(self):
+			raise IndexError("SpanList index out of range")
+		return self.__offsets[2 * index], self.__offsets[2 * index + 1]
+
+	def __iter__(self):
+		offsets = self.__offsets
+		for i in range(0, len(offsets), 2):
+			yield offsets[i], offsets[i + 1]
+
+	def __repr__(self):
+		return repr(list(self))
+
+	def text(self):
+		""" Returns the text that the spans point into. """
+		return self.__text
+
+	def string(self, index):
+		""" Returns the (normalized) substring for the span at the given index. """
+		start, end = self[index]
+		if self.__normalize is None:
+			return self.__text[start:end]
+		return self.__normalize(self.__text[start:end])
+
+	def strings(self):
+		""" Returns a list of the (normalized) substrings for every span. """
+		text, offsets = self.__text, self.__offsets
+		strings = [text[offsets[i]:offsets[i + 1]] for i in range(0, len(offsets), 2)]
+		if self.__normalize is None:
+			return strings
+		return [self.__normalize(s) for s in strings]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from array import array
+from collections import OrderedDict
+import marshal, os, struct, sys
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
+
+##### NLTK IMPORTS #####################################################################################################
+from nltk.probability import FreqDist
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.Vocabulary import Vocabulary
+import splat.Util as Util
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class SplatFile:
+	"""
+	A SplatFile is a binary cache of the features of a SPLAT, with each feature stored in its own section. The file
+	starts with a header that gives the schema version and the position of an index of the sections, so a single
+	feature can be read without reading the others. Sections are only ever appended: writing a SPLAT to its cache
+	writes the features that are new since the cache was read, followed by a new index, and then updates the header.
+	The vocabulary is the only feature that grows after it is computed, so it is written again whenever it has grown.
+	Token IDs are only meaningful with the vocabulary that assigned them, so features are only added to a cache whose
+	vocabulary agrees with theirs (one vocabulary must start with the other).
+
+	Layout: header (magic, schema version, marshal version, index offset, index length), sections, index. ID arrays are
+	stored as raw bytes; every other section is stored with marshal.
+	"""
+	MAGIC = b"SPLATBIN"
+	SCHEMA_VERSION = 5
+	__header = struct.Struct("<8sHHQQ")
+
+	def __init__(self, path):
+		"""
+		Opens the cache at path, reading its header and index. The file does not need to exist yet.
+		:param path:the path of the cache
+		:type path:str
+		"""
+		self.path = path
+		self.streaming = False
+		self.__sections = {}
+		self.__byteorder = sys.byteorder
+		if os.path.exists(path):
+			with open(path, 'rb') as f:
+				self.__read_index(f)
+
+	def __read_index(self, f):
+		""" Reads the header and index of the open cache file f. """
+		header = f.read(SplatFile.__header.size)
+		if len(header) != SplatFile.__header.size:
+			raise ValueError("WARNING: " + str(self.path) + " is not a SPLAT cache.")
+		(magic, version, marshal_version, index_offset, index_length) = SplatFile.__header.unpack(header)
+		if magic != SplatFile.MAGIC:
+			raise ValueError("WARNING: " + str(self.path) + " is not a SPLAT cache.")
+		if version != SplatFile.SCHEMA_VERSION or marshal_version > marshal.version:
+			raise ValueError("WARNING: " + str(self.path) + " was written by a different version of SPLAT.")
+		f.seek(index_offset)
+		try:
+			index = marshal.loads(f.read(index_length))
+		except (EOFError, TypeError, ValueError):
+			raise ValueError("WARNING: The index of " + str(self.path) + " is damaged.")
+		self.streaming = index["streaming"]
+		self.__byteorder = index["byteorder"]
+		self.__sections = index["sections"]
+
+	def __contains__(self, name):
+		return name in self.__sections
+
+	def names(self):
+		""" Returns the names of the features stored in this cache. """
+		return list(self.__sections.keys())
+
+	def read(self, name):
+		"""
+		Reads a single feature from this cache.
+		:param name:the name of the feature
+		:type name:str
+		:return:the value of the feature
+		"""
+		with open(self.path, 'rb') as f:
+			return self.__read_section(f, name)
+
+	def __read_section(self, f, name):
+		""" Reads a single feature from the open cache file f. """
+		(offset, length, kind) = self.__sections[name]
+		f.seek(offset)
+		data = f.read(length)
+
+		if kind == "array":
+			value = array('I')
+			value.frombytes(data)
+			if self.__byteorder != sys.byteorder:
+				value.byteswap()
+			return value
+		value = marshal.loads(data)
+		if kind == "vocab":
+			return Vocabulary(value)
+		elif kind == "freq_dist":
+			return Util.get_freq_dist(value)
+		elif kind == "ordered_dict":
+			return OrderedDict(value)
+		return value
+
+	def write(self, features, streaming=False):
+		"""
+		Appends the given features that are not yet in this cache, and returns how many were written. Features that
+		cannot be stored are left out, to be computed again when they are next needed.
+		:param features:a dictionary mapping feature names to values
+		:type features:dict
+		:param streaming:whether the features belong to a SPLAT that was built by streaming
+		:type streaming:bool
+		:return:the number of features written
+		:rtype:int
+		"""
+		with os.fdopen(os.open(self.path, os.O_RDWR | os.O_CREAT), 'r+b') as f:
+			# Only one process appends to a cache at a time, and it first reads the sections that others have added.
+			if fcntl is not None:
+				fcntl.flock(f, fcntl.LOCK_EX)
+			if f.seek(0, os.SEEK_END) == 0:
+				f.write(bytes(SplatFile.__header.size))
+			else:
+				f.seek(0)
+				self.__read_index(f)
+
+			# Another process may have cached a vocabulary that assigned different IDs, in which case nothing is added.
+			skip = set(self.__sections.keys())
+			if "vocab" in features:
+				words = features["vocab"].words()
+				if "vocab" not in self.__sections:
+					skip.discard("vocab")
+				else:
+					stored = self.__read_section(f, "vocab").words()
+					if words[:len(stored)] != stored and stored[:len(words)] != words:
+						return 0
+					if len(words) > len(stored):
+						skip.discard("vocab")
+
+			new_sections = []
+			for (name, value) in features.items():
+				if name in skip:
+					continue
+				encoded = self.__encode(value)
+				if encoded is not None:
+					new_sections.append((name,) + encoded)
+			if len(new_sections) == 0 and streaming == self.streaming and len(self.__sections) > 0:
+				return 0
+
+			f.seek(0, os.SEEK_END)
+			for (name, kind, data) in new_sections:
+				self.__sections[name] = (f.tell(), len(data), kind)
+				f.write(data)
+			self.streaming = streaming
+			index = marshal.dumps({"streaming": streaming, "byteorder": self.__byteorder, "sections": self.__sections})
+			index_offset = f.tell()
+			f.write(index)
+			f.flush()
+			# The header is written last, so a cache that was interrupted while writing still points at its old index.
+			f.seek(0)
+			f.write(SplatFile.__header.pack(SplatFile.MAGIC, SplatFile.SCHEMA_VERSION, marshal.version, index_offset,
+											len(index)))
+
+		return len(new_sections)
+
+	def __encode(self, value):
+		""" Returns the (kind, bytes) of a section holding value, or None if value cannot be stored. """
+		if isinstance(value, array):
+			if self.__byteorder != sys.byteorder:
+				value = array(value.typecode, value)
+				value.byteswap()
+			return ("array", value.tobytes())
+		elif isinstance(value, Vocabulary):
+			return ("vocab", marshal.dumps(value.words()))
+		elif isinstance(value, FreqDist):
+			return ("freq_dist", marshal.dumps(dict(value)))
+		elif isinstance(value, OrderedDict):
+			# marshal only stores plain dictionaries, so the items are stored in order instead.
+			try:
+				return ("ordered_dict", marshal.dumps(list(value.items())))
+			except ValueError:
+				return None
+		try:
+			return ("value", marshal.dumps(value))
+		except ValueError:
+			return None
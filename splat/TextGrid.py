@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+import io
+from collections import OrderedDict
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.SPLAT import SPLAT
+from splat.Extractor import Extractor
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class TextGrid:
+	"""
+	A TextGrid reads the tiers of a Praat TextGrid file, in either the long or the short text format. The file is read
+	one line at a time, so intervals() can stream the intervals of a large file without holding it in memory. Each
+	labelled interval is an utterance, with its start and end times; tiers() groups them by tier (or by speaker), so
+	the features of every speaker can be computed from a single pass over the file.
+	"""
+	def __init__(self, path, speakers=None):
+		"""
+		Creates a TextGrid object. No part of the file is read until it is needed.
+		:param path:the path of the TextGrid file
+		:type path:str
+		:param speakers:a dictionary mapping tier names to speakers, so that several tiers are read as one speaker
+		:type speakers:dict
+		"""
+		self.path = path
+		self.speakers = speakers if speakers is not None else {}
+
+	def __open(self):
+		""" Opens the file as text. Praat writes TextGrids in UTF-8 or, with a byte order mark, in UTF-16. """
+		f = open(self.path, 'rb')
+		encoding = "utf-16" if f.read(2) in [b"\xff\xfe", b"\xfe\xff"] else "utf-8-sig"
+		f.seek(0)
+		return io.TextIOWrapper(f, encoding=encoding)
+
+	def __values(self):
+		"""
+		Yields the values of the file in order: numbers as floats, strings as strings, and flags such as <exists> as
+		booleans. The labels of the long format ("xmin =", "item [1]:", ...) are skipped, which leaves the same values
+		as the short format.
+		"""
+		with self.__open() as f:
+			lines = iter(f)
+			for line in lines:
+				value = line.strip()
+				if not value.startswith('"') and "=" in value:
+					value = value.split("=", 1)[1].strip()
+				if value.startswith('"'):
+					# A string may span several lines, and a quote inside a string is written twice.
+					while not (len(value) > 1 and value.endswith('"') and value.count('"') % 2 == 0):
+						value += "\n" + next(lines, '"').rstrip()
+					yield value[1:-1].replace('""', '"')
+				elif value.endswith("<exists>") or value.endswith("<absent>"):
+					yield value.endswith("<exists>")
+				else:
+					try:
+						yield float(value)
+					except ValueError:
+						continue
+
+	def intervals(self):
+		"""
+		Yields a (tier name, start time, end time, text) tuple for every interval of every tier, in the order of the
+		file. The points of a point tier are given with equal start and end times.
+		:return:a generator of tuples
+		:rtype:generator
+		"""
+		values = self.__values()
+
+		def take(count):
+			items = [next(values, None) for i in range(count)]
+			if None in items:
+				raise ValueError("WARNING: " + str(self.path) + " ends before its last tier does.")
+			return items
+
+		header = [next(values, None) for i in range(5)]
+		if header[:2] != ["ooTextFile", "TextGrid"]:
+			raise ValueError("WARNING: " + str(self.path) + " is not a TextGrid file.")
+		if header[4] is not True:
+			return
+		for tier in range(int(take(1)[0])):
+			(tier_class, name, tier_min, tier_max, size) = take(5)
+			for item in range(int(size)):
+				if tier_class == "IntervalTier":
+					(start, end, text) = take(3)
+				else:
+					(start, text) = take(2)
+					end = start
+				yield (name, start, end, text)
+
+	def tiers(self, min_pause=0.25):
+		"""
+		Returns a Tier for each tier (or speaker) of the file, holding its labelled intervals as utterances.
+		:param min_pause:the shortest silence between two utterances, in seconds, that is counted as a pause
+		:type min_pause:float
+		:return:an ordered dictionary mapping tier (or speaker) names to Tiers, in the order of the file
+		:rtype:OrderedDict
+		"""
+		tiers = OrderedDict()
+		for (name, start, end, text) in self.intervals():
+			name = self.speakers.get(name, name)
+			if name not in tiers:
+				tiers[name] = Tier(name, min_pause)
+			text = " ".join(text.split())
+			if text != "":
+				tiers[name].utterances.append((start, end, text))
+		# Tiers that are read as one speaker are merged into a single timeline.
+		for tier in tiers.values():
+			tier.utterances.sort()
+
+		return tiers
+
+	def rows(self, features, min_pause=0.25):
+		"""
+		Yields one row per tier (or speaker): a dictionary mapping "tier" to its name and each feature name to its
+		value. Besides the features of Extractor.features, the rates wpm, spm and ppm (words, syllables and pauses per
+		minute) are available.
+		:param features:a list of feature names
+		:type features:list
+		:param min_pause:the shortest silence between two utterances, in seconds, that is counted as a pause
+		:type min_pause:float
+		:return:a generator of dictionaries
+		:rtype:generator
+		"""
+		rates = [name for name in features if name in Tier.rates]
+		others = [name for name in features if name not in Tier.rates]
+		extractor = Extractor()
+		extractor.plan(others)
+		for tier in self.tiers(min_pause).values():
+			row = {"tier": tier.name}
+			values = extractor.extract(tier.splat(), others)
+			values.update((name, getattr(tier, Tier.rates[name])()) for name in rates)
+			row.update((name, values[name]) for name in features)
+			yield row
+
+
+class Tier:
+	"""
+	A Tier holds the utterances of a single tier (or speaker) of a TextGrid, each as a (start time, end time, text)
+	tuple, and gives a SPLAT of their text along with rates that depend on time: words, syllables and pauses per minute.
+	Pauses are the {sl} markers within the utterances, and the silences of at least min_pause seconds between them.
+	"""
+	# The rates that rows() can give alongside the features of Extractor.features, mapped to the methods that give them.
+	rates = {"wpm": "words_per_minute", "spm": "syllables_per_minute", "ppm": "pauses_per_minute"}
+
+	def __init__(self, name, min_pause=0.25):
+		"""
+		Creates an empty Tier object.
+		:param name:the name of the tier or speaker
+		:type name:str
+		:param min_pause:the shortest silence between two utterances, in seconds, that is counted as a pause
+		:type min_pause:float
+		"""
+		self.name = name
+		self.min_pause = min_pause
+		self.utterances = []
+		self.__splat = None
+
+	def splat(self):
+		""" Returns a SPLAT with one utterance per labelled interval of this tier, in order of time. """
+		if self.__splat is None:
+			self.__splat = SPLAT("\n".join(text for (start, end, text) in self.utterances))
+		return self.__splat
+
+	def duration(self):
+		""" Returns the number of seconds from the start of the first utterance to the end of the last. """
+		if len(self.utterances) == 0:
+			return 0.0
+		return max(end for (start, end, text) in self.utterances) - min(start for (start, end, text) in self.utterances)
+
+	def silences(self):
+		""" Returns the number of silences of at least min_pause seconds between consecutive utterances. """
+		count, last_end = 0, None
+		for (start, end, text) in self.utterances:
+			if last_end is not None and start - last_end >= self.min_pause:
+				count += 1
+			last_end = end if last_end is None else max(last_end, end)
+		return count
+
+	def pauses(self):
+		""" Returns the number of pauses: {sl} markers, and silences between utterances. """
+		return self.splat().dis()["Pause"] + self.silences()
+
+	def __per_minute(self, count):
+		""" Returns count divided by the duration of this tier in minutes. """
+		duration = self.duration()
+		return round(float(count) / (duration / 60.0), 4) if duration > 0 else 0.0
+
+	def words_per_minute(self):
+		""" Returns the number of words per minute. """
+		return self.__per_minute(self.splat().wordcount())
+
+	def syllables_per_minute(self):
+		""" Returns the number of syllables per minute. """
+		return self.__per_minute(self.splat().syllables())
+
+	def pauses_per_minute(self):
+		""" Returns the number of pauses per minute. """
+		return self.__per_minute(self.pauses())
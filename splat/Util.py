@@ -1,20 +1,30 @@
 #!/usr/bin/env python3
 
 ##### PYTHON IMPORTS ###################################################################################################
-import re
+import mmap, os, re
+from array import array
+from collections import Counter, OrderedDict
 
 ##### NLTK IMPORTS #####################################################################################################
 from nltk.tree import Tree
 from nltk.probability import FreqDist
 
 ##### SPLAT IMPORTS ####################################################################################################
-from splat.corpora import STOPWORDS_EN
+import splat.corpora as corpora
 
 ##### GLOBAL VARIABLES #################################################################################################
 open_class_list = ["FW", "JJ", "JJR", "JJS", "LS", "NN", "NNS", "NNP", "NNPS", "RB", "RBR", "RBS", "SYM", "VB", "VBD", "VBG", "VBN", "VBP", "VBZ"]
 closed_class_list = ["BES", "AUX", "AUXG", "CC", "CD", "DT", "EX", "IN", "MD", "PDT", "POS", "PRP", "PRP$", "RP", "TO", "WDT", "WP", "UH", "WP$", "WRB"]
 ignore_list = ['LCB', '-LCB-', 'LRB', '-LRB-', 'LS', 'LSB', '-LSB-', '-RRB-', 'RCB', '-RCB-', 'RSB', '-RSB-', 'SYM', 'UH', '$', '``', '"', '\'\'', '(', ')', '()', '( )', ',', '--', '.', ':', 'SBAR', 'SBARQ']
 proposition_list = ['CC', 'CD', 'DT', 'VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ', 'JJ', 'JJR', 'JJS', 'RB', 'RBR', 'RBS', 'IN', 'CC', 'PDT', 'POS', 'PP$', 'PRP$', 'TO', 'WDT', 'WP', 'WPS', 'WRB']
+stopword_set = None
+disfluency_index = {"um": 0, "uh": 1, "ah": 2, "er": 3, "hm": 4, "{sl}": 5}
+# The columns of a disfluency matrix (see disfluency_matrix()): the count of each kind of disfluency, then of words,
+# then of repeated phrases and restarts (see find_repetitions()).
+disfluency_categories = ["UM", "UH", "AH", "ER", "HM", "Pause", "Repetitions", "Break", "Words", "Phrase Repetitions",
+						 "Restarts"]
+# The longest phrase, in words, that find_repetitions() looks for.
+max_repetition_length = 4
 
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
@@ -35,14 +45,7 @@ def typify(tokens):
 	:return:a dictionary of unique types with their frequencies.
 	:rtype:dict
 	"""
-	temp_types = {}
-	for word in tokens:
-		if word not in temp_types.keys():
-			temp_types[word] = 1
-		else:
-			temp_types[word] += 1
-
-	return sorted(temp_types.items())
+	return sorted(Counter(tokens).items())
 
 def wordcount(text):
 	""" Return the number of words in the given text. """
@@ -57,45 +60,63 @@ def type_token_ratio(types, tokens):
 	""" Calculate the ratio of types to tokens. """
 	return round(float(len(types)) / float(len(tokens)), 4)
 
+def get_stopword_set():
+	""" Returns the set of English stopwords, loading it the first time it is needed. """
+	global stopword_set
+	if stopword_set is None:
+		stopword_set = set(corpora.stopwords_en())
+	return stopword_set
+
 def get_content_words(tokens):
 	""" Get a list of all content words. """
+	stopword_set = get_stopword_set()
 	content_words = []
 	for word in tokens:
-		if word.lower() not in STOPWORDS_EN:
+		if word.lower() not in stopword_set:
 			content_words.append(word)
 
 	return content_words
 
 def get_unique_content_words(types):
 	""" Get a list of unique content words. """
+	stopword_set = get_stopword_set()
 	content_words = []
 	for (word, count) in types:
-		if word.lower() not in STOPWORDS_EN:
+		if word.lower() not in stopword_set:
 			content_words.append(word)
 
 	return content_words
 
 def get_function_words(tokens):
 	""" Get a list of all function words. """
+	stopword_set = get_stopword_set()
 	function_words = []
 	for word in tokens:
-		if word.lower() in STOPWORDS_EN:
+		if word.lower() in stopword_set:
 			function_words.append(word)
 
 	return function_words
 
 def get_unique_function_words(types):
 	""" Get a list of unique function words. """
+	stopword_set = get_stopword_set()
 	function_words = []
 	for (word, count) in types:
-		if word.lower() in STOPWORDS_EN:
+		if word.lower() in stopword_set:
 			function_words.append(word)
 
 	return function_words
 
+def get_function_word_flags(words):
+	""" Get a list of booleans marking which of the given words are function words. """
+	stopword_set = get_stopword_set()
+	return [word.lower() in stopword_set for word in words]
+
 def get_content_function_ratio(content, function):
-	""" Calculate the content-function word ratio. """
-	ratio = float(len(content)) / float(len(function)) if len(function) != 0 else 0
+	""" Calculate the content-function word ratio, given lists of content and function words or their counts. """
+	content = content if type(content) == int else len(content)
+	function = function if type(function) == int else len(function)
+	ratio = float(content) / float(function) if function != 0 else 0
 
 	return round(ratio, 4)
 
@@ -146,12 +167,8 @@ def get_max_depth(treestrings):
 	return max_depth
 
 def get_freq_dist(tokens):
-	""" Calculate the frequency distribution for the given input_file. """
-	new_words = []
-	for token in tokens:
-		new_words.append(token)
-
-	return FreqDist(new_words)
+	""" Calculate the frequency distribution for the given tokens, or for a dictionary of token frequencies. """
+	return FreqDist(tokens)
 
 def plot_freq_dist(freq_dist, x=None):
 	""" Plot the frequency distribution for the given input_file. """
@@ -162,127 +179,274 @@ def plot_freq_dist(freq_dist, x=None):
 
 	return ''
 
-def count_disfluencies(utterances):
-	""" Gather disfluency counts per utterance. """
-	disfluencies = {}
-	for utt in utterances:
-		disfluencies[utt] = []
-		um_count = 0
-		uh_count = 0
-		ah_count = 0
-		er_count = 0
-		hm_count = 0
-		pause_count = 0
-		repetition_count = 0
-		break_count = 0
-		words = 0
+def read_lines(path, chunk_size=1048576):
+	"""
+	Yields the lines of the given file one at a time, without their newlines. The file is read in chunks of chunk_size
+	characters, so only the current chunk and the current line are ever held in memory.
+	:param path:the file to read
+	:type path:filename
+	:param chunk_size:the number of characters to read at a time
+	:type chunk_size:int
+	"""
+	with open(path, 'r') as f:
+		remainder = ""
+		for chunk in iter(lambda: f.read(chunk_size), ""):
+			lines = (remainder + chunk).split("\n")
+			remainder = lines.pop()
+			yield from lines
+		if remainder != "":
+			yield remainder
+
+def read_mapped_blocks(path, encoding="utf-8", block_size=16777216):
+	"""
+	Yields the text of the given file in blocks of roughly block_size bytes, with line breaks replaced by spaces so that
+	each block reads like the text of a SPLAT. The file is memory-mapped rather than read line by line, and every block
+	ends at a line break, so no word is split across two blocks.
+	:param path:the file to read
+	:type path:filename
+	:param encoding:the (ASCII-compatible) encoding of the file
+	:type encoding:str
+	:param block_size:the approximate number of bytes to decode at a time
+	:type block_size:int
+	"""
+	with open(path, 'rb') as f:
+		size = os.fstat(f.fileno()).st_size
+		if size == 0:
+			return
+		with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+			start = 0
+			while start < size:
+				end = min(start + block_size, size)
+				if end < size:
+					newline = data.rfind(b"\n", start, end)
+					end = newline + 1 if newline != -1 else data.find(b"\n", end) + 1 or size
+				yield data[start:end].decode(encoding).replace("\r\n", " ").replace("\r", " ").replace("\n", " ")
+				start = end
+
+def classify_disfluency(word, last_word=""):
+	"""
+	Returns the index of the disfluency that the given word represents, or -1 if it is not a disfluency. Indices follow
+	the order of disfluency_categories: UM, UH, AH, ER, HM, Pause, Repetition, Break. A word is a Repetition if it is
+	the same as the word before it, which callers pass as last_word.
+	"""
+	index = disfluency_index.get(word.lower(), -1)
+	if index != -1:
+		return index
+	elif word == last_word:
+		return 6
+	elif word.endswith("-"):
+		return 7
+	else:
+		return -1
+
+def disfluency_matrix(units):
+	"""
+	Counts the disfluencies of each of the given utterances or sentences. The counts form a matrix with a row per unit,
+	in order, and a column per category of disfluency_categories; the matrix is stored row by row in a single array.
+	:param units:a list of utterances or sentences
+	:type units:list
+	:return:the disfluency matrix
+	:rtype:array
+	"""
+	width = len(disfluency_categories)
+	matrix = array('I')
+	for unit in units:
+		row = [0] * width
 		last_word = ""
-		for word in utt.split(" "):
-			words += 1
-			if word.lower() == "um":
-				um_count += 1
-			elif word.lower() == "uh":
-				uh_count += 1
-			elif word.lower() == "ah":
-				ah_count += 1
-			elif word.lower() == "er":
-				er_count += 1
-			elif word.lower() == "hm":
-				hm_count += 1
-			elif word.lower() == "{sl}":
-				pause_count += 1
-			elif word == last_word:
-				repetition_count += 1
-				last_word = word
-			elif re.search(r"-$", word):
-				break_count += 1
-			else:
-				pass
-
-		disfluencies[utt].append(um_count)
-		disfluencies[utt].append(uh_count)
-		disfluencies[utt].append(ah_count)
-		disfluencies[utt].append(er_count)
-		disfluencies[utt].append(hm_count)
-		disfluencies[utt].append(pause_count)
-		disfluencies[utt].append(repetition_count)
-		disfluencies[utt].append(break_count)
-		disfluencies[utt].append(words)
-
-		average_disfluencies = um_count + uh_count + ah_count + er_count + hm_count + pause_count + repetition_count + break_count
-		average_disfluencies = float(average_disfluencies / len(utterances))
-
-	return disfluencies, average_disfluencies
-
-def total_disfluencies(dpu_dict):
-	""" Gather disfluency counts for the whole SPLAT. """
-	disfluencies = {}
-	disfluencies["UM"] = 0
-	disfluencies["UH"] = 0
-	disfluencies["AH"] = 0
-	disfluencies["ER"] = 0
-	disfluencies["HM"] = 0
-	disfluencies["Nasal"] = 0
-	disfluencies["Non-Nasal"] = 0
-	disfluencies["Pause"] = 0
-	disfluencies["Break"] = 0
-	disfluencies["Repetitions"] = 0
-	for (k, v) in dpu_dict.items():
-		disfluencies["UM"] += v[0]
-		disfluencies["UH"] += v[1]
-		disfluencies["AH"] += v[2]
-		disfluencies["ER"] += v[3]
-		disfluencies["HM"] += v[4]
-		disfluencies["Pause"] += v[5]
-		disfluencies["Repetitions"] += v[6]
-		disfluencies["Break"] += v[7]
-
-	disfluencies["Nasal"] = disfluencies["UM"] + disfluencies["HM"]
-	disfluencies["Non-Nasal"] = disfluencies["UH"] + disfluencies["AH"] + disfluencies["ER"]
-
-	return disfluencies
+		words = unit.split(" ")
+		for word in words:
+			row[8] += 1
+			index = classify_disfluency(word, last_word)
+			if index != -1:
+				row[index] += 1
+			last_word = word
+		for (start, end, kind) in find_repetitions(words):
+			row[10 if kind == "restart" else 9] += 1
+		matrix.extend(row)
+
+	return matrix
+
+def find_repetitions(words, max_length=max_repetition_length):
+	"""
+	Finds the phrases of 1 to max_length words that are immediately repeated ("I went I went to"), and the restarts,
+	where a phrase is cut off and then started again ("I went- I went to", "I wen- I went to"). Words are compared
+	without case or punctuation. Phrases are compared by rolling hashes, so the time taken grows linearly with the
+	number of words (and with max_length).
+	:param words:a list of words
+	:type words:list
+	:param max_length:the longest phrase to look for
+	:type max_length:int
+	:return:a list of (start, end, kind) tuples, where words[start:end] is the phrase that was repeated or cut off, and
+	kind is either "repetition" or "restart"
+	:rtype:list
+	"""
+	keys = [re.sub(r"[\.,!\?]", "", word).lower().rstrip("-") for word in words]
+	# Each distinct word becomes a number, and empty words never match anything.
+	ids, numbers = [], {}
+	for (i, key) in enumerate(keys):
+		ids.append(numbers.setdefault(key, len(numbers) + 1) if key != "" else -(i + 1))
+	modulus, base = (1 << 61) - 1, 1000003
+	prefix, powers = [0], [1]
+	for i in ids:
+		prefix.append((prefix[-1] * base + i) % modulus)
+		powers.append((powers[-1] * base) % modulus)
+
+	def same(first, second, length):
+		""" Returns whether the phrases of the given length starting at first and at second are the same. """
+		if (prefix[first + length] - prefix[first] * powers[length] - prefix[second + length] +
+			prefix[second] * powers[length]) % modulus != 0:
+			return False
+		return ids[first:first + length] == ids[second:second + length]
+
+	spans, covered, i = [], set(), 0
+	while i < len(ids):
+		for n in range(1, max_length + 1):
+			if i + 2 * n <= len(ids) and same(i, i + n, n):
+				spans.append((i, i + n, "restart" if words[i + n - 1].endswith("-") else "repetition"))
+				covered.add(i + n - 1)
+				i += n
+				break
+		else:
+			i += 1
+
+	# A restart may also cut off its last word part way through, which then starts the word it is repeated as.
+	for (i, word) in enumerate(words):
+		cut = keys[i]
+		if not word.endswith("-") or i in covered or cut in ["", "a", "an"]:
+			continue
+		for n in range(1, max_length + 1):
+			start = i - n + 1
+			if start < 0 or i + n >= len(ids):
+				break
+			if same(start, i + 1, n - 1) and len(keys[i + n]) > 3 and keys[i + n].startswith(cut):
+				spans.append((start, i + 1, "restart"))
+				break
+
+	return sorted(spans)
+
+def disfluency_rows(matrix):
+	""" Returns the rows of the given disfluency matrix, one list of counts per unit. """
+	width = len(disfluency_categories)
+	return [list(matrix[i:i + width]) for i in range(0, len(matrix), width)]
+
+def average_disfluencies(matrix):
+	"""
+	Returns the average number of disfluencies per unit of the given disfluency matrix, counting the categories up to
+	(but not including) the words.
+	"""
+	width = len(disfluency_categories)
+	units = len(matrix) // width
+	if units == 0:
+		return 0.0
+	return float(sum(sum(matrix[i::width]) for i in range(8)) / units)
+
+def count_disfluencies(utterances):
+	"""
+	Gather disfluency counts per utterance, as a dictionary mapping each utterance to its counts, along with the average
+	number of disfluencies per utterance. Repeated utterances share a single entry; disfluency_matrix() keeps them
+	apart.
+	"""
+	matrix = disfluency_matrix(utterances)
+	return dict(zip(utterances, disfluency_rows(matrix))), average_disfluencies(matrix)
+
+def total_disfluencies(counts):
+	"""
+	Gather disfluency counts for the whole SPLAT.
+	:param counts:a disfluency matrix, a list of rows of counts, or a dictionary mapping units to their rows of counts
+	:type counts:array,list,dict
+	:return:a dictionary mapping each category to its total
+	:rtype:dict
+	"""
+	width = len(disfluency_categories)
+	if isinstance(counts, dict):
+		counts = list(counts.values())
+	if isinstance(counts, array):
+		totals = [sum(counts[i::width]) for i in range(width)]
+	else:
+		totals = [sum(column) for column in zip(*counts)] if len(counts) > 0 else [0] * width
+
+	(um, uh, ah, er, hm, pause, repetitions, brk, words, phrases, restarts) = totals
+	return {"UM": um, "UH": uh, "AH": ah, "ER": er, "HM": hm, "Nasal": um + hm, "Non-Nasal": uh + ah + er,
+			"Pause": pause, "Break": brk, "Repetitions": repetitions, "Phrase Repetitions": phrases,
+			"Restarts": restarts}
+
+def parse_dialog_act(line):
+	"""
+	Splits a line annotated with its dialog acts, such as "um can you help me (Info-Request, Action-Request)", into its
+	text and its acts.
+	:param line:an annotated line
+	:type line:str
+	:return:a (text, list of acts) pair, or None if the line has no acts
+	:rtype:tuple
+	"""
+	(text, paren, acts) = line.partition("(")
+	if paren == "":
+		return None
+	acts = [act.strip() for act in acts.split("(")[0].strip().strip(")").split(",")]
+	return text.strip(), [act for act in acts if act != ""]
+
+def count_dialog_act(counts, line):
+	"""
+	Adds the utterance, words and disfluencies of an annotated line to the counts of each of its dialog acts. Acts are
+	added to counts as they are first seen, so any act can be counted.
+	:param counts:an ordered dictionary mapping each act to a dictionary of its counts: "Utterances", then the counts
+	of disfluency_categories
+	:type counts:OrderedDict
+	:param line:a line annotated with its dialog acts (see parse_dialog_act())
+	:type line:str
+	"""
+	parsed = parse_dialog_act(line)
+	if parsed is None:
+		return
+	(text, acts) = parsed
+	row = disfluency_matrix([text]) if text != "" else array('I', [0] * len(disfluency_categories))
+	for act in acts:
+		if act not in counts:
+			counts[act] = dict.fromkeys(["Utterances"] + disfluency_categories, 0)
+		act_counts = counts[act]
+		act_counts["Utterances"] += 1
+		for (category, count) in zip(disfluency_categories, row):
+			act_counts[category] += count
+
+def count_dialog_acts(lines):
+	"""
+	Gathers the utterance, word and disfluency counts of each dialog act in a single pass over the given lines, which
+	may be a generator such as read_lines(), so a large annotated corpus is never held in memory.
+	:param lines:lines annotated with their dialog acts (see parse_dialog_act())
+	:type lines:iterable
+	:return:an ordered dictionary mapping each act, in the order they are first seen, to a dictionary of its counts
+	:rtype:OrderedDict
+	"""
+	counts = OrderedDict()
+	for line in lines:
+		count_dialog_act(counts, line)
+	return counts
 
 def get_disfluencies_per_act(text):
-	""" Gather disfluency counts per dialog act. """
-	temp_dpa = {"Info-Request":[0,0,0,0,0,0,0,0], 			"Action-Request":[0,0,0,0,0,0,0,0],
-				"Action-Suggest":[0,0,0,0,0,0,0,0], 		"Answer-Yes":[0,0,0,0,0,0,0,0],
-				"Answer-No":[0,0,0,0,0,0,0,0], 				"Answer-Neutral":[0,0,0,0,0,0,0,0],
-				"Apology":[0,0,0,0,0,0,0,0], 				"Thanks":[0,0,0,0,0,0,0,0],
-				"Clarification-Request":[0,0,0,0,0,0,0,0], 	"Acknowledgement":[0,0,0,0,0,0,0,0],
-				"Filler":[0,0,0,0,0,0,0,0], 				"Inform":[0,0,0,0,0,0,0,0],
-				"Other":[0,0,0,0,0,0,0,0]}
+	"""
+	Gather disfluency counts per dialog act, as a dictionary mapping each act to its counts of UM, UH, AH, ER, HM,
+	Pause, Repetitions and Break. Words are classified as they always have been here: a word repeats the word before
+	it, and a break starts with "-". See count_dialog_acts() for utterance and word counts, classified as in
+	disfluency_matrix().
+	"""
+	temp_dpa = {act: [0] * 8 for act in ["Info-Request", "Action-Request", "Action-Suggest", "Answer-Yes", "Answer-No",
+										 "Answer-Neutral", "Apology", "Thanks", "Clarification-Request",
+										 "Acknowledgement", "Filler", "Inform", "Other"]}
 	for line in text.split("\n"):
-		#print(line.split("("))
-		split_line = line.split("(")
-		if len(split_line) >= 2:
-			text = line.split("(")[0]
-			acts = line.split("(")[1].strip(")").split(", ")
-			last_word = ""
-			for word in text.split(" "):
-				if word.lower() == "um":
-					for act in acts:
-						temp_dpa[act][0] += 1
-				elif word.lower() == "uh":
-					for act in acts:
-						temp_dpa[act][1] += 1
-				elif word.lower() == "ah":
-					for act in acts:
-						temp_dpa[act][2] += 1
-				elif word.lower() == "er":
-					for act in acts:
-						temp_dpa[act][3] += 1
-				elif word.lower() == "hm":
-					for act in acts:
-						temp_dpa[act][4] += 1
-				elif word.lower() == "{sl}":
-					for act in acts:
-						temp_dpa[act][5] += 1
-				elif re.match(r"\-", word):
-					for act in acts:
-						temp_dpa[act][7] += 1
-				elif word == last_word:
-					for act in acts:
-						temp_dpa[act][6] += 1
-				last_word = word
+		parsed = parse_dialog_act(line)
+		if parsed is None:
+			continue
+		acts = parsed[1]
+		last_word = ""
+		for word in line.partition("(")[0].split(" "):
+			index = disfluency_index.get(word.lower(), -1)
+			if index == -1 and word.startswith("-"):
+				index = 7
+			elif index == -1 and word == last_word:
+				index = 6
+			if index != -1:
+				for act in acts:
+					temp_dpa.setdefault(act, [0] * 8)[index] += 1
+			last_word = word
 
 	return temp_dpa
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class Vocabulary:
+	"""
+	A Vocabulary interns strings, assigning each unique string a small integer ID in order of first appearance. Text
+	can then be stored as a compact array of IDs, with each unique string being kept in memory exactly once.
+	"""
+	def __init__(self, words=None):
+		"""
+		Creates a Vocabulary object.
+		:param words:an optional list of strings to intern, in ID order
+		:type words:list
+		"""
+		self.__ids = {}
+		self.__words = []
+		if words is not None:
+			for word in words:
+				self.intern(word)
+
+	def __len__(self):
+		return len(self.__words)
+
+	def __contains__(self, word):
+		return word in self.__ids
+
+	def intern(self, word):
+		"""
+		Returns the ID of the given string, adding it to the vocabulary if it has not been seen before.
+		:param word:the string to intern
+		:type word:str
+		:return:the ID of the given string
+		:rtype:int
+		"""
+		try:
+			return self.__ids[word]
+		except KeyError:
+			word_id = len(self.__words)
+			self.__ids[word] = word_id
+			self.__words.append(word)
+			return word_id
+
+	def word(self, word_id):
+		""" Returns the string with the given ID. """
+		return self.__words[word_id]
+
+	def words(self):
+		""" Returns a list of all interned strings, in ID order. """
+		return list(self.__words)
+
+	def encode(self, tokens):
+		"""
+		Returns an array of IDs for the given tokens, interning any new tokens.
+		:param tokens:a list of strings
+		:type tokens:list
+		:return:an array of IDs
+		:rtype:array
+		"""
+		return array('I', map(self.intern, tokens))
+
+	def decode(self, ids):
+		""" Returns a list of the strings for the given IDs. """
+		words = self.__words
+		return [words[i] for i in ids]
+
+	def view(self, ids):
+		""" Returns a read-only, list-like view of the strings for the given IDs. """
+		return TokenView(self, ids)
+
+	def count(self, ids):
+		"""
+		Returns an array of frequencies indexed by ID (similar to numpy.bincount). IDs that do not occur in the given
+		array have a frequency of zero.
+		:param ids:an array of IDs
+		:type ids:array
+		:return:an array of frequencies, one for each word in the vocabulary
+		:rtype:array
+		"""
+		counts = array('I', [0]) * len(self.__words)
+		for (word_id, count) in Counter(ids).items():
+			counts[word_id] = count
+
+		return counts
+
+	def typify(self, ids):
+		"""
+		Returns a sorted list of (type, frequency) pairs for the given IDs, equivalent to Util.typify().
+		:param ids:an array of IDs
+		:type ids:array
+		:return:a sorted list of (type, frequency) pairs
+		:rtype:list
+		"""
+		return self.types(self.count(ids))
+
+	def types(self, counts):
+		"""
+		Returns a sorted list of (type, frequency) pairs, given an array of frequencies indexed by ID or a dictionary
+		mapping IDs to frequencies.
+		"""
+		words = self.__words
+		pairs = counts.items() if isinstance(counts, dict) else enumerate(counts)
+		return sorted((words[i], c) for (i, c) in pairs if c > 0)
+
+
+class TokenView(Sequence):
+	"""
+	A TokenView is a read-only sequence of strings backed by an array of IDs into a Vocabulary. Strings are only looked
+	up when they are accessed, and a TokenView compares equal to a list containing the same strings.
+	"""
+	def __init__(self, vocabulary, ids):
+		"""
+		Creates a TokenView object.
+		"""
+		self.__vocabulary = vocabulary
+		self.__ids = ids
+
+	def __len__(self):
+		return len(self.__ids)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return self.__vocabulary.decode(self.__ids[index])
+		return self.__vocabulary.word(self.__ids[index])
+
+	def __iter__(self):
+		word = self.__vocabulary.word
+		for word_id in self.__ids:
+			yield word(word_id)
+
+	def __eq__(self, other):
+		if isinstance(other, (list, tuple, TokenView)):
+			return len(self) == len(other) and all(a == b for (a, b) in zip(self, other))
+		return NotImplemented
+
+	def __repr__(self):
+		return repr(list(self))
+
+	def ids(self):
+		""" Returns the underlying array of IDs. """
+		return self.__ids
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from array import array
+import zlib
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.Extractor import Extractor
+from splat.SPLAT import SPLAT
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class FeatureMatrix:
+	"""
+	A FeatureMatrix turns many SPLATs into the input of a classifier: one row per document. Its dense part has a column
+	for each numeric feature (see Extractor.features), and a column for each key of a feature that is a dictionary of
+	numbers, such as disfluencies. Its sparse part counts the n-grams of each document, using the hashing trick: each
+	n-gram is hashed straight to one of n_features columns, so no vocabulary is built and no second pass is needed.
+
+	Documents are added one at a time, and only their rows are kept, in flat arrays: the dense values in row order and
+	the sparse counts in compressed sparse row (CSR) form. Memory grows with the matrices themselves, not with the size
+	of the corpus. NumPy is only needed by dense(), and SciPy by sparse().
+	"""
+	def __init__(self, features=None, ngrams=None, n_features=1048576, alternate_sign=True):
+		"""
+		Creates an empty FeatureMatrix object.
+		:param features:the names of the features of the dense matrix (see Extractor.features)
+		:type features:list
+		:param ngrams:the sizes of the n-grams counted by the sparse matrix, such as [1, 2]
+		:type ngrams:list
+		:param n_features:the number of columns of the sparse matrix
+		:type n_features:int
+		:param alternate_sign:whether half of the n-grams are counted negatively, so that collisions tend to cancel out
+		:type alternate_sign:bool
+		"""
+		self.__features = list(features) if features is not None else []
+		self.__ngrams = list(ngrams) if ngrams is not None else []
+		for name in self.__features:
+			if name not in Extractor.features:
+				raise ValueError("WARNING: Unknown feature: " + str(name) + ".")
+		for n in self.__ngrams:
+			if n < 1:
+				raise ValueError("WARNING: The size of an n-gram must be positive.")
+		if n_features < 1:
+			raise ValueError("WARNING: A hashed matrix needs at least one column.")
+		self.n_features = n_features
+		self.alternate_sign = alternate_sign
+
+		# The columns of the dense matrix are known once the first document is added.
+		self.__columns = None
+		self.__values = array('d')
+		self.__data, self.__indices, self.__indptr = array('d'), array('l'), array('l', [0])
+
+	def __len__(self):
+		""" Returns the number of rows. """
+		return len(self.__indptr) - 1
+
+	@property
+	def columns(self):
+		""" Returns the name of each column of the dense matrix, in order. """
+		return list(self.__columns) if self.__columns is not None else []
+
+	def column(self, name):
+		"""
+		Returns the index of the named column of the dense matrix.
+		:param name:a feature name, or "feature:key" for a key of a feature that is a dictionary
+		:type name:str
+		:return:the index of the column
+		:rtype:int
+		"""
+		if self.__columns is None or name not in self.__columns:
+			raise ValueError("WARNING: The feature matrix has no column " + str(name) + ".")
+		return self.__columns.index(name)
+
+	def hash(self, ngram):
+		"""
+		Returns the column of the sparse matrix that counts the given n-gram, and the sign it is counted with. The hash
+		does not depend on the Python process, so the same n-gram always has the same column.
+		:param ngram:an n-gram, as a tuple of words
+		:type ngram:tuple
+		:return:a (column, sign) pair
+		:rtype:tuple
+		"""
+		h = zlib.crc32(" ".join(ngram).encode("utf-8"))
+		sign = -1.0 if self.alternate_sign and h & 0x80000000 else 1.0
+		return (h % self.n_features, sign)
+
+	def __dense_row(self, values):
+		""" Returns the dense row of a document from its feature values, fixing the columns on the first document. """
+		names, row = [], []
+		for name in self.__features:
+			value = values[name]
+			if isinstance(value, dict):
+				for key in sorted(value.keys()):
+					names.append(name + ":" + str(key))
+					row.append(value[key])
+			else:
+				names.append(name)
+				row.append(value)
+		for (name, value) in zip(names, row):
+			if isinstance(value, bool) or not isinstance(value, (int, float)):
+				raise ValueError("WARNING: " + name + " is not a number, so it cannot be a column of a feature matrix.")
+		if self.__columns is None:
+			self.__columns = names
+		elif names != self.__columns:
+			raise ValueError("WARNING: The features of this document do not have the same keys as those of the first "
+							 "document, so they cannot share the columns of a feature matrix.")
+		return row
+
+	def add(self, doc):
+		"""
+		Adds a row for the given document.
+		:param doc:a SPLAT, or a text or filename to create one from
+		:type doc:SPLAT,str,filename
+		"""
+		if not isinstance(doc, SPLAT):
+			doc = SPLAT(doc)
+
+		if len(self.__features) > 0:
+			self.__values.extend(self.__dense_row(Extractor().extract(doc, self.__features, parallel=False)))
+		elif self.__columns is None:
+			self.__columns = []
+
+		# Each n-gram is counted in its column straight away; only this document's columns are held while it is added.
+		row = {}
+		for n in self.__ngrams:
+			for (ngram, count) in doc.ngram_counts(n).items():
+				(index, sign) = self.hash(ngram)
+				row[index] = row.get(index, 0.0) + sign * count
+		for index in sorted(row.keys()):
+			if row[index] != 0.0:
+				self.__indices.append(index)
+				self.__data.append(row[index])
+		self.__indptr.append(len(self.__indices))
+
+	def add_all(self, docs):
+		"""
+		Adds a row for each of the given documents, in order. The documents may be a generator, so that only one of
+		them is held at a time.
+		:param docs:an iterable of SPLATs, or of texts or filenames to create them from
+		:type docs:iterable
+		:return:this FeatureMatrix
+		:rtype:FeatureMatrix
+		"""
+		for doc in docs:
+			self.add(doc)
+		return self
+
+	def csr(self):
+		"""
+		Returns copies of the three CSR arrays of the sparse matrix: the value of each stored entry, its column, and the
+		offset of the first entry of each row (followed by the number of entries).
+		:return:a (data, indices, indptr) tuple of arrays
+		:rtype:tuple
+		"""
+		return (array('d', self.__data), array(self.__indices.typecode, self.__indices),
+				array(self.__indptr.typecode, self.__indptr))
+
+	def dense(self):
+		"""
+		Returns the dense matrix, with a row per document and a column per name in columns. Requires NumPy.
+		:return:a two-dimensional array of floats
+		:rtype:numpy.ndarray
+		"""
+		try:
+			import numpy
+		except ImportError:
+			raise ValueError("WARNING: A dense feature matrix requires NumPy; try 'pip3 install numpy'.")
+		# A copy, so that the matrix can still grow, and cannot be changed, while the caller holds the result.
+		return numpy.array(self.__values, dtype='d').reshape((len(self), len(self.columns)))
+
+	def sparse(self):
+		"""
+		Returns the hashed n-gram counts, with a row per document and n_features columns. Requires SciPy.
+		:return:a sparse matrix
+		:rtype:scipy.sparse.csr_matrix
+		"""
+		try:
+			import numpy
+			from scipy.sparse import csr_matrix
+		except ImportError:
+			raise ValueError("WARNING: A sparse feature matrix requires SciPy; try 'pip3 install scipy'.")
+		# Copies, as in dense(); csr_matrix() does not copy the arrays it is given.
+		arrays = (numpy.array(self.__data, dtype='d'), numpy.array(self.__indices, dtype=self.__indices.typecode),
+				  numpy.array(self.__indptr, dtype=self.__indptr.typecode))
+		return csr_matrix(arrays, shape=(len(self), self.n_features))
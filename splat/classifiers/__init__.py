@@ -10,3 +10,9 @@
 ### @LICENSE_TYPE:		MIT																							 ###
 ########################################################################################################################
 ########################################################################################################################
+
+"""
+This package contains the following files:
+	[01] FeatureMatrix.py
+			Turns many SPLATs into the dense feature matrix and the hashed, sparse n-gram matrix of a classifier.
+"""
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 
 ##### PYTHON IMPORTS ###################################################################################################
+from multiprocessing import Pool, current_process
 import re, difflib, itertools
+from collections import Counter
 
 ##### NLTK IMPORTS #####################################################################################################
 from nltk.tree import Tree
 
 ##### SPLAT IMPORTS ####################################################################################################
 from splat.Util import open_class_list, ignore_list, proposition_list, closed_class_list
-from splat.corpora import PROPER_NAMES, CMUDICT
+import splat.corpora as corpora
 import splat.complexity.idea_density
 
 ########################################################################################################################
@@ -26,19 +28,30 @@ import splat.complexity.idea_density
 
 ########################################################################################################################
 
+def word_syllables(token):
+	""" Returns the number of syllables in a single word, according to the CMU Pronouncing Dictionary. """
+	word = token.strip("\n")
+	cmu_dict = corpora.cmu_dict()
+	try:
+		pron = cmu_dict[word.lower()]
+	except KeyError:
+		closest = difflib.get_close_matches(word.lower(), cmu_dict.keys(), 1)[0]
+		pron = cmu_dict[closest]
+
+	return max([len(list(y for y in x if y[-1].isdigit())) for x in pron])
+
 def num_syllables(tokens):
-	total = 0
-	pron = []
-	for token in tokens:
-		word = token.strip("\n")
-		try:
-			pron = CMUDICT[word.lower()]
-		except KeyError:
-			closest = difflib.get_close_matches(word.lower(), CMUDICT.keys(), 1)[0]
-			pron = CMUDICT[closest]
+	""" Returns the number of syllables in the given tokens. """
+	return num_type_syllables(Counter(tokens).items())
 
-		temp_count = max([len(list(y for y in x if y[-1].isdigit())) for x in pron])
-		total += temp_count
+def num_type_syllables(types):
+	"""
+	Returns the number of syllables, given a list of (type, frequency) pairs. Each type is only looked up once, no
+	matter how many times it occurs.
+	"""
+	total = 0
+	for (word, count) in types:
+		total += word_syllables(word) * count
 
 	return total
 
@@ -53,7 +66,7 @@ def count_syllables(tokens):
 	for token in tokens:
 		word = token.strip("\n")
 		vowels = ['a', 'e', 'i', 'o', 'u', 'y']
-		diphthongs = ["ia","ea"] if word in PROPER_NAMES else ["ia"]
+		diphthongs = ["ia","ea"] if word in corpora.proper_names() else ["ia"]
 		non_ending_syllables = ["ie","ya","es","ed"]
 		curr_word = word.lower()
 		vowel_count = 0
@@ -128,6 +141,16 @@ def calc_content_density(treestrings):
 			markers for detecting Mild Cognitive Impairment. In Proceedings of the 2nd International Conference on
 			Technology and Aging (ICTA).
 
+	"""
+	return summarize_densities(calc_content_densities(treestrings))
+
+def calc_content_densities(treestrings):
+	"""
+	Calculate the content density of each of the given parse trees (see calc_content_density()).
+	:param treestrings:a list of parse trees
+	:type treestrings:list
+	:return:a list with the content density of each tree, or None for a tree without any tagged words
+	:rtype:list
 	"""
 	results = []
 	for t in treestrings:
@@ -135,7 +158,7 @@ def calc_content_density(treestrings):
 		closed_class_count = 0.0
 		tags = re.findall("\((\S+) [^\(^\)]*\)", t)
 		if not tags:
-			return 0
+			results.append(None)
 		else:
 			for tag in tags:
 				if tag in open_class_list:
@@ -147,16 +170,23 @@ def calc_content_density(treestrings):
 				else:
 					print("WARNING: Unknown tag " + tag + "\n")
 
-		results.append(float(open_class_count / closed_class_count) if closed_class_count != 0 else 0)
+			results.append(float(open_class_count / closed_class_count) if closed_class_count != 0 else 0)
 
-	# print("RESULTS: " + str(results))
-	# print("MEAN: " + str(float(sum(results) / len(results))))
-	# print("MIN: " + str(float(min(results))))
-	# print("MAX: " + str(float(max(results))))
+	return results
 
-	return float(sum(results)/len(results)), float(min(results)), float(max(results))
+def summarize_densities(densities):
+	"""
+	Returns the (mean, min, max) of the given per-tree densities, or 0 if any of the trees had no tagged words.
+	:param densities:a list of densities, as returned by calc_content_densities() or idea_density.calc_ideas()
+	:type densities:list
+	:return:a (mean, min, max) tuple
+	:rtype:tuple
+	"""
+	if None in densities:
+		return 0
+	return float(sum(densities)/len(densities)), float(min(densities)), float(max(densities))
 
-def calc_idea_density(treestrings):
+def calc_idea_density(treestrings, speech_mode=False):
 	"""
 	Calculate the idea density (also known as proposition density or p-density).
 
@@ -178,8 +208,54 @@ def calc_idea_density(treestrings):
 			markers for detecting Mild Cognitive Impairment. In Proceedings of the 2nd International Conference on
 			Technology and Aging (ICTA).
 
+	With speech_mode=True, the idea-counting rules for transcribed speech are applied.
 	"""
-	return idea_density.calc_idea(treestrings)
+	return idea_density.calc_idea(treestrings, speech_mode)
+
+def _chunk_densities(chunk, speech_mode=False):
+	""" Returns the content and idea densities of each tree of the given chunk of parse trees. """
+	return calc_content_densities(chunk), idea_density.calc_ideas(chunk, speech_mode)
+
+def _chunk_densities_star(args):
+	""" Calls _chunk_densities() with the given (chunk, speech_mode) pair, for Pool.imap(). """
+	return _chunk_densities(*args)
+
+def calc_densities(treestrings, processes=None, chunk_size=256, speech_mode=False):
+	"""
+	Calculate the content density and the idea density of each of the given parse trees, along with their (mean, min,
+	max) (see calc_content_density() and calc_idea_density()). Each tree is handled on its own, so the trees are split
+	into chunks of chunk_size trees, which are spread across a pool of processes.
+	:param treestrings:a list of parse trees
+	:type treestrings:list
+	:param processes:the number of processes (by default, the number of CPUs); with 1, the trees are handled in this
+	process
+	:type processes:int
+	:param chunk_size:the number of trees given to a process at a time
+	:type chunk_size:int
+	:param speech_mode:whether to apply the idea-counting rules for transcribed speech (see
+	idea_density.apply_counting_rules())
+	:type speech_mode:bool
+	:return:a dictionary mapping "content_densities" and "idea_densities" to the list of densities of each tree (with
+	None for a tree without any tagged words), and "content_density" and "idea_density" to their (mean, min, max)
+	:rtype:dict
+	"""
+	if chunk_size < 1:
+		raise ValueError("WARNING: The chunk size must be positive.")
+	chunks = [(treestrings[i:i + chunk_size], speech_mode) for i in range(0, len(treestrings), chunk_size)]
+	# A worker process of a Pool (such as a Batch's) cannot start a Pool of its own.
+	if processes == 1 or len(chunks) <= 1 or current_process().daemon:
+		results = map(_chunk_densities_star, chunks)
+	else:
+		with Pool(processes) as pool:
+			results = pool.map(_chunk_densities_star, chunks)
+
+	content, ideas = [], []
+	for (chunk_content, chunk_ideas) in results:
+		content.extend(chunk_content)
+		ideas.extend(chunk_ideas)
+
+	return {"content_densities": content, "idea_densities": ideas, "content_density": summarize_densities(content),
+			"idea_density": summarize_densities(ideas)}
 
 # The code contained in this section was adapted based on the code located here:
 # https://github.com/neubig/util-scripts/blob/96c91e43b650136bb88bbb087edb1d31b65d389f/syntactic-complexity.py
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from collections import Counter
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+"""
+Character-level features. Every function in this module works from (type, count) pairs rather than from the raw token
+stream, so the tokens are only ever visited once (when they are typified) and the work done here scales with the size
+of the vocabulary rather than with the length of the text.
+"""
+
+def get_mean_length(histogram):
+	""" Returns the mean word length, given a word-length histogram. """
+	total = sum(histogram.values())
+	if total == 0:
+		return 0.0
+
+	return round(float(sum(length * count for (length, count) in histogram.items())) / float(total), 4)
+
+def get_length_percentile(histogram, percentile):
+	"""
+	Returns the word length at the given percentile (nearest-rank method), given a word-length histogram.
+	:param histogram:a dictionary of word lengths and their frequencies
+	:type histogram:dict
+	:param percentile:a number between 0 and 100
+	:type percentile:int,float
+	:return:the word length at the given percentile
+	:rtype:int
+	"""
+	if percentile < 0 or percentile > 100:
+		raise ValueError("WARNING: Percentile must be between 0 and 100.")
+	total = sum(histogram.values())
+	if total == 0:
+		return 0
+
+	rank = max(1, -(-percentile * total // 100))
+	seen = 0
+	for length in sorted(histogram.keys()):
+		seen += histogram[length]
+		if seen >= rank:
+			return length
+
+	return max(histogram.keys())
+
+def get_char_ngrams(types, n):
+	"""
+	Returns a dictionary of character n-grams and their frequencies. N-grams do not cross word boundaries, and words
+	shorter than n do not contribute any n-grams.
+	:param types:a list of (type, count) pairs
+	:type types:list
+	:param n:the size of each character n-gram
+	:type n:int
+	:return:a dictionary of character n-grams and their frequencies
+	:rtype:dict
+	"""
+	if n < 1:
+		raise ValueError("WARNING: Character n-grams must be of size 1 or greater.")
+	ngrams = Counter()
+	for (word, count) in types:
+		for i in range(len(word) - n + 1):
+			ngrams[word[i:i+n]] += count
+
+	return dict(ngrams)
+
+def calc_char_features(types):
+	"""
+	Computes the word-length features for the given types in a single pass.
+	:param types:a list of (type, count) pairs
+	:type types:list
+	:return:a dictionary containing the word-length histogram, the mean word length, and the longest and shortest words
+	:rtype:dict
+	"""
+	histogram = Counter()
+	longest, shortest = set(), set()
+	max_len, min_len = -1, -1
+	for (word, count) in types:
+		length = len(word)
+		histogram[length] += count
+		if length > max_len:
+			max_len, longest = length, {word}
+		elif length == max_len:
+			longest.add(word)
+		if min_len == -1 or length < min_len:
+			min_len, shortest = length, {word}
+		elif length == min_len:
+			shortest.add(word)
+
+	histogram = dict(histogram)
+
+	return {"histogram": histogram, "mean": get_mean_length(histogram), "longest": longest, "shortest": shortest}
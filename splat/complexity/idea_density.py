@@ -3,6 +3,9 @@
 ##### PYTHON IMPORTS ###################################################################################################
 import re
 
+##### SPLAT IMPORTS ####################################################################################################
+import splat.complexity
+
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
 ### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
@@ -79,7 +82,12 @@ PUNCT = [":", ",", "."]
 ########################################################################################################################
 
 class WordObj:
-	""" Helper class for organizations features associated with a word. """
+	"""
+	Helper class for organizations features associated with a word. A WordObj is made for every word of every parse
+	tree, so its fields are slots rather than a dictionary, which makes each one several times smaller.
+	"""
+	__slots__ = ("token", "tag", "isprop", "isword", "rulenumber")
+
 	def __init__(self, token="", tag="", isprop=False, isword=False, rulenumber=0):
 		""" Constructor. """
 		self.token = token
@@ -114,7 +122,456 @@ def likely_repetition(first_string, second_string):
 
 	return False
 
+##### CATEGORY TABLES ##################################################################################################
+
+def category(words):
+	"""
+	Returns the given word class as a set, for the counting rules. contains() gives the index of the item it finds, so
+	the first item of each list has always been treated as absent; it is left out here so that the rules give the same
+	proposition counts as before.
+	"""
+	return frozenset(words) - {words[0]}
+
+ADJ_TAGS = category(ADJ)
+ADV_TAGS = category(ADV)
+VRB_TAGS = category(VRB)
+NOUN_TAGS = category(NOUN)
+INTERR_TAGS = category(INTERR)
+PROP_TAGS = category(PROP)
+FILLER_TOKENS = category(FILLER)
+BE_TOKENS = category(BE)
+NT_TOKENS = category(NT)
+AUX_TOKENS = category(AUX)
+LINKING_TOKENS = category(LINKING)
+CLINKING_TOKENS = category(CLINKING)
+CORREL_TOKENS = category(CORREL)
+NEGPOL1_TOKENS = category(NEGPOL1)
+NEGPOL2_TOKENS = category(NEGPOL2)
+
+# Words and their tags, as they appear in a parse tree.
+TAG_TOKEN_PATTERN = re.compile(r"\((\S+) ([^\(^\)]+)\)")
+WORD_PATTERN = re.compile(r"[\d\w]")
+
 ##### RULES FOR IDEA-COUNTING ##########################################################################################
+## Each rule is given the list of words and the index of the current word, and returns the index of the current word,
+## which only changes when the rule steps backward. Rules refer back from the current word; in other words, rules are
+## triggered by the last word matching the pattern they are looking for.
+
+##### RULE GROUP 000 - Identify Words and Adjust Tags ##################################################################
+
+##### RULE 001 #####
+## The symbol '^' is used to mark broken-off spoken sentences.
+##
+## NOTE: I have chosen to ignore this rule because it does not seem to apply to the sorts of input SPLAT is expecting.
+
+def rule_002(word_list, i):
+	""" The item is a word if its token starts with a letter or digit and its tag is not SYM (symbol). """
+	if WORD_PATTERN.search(word_list[i].token) and word_list[i].tag != "SYM":
+		word_list[i].isword = True
+		word_list[i].rulenumber = 2
+	return i
+
+def rule_003(word_list, i):
+	""" Two cardinal numbers in immediate succession are combined into one. This is very uncommon. """
+	if word_list[i].tag == "CD" and i > 0:
+		if word_list[i-1].tag == "CD":
+			# adjust token
+			word_list[i-1].token = word_list[i-1].token + " " + word_list[i].token
+			word_list[i-1].rulenumber = 3
+			i -= 1 # step backward 1
+			word_list.pop(i+1) # delete forward 1
+	return i
+
+def rule_004(word_list, i):
+	"""
+	Handling of factions, decimals, etc. If the current token is a number, the preceding token contains some
+	characters, the first of which is nonalphanumeric and the pre-preceding token is also a number, adjust.
+	"""
+	if word_list[i].tag == "CD" and len(word_list[i-1].token) > 0 and not WORD_PATTERN.search(word_list[i-1].token) \
+		and word_list[i-2].tag == "CD":
+		word_list[i-2].token = word_list[i-2].token + word_list[i-1].token + word_list[i].token
+		word_list[i-2].rulenumber = 4
+		i -= 2  # step backward 2
+		word_list.pop(i + 1) # delete forward 1
+		word_list.pop(i + 1) # delete forward 1
+	return i
+
+def rule_020(word_list, i):
+	"""
+	Repetition of the form "A A" is simplified to "A". The first "A" can be an initial substring of the second one. Both
+	remain in the word count.
+	"""
+	if likely_repetition(word_list[i - 1].token, word_list[i].token):
+		# Mark the first A as to be ignored
+		word_list[i-1].isprop = False
+		word_list[i-1].isword = False
+		word_list[i-1].tag = ""
+		word_list[i-1].rulenumber = 20
+	return i
+
+##### RULE 021 #####
+## Repetition of the form "A Punctuation A" is simplified to "A". Both "A"s remain in the word count. The first "A" may
+## be an initial substring of the second one. Punctuation is anything tagged ".", ",", or ":".
+##### RULE 022 #####
+## Repetition of the form "A B A" is simplified to "A B". Both "A"s remain in the word count. The first A may be an
+## initial substring of the second one.
+##### RULE 023 #####
+## Repetition of the form "A B Punctuation A B" is simplified to "A B". Both "A"s and "B"s remain in the word count. The
+## first "A" (or "B") can be an initial substring of the second one. Punctuation is anything with tag ".", ",", or ":".
+##
+## NOTE: Rules 021 to 023 are disabled.
+
+def rule_050(word_list, i):
+	""" 'not' and any word ending in "n't" are not putatively propositions and their tag is changed to NOT. """
+	if word_list[i].token == "not" or word_list[i].token[-3:] == "n't" or word_list[i].token in NT_TOKENS:
+		word_list[i].isprop = True
+		word_list[i].tag = "NOT"
+		word_list[i].rulenumber = 50
+	return i
+
+def rule_054(word_list, i):
+	""" "that/DT" or "this/DT" is a pronoun, not a determiner, if the following word is a verb or an adverb. """
+	if (word_list[i-1].token == "that" or word_list[i-1].token == "this") and (word_list[i].tag in VRB_TAGS or
+		word_list[i].tag in ADV_TAGS):
+		word_list[i-1].tag = "PRP"
+		word_list[i-1].rulenumber = 54
+		word_list[i-1].isprop = False
+	return i
+
+##### RULE GROUP 100 - Word Order Adjustment ###########################################################################
+
+def rule_101(word_list, i):
+	"""
+	If the current word is an auxiliary word, and 1) the current word is the first word of the sentence, or 2) the
+	sentence begins with an interrogative, move the current word rightward to put it in front of the first verb, or at
+	the end of the sentence. In some cases, this will move a word too far to the right, but the effect of this on
+	proposition counting is benign.
+	"""
+	if word_list[i].token in AUX_TOKENS:
+		sent_start = sent_beginning(word_list, i)
+		if sent_start == i or word_list[sent_start].tag in INTERR_TAGS:
+			dest = i # destination
+			while dest < len(word_list) - 1:
+				dest += 1
+				if word_list[dest].tag == "." or word_list[dest].tag in VRB_TAGS: break
+			if dest > (i + 1):
+				word_list.insert(dest, WordObj(word_list[i].token, word_list[i].tag, True, True, 101))
+				word_list[i].tag = ""
+				word_list[i].isprop = False
+				word_list[i].isword = False
+				word_list[i].token += "/moved"
+	return i
+
+##### RULE GROUP 200 - Preliminary Proposition Identification ##########################################################
+
+def rule_200(word_list, i):
+	""" The tags in PROP are taken to indicate propositions. """
+	if word_list[i].tag in PROP_TAGS:
+		word_list[i].isprop = True
+		word_list[i].rulenumber = 200
+	return i
+
+def rule_201(word_list, i):
+	""" The tokens 'the', 'a', and 'an' are not propositions. """
+	if word_list[i].token == "the" or word_list[i].token == "an" or word_list[i].token == "a":
+		word_list[i].isprop = False
+		word_list[i].rulenumber = 201
+	return i
+
+##### RULE 202 #####
+## An attributive noun (such as 'lion' in 'ion tamer') is a proposition, similar to an adjective.
+##
+## Excluding this rule results in better agreement with Turner & Greene.
+
+def rule_203(word_list, i):
+	"""
+	The first word in a correlating conjunction ('either...or', 'neither...nor', 'both...and', etc.) is not a
+	proposition. The second word is tagged CC; the first word may have been tagged CC, RB, or DT.
+	NOTE: 'nor' is tagged as RB once in the Switchboard Corpus.
+	"""
+	if word_list[i].tag == "CC" and word_list[i].token not in CORREL_TOKENS:
+		for j in range(i - 1, max(i - 11, -1), -1):
+			if word_list[j].token in CORREL_TOKENS:
+				word_list[j].isprop = False
+				word_list[j].rulenumber = 203
+				break
+	return i
+
+def rule_204(word_list, i):
+	""" The bigrams 'and then' and 'or else' are each a single proposition. """
+	if (word_list[i-1].token == "and" and word_list[i].token == "then") or \
+		(word_list[i-1].token == "or" and word_list[i].token == "else"):
+		word_list[i].isprop = False
+		word_list[i].rulenumber = 204
+	return i
+
+def rule_206(word_list, i):
+	""" The token 'to' is not a proposition when it is the last word in a sentence. """
+	if word_list[i].tag == "." and word_list[i-1].tag == "TO":
+		word_list[i-1].isprop = False
+		word_list[i-1].rulenumber = 206
+	return i
+
+def rule_207(word_list, i):
+	""" Modal is a proposition when it is last word in sentence. """
+	if word_list[i].tag == "." and word_list[i-1].tag == "MD":
+		word_list[i-1].isprop = True
+		word_list[i-1].rulenumber = 207
+	return i
+
+def rule_210(word_list, i):
+	"""
+	Cardinal numbers are propositions (only) if there is a NOUN within five words after it (not crossing a sentence
+	boundary). This rule ensures that 'in 3 parts' is two propositions, but 'in 1941' is only one.
+	"""
+	if word_list[i].tag == "CD":
+		word_list[i].isprop = False
+		word_list[i].rulenumber = 210
+		for j in range(i + 1, min(i + 7, len(word_list))):
+			if word_list[j].tag in NOUN_TAGS:
+				word_list[i].isprop = True
+				break
+	return i
+
+def rule_211(word_list, i):
+	"""
+	Pairs such as 'not...unless' are counted as a single proposition, with the second word in the pair being tagged as
+	a proposition.
+	"""
+	if word_list[i].token in NEGPOL2_TOKENS:
+		for j in range(i - 1, -1, -1):
+			if word_list[j].tag == "NOT":
+				word_list[j].isprop = False
+				word_list[j].rulenumber = 211
+				break
+	return i
+
+def rule_212(word_list, i):
+	"""
+	Pairs such as 'not...any' are counted as a single proposition, with the first word in the pair being tagged as a
+	proposition.
+	"""
+	if word_list[i].token in NEGPOL1_TOKENS:
+		for j in range(i - 1, max(i - 11, -1), -1):
+			if word_list[j].tag == "NOT":
+				word_list[i].isprop = False
+				word_list[i].rulenumber = 212
+				break
+	return i
+
+def rule_213(word_list, i):
+	""" The bigram 'going to' is not a proposition when is immediately precedes a verb. """
+	if word_list[i].tag in VRB_TAGS and word_list[i-1].token == "to" and word_list[i-2].token == "going":
+		word_list[i-1].isprop = False
+		word_list[i-1].rulenumber = 213
+		word_list[i-2].isprop = False
+		word_list[i-2].rulenumber = 213
+	return i
+
+def rule_214(word_list, i):
+	"""
+	The pair 'if...then' is a single conjunction, not two. This rule actually checks for 'if...then (token)' because
+	'then' as the last word of a sentence is most likely an adverb.
+	"""
+	if word_list[i].isword and word_list[i-1].token == "then":
+		for j in range(i - 1, max(i - 11, -1), -1):
+			if word_list[j].token == "if":
+				word_list[i-1].isprop = False
+				word_list[i-1].rulenumber = 214
+				break
+	return i
+
+def rule_225(word_list, i):
+	""" The bigram 'each other' is a pronoun and should be tagged as 'PRP PRP'. """
+	if word_list[i].token == "other" and word_list[i-1].token == "each":
+		word_list[i].tag = word_list[i-1].tag = "PRP"
+		word_list[i].isprop = word_list[i-1].isprop = False
+		word_list[i].rulenumber = word_list[i-1].rulenumber = 225
+	return i
+
+def rule_230(word_list, i):
+	""" The bigrams 'how come' and 'how many' are considered one proposition, not two. """
+	if (word_list[i].token == "come" or word_list[i].token == "many") and word_list[i-1].token == "how":
+		word_list[i].isprop = False
+		word_list[i].tag = word_list[i-1].tag
+		word_list[i].rulenumber = 230
+	return i
+
+##### RULE GROUP 300 - Linking Verbs ###################################################################################
+
+def rule_301(word_list, i):
+	"""
+	A linking verb is not a proposition if it precedes an adjective or an adverb. (Apparently, adverbs are frequent
+	tagging mistakes for adjectives.)
+	"""
+	if (word_list[i].tag in ADJ_TAGS or word_list[i].tag in ADV_TAGS) and word_list[i-1].token in LINKING_TOKENS:
+		word_list[i-1].isprop = False
+		word_list[i-1].rulenumber = 301
+	return i
+
+def rule_302(word_list, i):
+	"""
+	The token 'be' is not a proposition when it precedes a pr(e)position.
+	TODO: Modify to allow for intervening adverbs.
+	"""
+	if word_list[i].tag == "IN" and word_list[i-1].token in BE_TOKENS:
+		word_list[i-1].isprop = False
+		word_list[i-1].rulenumber = 302
+	return i
+
+def rule_310(word_list, i):
+	"""
+	Sequences of the following form are considered to be two propositions: Linking Verb + Adverb + ( PDT || DT ). For
+	example, 'he is now the president'. This would not be counted because of RULE 201.
+	"""
+	if word_list[i].tag == "DT" or word_list[i].tag == "PDT":
+		if word_list[i-1].tag in ADV_TAGS and word_list[i-2].token in LINKING_TOKENS:
+			word_list[i-1].isprop = True
+			word_list[i-1].rulenumber = 310
+			word_list[i-2].isprop = True
+			word_list[i-2].rulenumber = 310
+	return i
+
+def rule_311(word_list, i):
+	"""
+	Causative linking verbs (such as 'make it better') and similar phrases do not count the adjective as a new
+	proposition because the verb was counted.
+	"""
+	if word_list[i].tag in ADJ_TAGS:
+		for j in range(i - 1, max(i - 11, -1), -1):
+			if word_list[j].token in CLINKING_TOKENS:
+				word_list[i].isprop = False
+				word_list[i].rulenumber = 311
+				break
+	return i
+
+##### RULE GROUP 400 - Auxiliary Verbs Are Not Propositions ############################################################
+## NOTE: VERB is a list of tags, but AUX is a list of tokens.
+## NOTE: AUX is a subset of VERB.
+
+def rule_401(word_list, i):
+	""" Bigrams of the form 'AUX not' are considered one proposition, not two. """
+	if word_list[i].token == "not" and word_list[i-1].token in AUX_TOKENS:
+		word_list[i-1].isprop = False
+		word_list[i-1].rulenumber = 401
+	return i
+
+def rule_402(word_list, i):
+	""" Bigrams of the form 'AUX VERB' are considered one proposition, not two. """
+	if word_list[i].tag in VRB_TAGS and word_list[i-1].token in AUX_TOKENS:
+		word_list[i-1].isprop = False
+		word_list[i-1].rulenumber = 402
+	return i
+
+def rule_405(word_list, i):
+	"""
+	In trigrams of the form 'AUX NOT VERB', NOT and VERB are tagged as propositions. The same is true for trigrams of
+	the form 'AUX ADV VERB'. For example: 'had always sung', 'would rather go'.
+	"""
+	if (word_list[i].tag in VRB_TAGS and (word_list[i-1].tag == "NOT") or
+	   (word_list[i-1].tag in ADV_TAGS) and word_list[i-2].token in AUX_TOKENS):
+		word_list[i-2].isprop = False
+		word_list[i-2].rulenumber = 405
+	return i
+
+##### RULE GROUP 500 - Constructions Involving 'to' ####################################################################
+
+def rule_510(word_list, i):
+	""" Bigrams of the form 'TO VB' are considered to be one proposition, not two. """
+	if (word_list[i].tag == "VB") and (word_list[i-1].tag == "TO"):
+		word_list[i-1].isprop = False
+		word_list[i-1].rulenumber = 510
+	return i
+
+def rule_511(word_list, i):
+	""" In sequences of the form 'for...TO VB', 'for' is not a proposition. """
+	if (word_list[i].tag == "VB") and (word_list[i-1].tag == "TO"):
+		for j in range(i - 1, max(i - 11, -1), -1):
+			if word_list[j].token == "for":
+				word_list[j].isprop = False
+				word_list[j].rulenumber = 511
+				break
+	return i
+
+##### RULE 512 #####
+## When 'go', 'come', and their synonyms precede 'from' and 'to', 'from' and 'to' are considered to be one proposition,
+## not two.
+##
+## Excluding this rule results in better agreement with Turner & Greene.
+
+##### RULE GROUP 600 - Fillers #########################################################################################
+
+def rule_610(word_list, i):
+	""" A sentence consisting entirely of probable filler words is considered to be propositionless. """
+	if word_list[i].tag == ".":
+		sent_start = sent_beginning(word_list, i)
+		if all(word_list[j].tag == "UH" or word_list[j].token in FILLER_TOKENS for j in range(sent_start, i)):
+			for j in range(sent_start, i):
+				word_list[j].tag = ""
+				word_list[j].isprop = False
+				word_list[j].rulenumber = 610
+	return i
+
+def rule_632(word_list, i):
+	""" 'like' is considered to be a filler when it does not immediately follow BE. """
+	if word_list[i].token == "like" and word_list[i - 1].token not in BE_TOKENS:
+		word_list[i].tag = ""
+		word_list[i].isprop = False
+		word_list[i].rulenumber = 632
+	return i
+
+def rule_634(word_list, i):
+	""" The bigram 'you know' is considered to be a single word, not two. """
+	if word_list[i-1].token == "you" and word_list[i].token == "know":
+		i -= 1
+		word_list.pop(i+1)
+		word_list[i].token = "you_know"
+		word_list[i].tag = ""
+		word_list[i].isprop = False
+		word_list[i].isword = True
+		word_list[i].rulenumber = 634
+	return i
+
+# Each rule, in the order they are applied, with the tags or tokens of the current word that can trigger it (None for
+# a rule that any word can trigger) and whether it only applies in speech mode.
+RULES = [(2, rule_002, None, None, False), (3, rule_003, {"CD"}, None, False), (4, rule_004, {"CD"}, None, False),
+		 (20, rule_020, None, None, True), (50, rule_050, None, NT_TOKENS | {"not", "n't"}, False),
+		 (54, rule_054, VRB_TAGS | ADV_TAGS, None, False), (101, rule_101, None, AUX_TOKENS, False),
+		 (200, rule_200, PROP_TAGS, None, False), (201, rule_201, None, {"the", "an", "a"}, False),
+		 (203, rule_203, {"CC"}, None, False), (204, rule_204, None, {"then", "else"}, False),
+		 (206, rule_206, {"."}, None, False), (207, rule_207, {"."}, None, False), (210, rule_210, {"CD"}, None, False),
+		 (211, rule_211, None, NEGPOL2_TOKENS, False), (212, rule_212, None, NEGPOL1_TOKENS, False),
+		 (213, rule_213, VRB_TAGS, None, False), (214, rule_214, None, None, False),
+		 (225, rule_225, None, {"other"}, False), (230, rule_230, None, {"come", "many"}, False),
+		 (301, rule_301, ADJ_TAGS | ADV_TAGS, None, False), (302, rule_302, {"IN"}, None, False),
+		 (310, rule_310, {"DT", "PDT"}, None, False), (311, rule_311, ADJ_TAGS, None, False),
+		 (401, rule_401, None, {"not"}, False), (402, rule_402, VRB_TAGS, None, False),
+		 (405, rule_405, None, None, False), (510, rule_510, {"VB"}, None, False),
+		 (511, rule_511, {"VB"}, None, False), (610, rule_610, {"."}, None, True),
+		 (632, rule_632, None, {"like"}, True), (634, rule_634, None, {"know"}, True)]
+
+# The tokens that trigger at least one rule; every other token is looked up as None (or as "n't", see rule 050).
+TRIGGER_TOKENS = frozenset().union(*[tokens for (number, rule, tags, tokens, speech) in RULES if tokens is not None])
+# The rules that each (speech mode, tag, token) triggers, filled in as they are first seen.
+RULE_INDEX = {}
+
+def triggered_rules(word, speech_mode):
+	"""
+	Returns the (number, rule) pairs of the rules that the given word can trigger, in the order they are applied.
+	:param word:the current word
+	:type word:WordObj
+	:param speech_mode:whether the rules for transcribed speech apply
+	:type speech_mode:bool
+	:return:a list of (number, rule) pairs
+	:rtype:list
+	"""
+	token = word.token if word.token in TRIGGER_TOKENS else ("n't" if word.token[-3:] == "n't" else None)
+	key = (speech_mode, word.tag, token)
+	if key not in RULE_INDEX:
+		RULE_INDEX[key] = [(number, rule) for (number, rule, tags, tokens, speech) in RULES
+						   if (speech_mode or not speech) and (tags is None or word.tag in tags) and
+						   (tokens is None or token in tokens)]
+	return RULE_INDEX[key]
 
 def apply_counting_rules(word_list, speech_mode=False):
 	"""
@@ -128,18 +585,12 @@ def apply_counting_rules(word_list, speech_mode=False):
 	True when analyzing transcribed speech that contains repetitions and filler words. It may result in undercounting
 	of well-edited English.
 	"""
-	global ADJ, ADV, VRB, NOUN, INTERR, PROP, FILLER, BE, NT, COMEGO, AUX, BEING, BECOMING, SEEMING, LINKING,\
-		CLINKING, CORREL, NEGPOL1, NEGPOL2, PUNCT
-
 	"""
-	The following loop iterates over every word in the given list of words; it may add and/or remove words. The rules
-	refer back to the beginning of the current word; in other words, rules are triggered by the last word matching the
-	pattern it is looking for. It is guaranteed that there will be 10 null items at the beginning of the given list of
-	words; rules do not have to worry about going past the beginning of the list.
+	The following loop iterates over every word in the given list of words; it may add and/or remove words. Each word
+	only runs the rules that its tag or token can trigger (see RULES), in order. When a rule changes the tag or token of
+	the current word, or steps backward to another word, the remaining rules are chosen again for the word as it is now.
 
-	The majority of rules depend on the output of prior rules (see rule 200 for a good example). The algorithm could be
-	made more efficient by identifying rules that DO NOT feed a subsequent rule, and putting a "continue" statement in
-	them (see rule 000 for an example).
+	The majority of rules depend on the output of prior rules (see rule 200 for a good example).
 
 	Additions and deletions to the given word list take place AFTER the current location. For example, if the current
 	word is at index 'i', additions and deletions may occur at index 'i+1', but not at index 'i-1'. This prevents
@@ -152,426 +603,28 @@ def apply_counting_rules(word_list, speech_mode=False):
 	while i < len(word_list) - 1:
 		i += 1
 
-		################################################################################################################
-		##### RULE GROUP 000 - Identify Words and Adjust Tags ##########################################################
-		################################################################################################################
-
 		##### RULE 000 #####
-		## If it's a null item, skip the rest of these tests. There will always be at least 10 null items at the
-		## beginning so we can freely look back from the current position without running off the beginning of the list.
-		if word_list[i].token == "": continue
-
-		##### RULE 001 #####
-		## The symbol '^' is used to mark broken-off spoken sentences.
-		##
-		## NOTE: I have chosen to ignore this rule because it does not seem to apply to the sorts of input SPLAT is
-		## expecting.
-
-		##### RULE 002 #####
-		## The item is a word if its token starts with a letter or digit and its tag is not SYM (symbol).
-		if re.search("[\d\w]", word_list[i].token) and word_list[i].tag != "SYM":
-			word_list[i].isword = True
-			word_list[i].rulenumber = 2
-
-		##### RULE 003 #####
-		## Two cardinal numbers in immediate succession are combined into one. This is very uncommon.
-		if word_list[i].tag == "CD" and i > 0:
-			if word_list[i-1].tag == "CD":
-				# adjust token
-				word_list[i-1].token = word_list[i-1].token + " " + word_list[i].token
-				word_list[i-1].rulenumber = 3
-				i -= 1 # step backward 1
-				word_list.pop(i+1) # delete forward 1
-
-		##### RULE 004 #####
-		## Handling of factions, decimals, etc. If the current token is a number, the preceding token contains some
-		## characters, the first of which is nonalphanumeric and the pre-preceding token is also a number, adjust.
-		if word_list[i].tag == "CD" and len(word_list[i-1].token) > 0 and not re.search("[\d\w]", word_list[i-1].token)\
-			and word_list[i-2].tag == "CD":
-			word_list[i-2].token = word_list[i-2].token + word_list[i-1].token + word_list[i].token
-			word_list[i-2].rulenumber = 4
-			i -= 2  # step backward 2
-			word_list.pop(i + 1) # delete forward 1
-			word_list.pop(i + 1) # delete forward 1
-
-		##### RULE 020 #####
-		## Repetition of the form "A A" is simplified to "A". The first "A" can be an initial substring of the second
-		# one. Both remain in the word count.
-		if speech_mode:
-			if likely_repetition(word_list[i - 1].token, word_list[i].token):
-				# Mark the first A as to be ignored
-				word_list[i-1].isprop = False
-				word_list[i-1].isword = False
-				word_list[i-1].tag = ""
-				word_list[i-1].rulenumber = 20
-
-		##### RULE 021 #####
-		## Repetition of the form "A Punctuation A" is simplified to "A". Both "A"s remain in the word count. The first
-		## "A" may be an initial substring of the second one. Punctuation is anything tagged ".", ",", or ":".
-		##### RULE 022 #####
-		## Repetition of the form "A B A" is simplified to "A B". Both "A"s remain in the word count. The first A may
-		## be an initial substring of the second one.
-
-		"""
-		if speech_mode:
-			if likely_repetition(word_list[i-2].token, word_list[i].token) and not contains(PUNCT, word_list[i].tag):
-				# Mark the first A to be ignored
-				word_list[i-2].tag = ""
-				word_list[i-2].isword = False
-				word_list[i-2].isprop = False
-				word_list[i-2].rulenumber = 22
-				# Mark the punctuation mark to be ignored
-				if contains(PUNCT, word_list[i-1].tag):
-					word_list[i-1].tag = ""
-					word_list[i-1].isword = False
-					word_list[i-1].isprop = False
-					word_list[i-1].rulenumber = 21
-		"""
-
-		##### RULE 023 #####
-		## Repetition of the form "A B Punctuation A B" is simplified to "A B". Both "A"s and "B"s remain in the word
-		## count. The first "A" (or "B") can be an initial substring of the second one. Punctuation is anything with tag
-		## ".", ",", or ":".
-
-		"""
-		if speech_mode:
-			if likely_repetition(word_list[i-3].token, word_list[i].token) \
-				and likely_repetition(word_list[i-4].token, word_list[i-1].token) \
-				and (word_list[i-2].tag == "." or word_list[i-2].tag == "," or word_list[i-2].tag == ":"):
-				word_list[i-4].tag = word_list[i-3].tag = word_list[i-2].tag = ""
-				word_list[i-4].isword = word_list[i-3].isword = word_list[i-2].isword = False
-				word_list[i-4].isprop = word_list[i-3].isprop = word_list[i-2].isprop = False
-				word_list[i-4].rulenumber = word_list[i-3].rulenumber = word_list[i-2].rulenumber = 23
-		"""
-
-		##### RULE 050 #####
-		## 'not' and any word ending in "n't" are not putatively propositions and their tag is changed to NOT.
-		if word_list[i].token == "not" or word_list[i].token[-3:] == "n't" or contains(NT, word_list[i].token):
-			word_list[i].isprop = True
-			word_list[i].tag = "NOT"
-			word_list[i].rulenumber = 50
-
-		##### RULE 054 #####
-		## "that/DT" or "this/DT" is a pronoun, not a determiner, if the following word is a verb or an adverb.
-		if (word_list[i-1].token == "that" or word_list[i-1].token == "this") and (contains(VRB, word_list[i].tag) or
-			contains(ADV, word_list[i].tag)):
-			word_list[i-1].tag = "PRP"
-			word_list[i-1].rulenumber = 54
-			word_list[i-1].isprop = False
-
-		################################################################################################################
-		##### RULE GROUP 100 - Word Order Adjustment ###################################################################
-		################################################################################################################
-
-		##### RULE 101 #####
-		## If the current word is an auxiliary word, and 1) the current word is the first word of the sentence, or 2)
-		## the sentence begins with an interrogative, move the current word rightward to put it in front of the first
-		## verb, or at the end of the sentence. In some cases, this will move a word too far to the right, but the
-		## effect of this on proposition counting is benign.
-		if contains(AUX, word_list[i].token):
-			sent_start = sent_beginning(word_list, i)
-			if sent_start == i or contains(INTERR, word_list[sent_start].tag):
-				dest = i # destination
-				while dest < len(word_list) - 1:
-					dest += 1
-					if word_list[dest].tag == "." or contains(VRB, word_list[dest].tag): break
-				if dest > (i + 1):
-					word_list.insert(dest, WordObj(word_list[i].token, word_list[i].tag, True, True, 101))
-					word_list[i].tag = ""
-					word_list[i].isprop = False
-					word_list[i].isword = False
-					word_list[i].token += "/moved"
-
-		################################################################################################################
-		##### RULE GROUP 200 - Preliminary Proposition Identification ##################################################
-		################################################################################################################
-
-		##### Rule 200 #####
-		## The tags in PROP are taken to indicate propositions.
-		if contains(PROP, word_list[i].tag):
-			word_list[i].isprop = True
-			word_list[i].rulenumber = 200
-
-		##### RULE 201 #####
-		## The tokens 'the', 'a', and 'an' are not propositions.
-		if word_list[i].token == "the" or word_list[i].token == "an" or word_list[i].token == "a":
-			word_list[i].isprop = False
-			word_list[i].rulenumber = 201
-
-		##### RULE 202 #####
-		## An attributive noun (such as 'lion' in 'ion tamer') is a proposition, similar to an adjective.
-		##
-		## Excluding this rule results in better agreement with Turner & Greene.
-
-		# if contains(NOUN, word_list[i].tag) and word_list[i-1].tag == "NN":
-		# 	word_list[i-1].isprop = True
-		# 	word_list[i-1].rulenumber = 202
-
-		##### RULE 203 #####
-		## The first word in a correlating conjunction ('either...or', 'neither...nor', 'both...and', etc.) is not a
-		## proposition. The second word is tagged CC; the first word may have been tagged CC, RB, or DT.
-		## NOTE: 'nor' is tagged as RB once in the Switchboard Corpus.
-		if word_list[i].tag == "CC" and not contains(CORREL, word_list[i].token):
-			j = i
-			while j > i - 10:
-				j -= 1
-				if j == -1: break
-				if contains(CORREL, word_list[j].token):
-					word_list[j].isprop = False
-					word_list[j].rulenumber = 203
-					break
-
-		##### RULE 204 #####
-		## The bigrams 'and then' and 'or else' are each a single proposition.
-		if (word_list[i-1].token == "and" and word_list[i].token == "then") or (word_list[i-1].token == "or" and word_list[i].token == "else"):
-			word_list[i].isprop = False
-			word_list[i].rulenumber = 204
-
-		##### RULE 206 #####
-		## The token 'to' is not a proposition when it is the last word in a sentence.
-		if word_list[i].tag == "." and word_list[i-1].tag == "TO":
-			word_list[i-1].isprop = False
-			word_list[i-1].rulenumber = 206
-
-		##### RULE 207 #####
-		## Modal is a proposition when it is last word in sentence.
-		if word_list[i].tag == "." and word_list[i-1].tag == "MD":
-			word_list[i-1].isprop = True
-			word_list[i-1].rulenumber = 207
-
-		##### RULE 210 #####
-		## Cardinal numbers are propositions (only) if there is a NOUN within five words after it (not crossing a
-		## sentence boundary). This rule ensures that 'in 3 parts' is two propositions, but 'in 1941' is only one.
-		if word_list[i].tag == "CD":
-			word_list[i].isprop = False
-			word_list[i].rulenumber = 210
-			j = i
-			while j < (len(word_list) - 1) and j < i + 6:
-				j += 1
-				if j == -1: break
-				if contains(NOUN, word_list[j].tag):
-					word_list[i].isprop = True
-					break
-
-		##### RULE 211 #####
-		## Pairs such as 'not...unless' are counted as a single proposition, with the second word in the pair being
-		## tagged as a proposition.
-		if contains(NEGPOL2, word_list[i].token):
-			j = i
-			while i > i - 10:
-				j -= 1
-				if j == -1: break
-				if word_list[j].tag == "NOT":
-					word_list[j].isprop = False
-					word_list[j].rulenumber = 211
-					break
-
-		##### RULE 212 #####
-		## Pairs such as 'not...any' are counted as a single proposition, with the first word in the pair being tagged
-		## as a proposition.
-		if contains(NEGPOL1, word_list[i].token):
-			j = i
-			while j > i - 10:
-				j -= 1
-				if j == -1: break
-				if word_list[j].tag == "NOT":
-					word_list[i].isprop = False
-					word_list[i].rulenumber = 212
-					break
-
-		##### RULE 213 #####
-		## The bigram 'going to' is not a proposition when is immediately precedes a verb.
-		if contains(VRB, word_list[i].tag) and word_list[i-1].token == "to" and word_list[i-2].token == "going":
-			word_list[i-1].isprop = False
-			word_list[i-1].rulenumber = 213
-			word_list[i-2].isprop = False
-			word_list[i-2].rulenumber = 213
-
-		##### RULE 214 #####
-		## The pair 'if...then' is a single conjunction, not two. This rule actually checks for 'if...then (token)'
-		## because 'then' as the last word of a sentence is most likely an adverb.
-		if word_list[i].isword and word_list[i-1].token == "then":
-			j = i
-			while j > i - 10:
-				j -= 1
-				if j == -1: break
-				if word_list[j].token == "if":
-					word_list[i-1].isprop = False
-					word_list[i-1].rulenumber = 214
-					break
-
-		##### RULE 225 #####
-		## The bigram 'each other' is a pronoun and should be tagged as 'PRP PRP'.
-		if word_list[i].token == "other" and word_list[i-1].token == "each":
-			word_list[i].tag = word_list[i-1].tag = "PRP"
-			word_list[i].isprop = word_list[i-1].isprop = False
-			word_list[i].rulenumber = word_list[i-1].rulenumber = 225
-
-		##### RULE 230 #####
-		## The bigrams 'how come' and 'how many' are considered one proposition, not two.
-		if (word_list[i].token == "come" or word_list[i].token == "many") and word_list[i-1].token == "how":
-			word_list[i].isprop = False
-			word_list[i].tag = word_list[i-1].tag
-			word_list[i].rulenumber = 230
-
-		################################################################################################################
-		##### RULE GROUP 300 - Linking Verbs ###########################################################################
-		################################################################################################################
-
-		##### RULE 301 #####
-		## A linking verb is not a proposition if it precedes an adjective or an adverb. (Apparently, adverbs are
-		## frequent tagging mistakes for adjectives.)
-		if (contains(ADJ, word_list[i].tag) or contains(ADV, word_list[i].tag)) and contains(LINKING, word_list[i-1].token):
-			word_list[i-1].isprop = False
-			word_list[i-1].rulenumber = 301
-
-		##### RULE 302 #####
-		## The token 'be' is not a proposition when it precedes a pr(e)position.
-		## TODO: Modify to allow for intervening adverbs.
-		if word_list[i].tag == "IN" and contains(BE, word_list[i-1].token):
-			word_list[i-1].isprop = False
-			word_list[i-1].rulenumber = 302
-
-		##### RULE 310 #####
-		## Sequences of the following form are considered to be two propositions: Linking Verb + Adverb + ( PDT || DT )
-		## For example, 'he is now the president'. This would not be counted because of RULE 201.
-		if word_list[i].tag == "DT" or word_list[i].tag == "PDT":
-			if contains(ADV, word_list[i-1].tag) and contains(LINKING, word_list[i-2].token):
-				word_list[i-1].isprop = True
-				word_list[i-1].rulenumber = 310
-				word_list[i-2].isprop = True
-				word_list[i-2].rulenumber = 310
-
-		##### RULE 311 #####
-		## Causative linking verbs (such as 'make it better') and similar phrases do not count the adjective as a new
-		## proposition because the verb was counted.
-		if contains(ADJ, word_list[i].tag):
-			j = i
-			while j > i - 10:
-				j -= 1
-				if j == -1: break
-				if contains(CLINKING, word_list[j].token):
-					word_list[i].isprop = False
-					word_list[i].rulenumber = 311
-					break
-
-		################################################################################################################
-		##### RULE GROUP 400 - Auxiliary Verbs Are Not Propositions ####################################################
-		## NOTE: VERB is a list of tags, but AUX is a list of tokens.
-		## NOTE: AUX is a subset of VERB.
-		################################################################################################################
-
-		##### RULE 401 #####
-		## Bigrams of the form 'AUX not' are considered one proposition, not two.
-		if word_list[i].token == "not" and contains(AUX, word_list[i-1].token):
-			word_list[i-1].isprop = False
-			word_list[i-1].rulenumber = 401
-
-		##### RULE 402 #####
-		## Bigrams of the form 'AUX VERB' are considered one proposition, not two.
-		if contains(VRB, word_list[i].tag) and contains(AUX, word_list[i-1].token):
-			word_list[i-1].isprop = False
-			word_list[i-1].rulenumber = 402
-
-		##### RULE 405 #####
-		## In trigrams of the form 'AUX NOT VERB', NOT and VERB are tagged as propositions. The same is true for
-		## trigrams of the form 'AUX ADV VERB'. For example: 'had always sung', 'would rather go'.
-		if (contains(VRB, word_list[i].tag) and (word_list[i-1].tag == "NOT") or
-		   (contains(ADV, word_list[i-1].tag)) and contains(AUX, word_list[i-2].token)):
-			word_list[i-2].isprop = False
-			word_list[i-2].rulenumber = 405
-
-		################################################################################################################
-		##### RULE GROUP 500 - Constructions Involving 'to' ############################################################
-		################################################################################################################
-
-		##### RULE 510 #####
-		## Bigrams of the form 'TO VB' are considered to be one proposition, not two.
-		if (word_list[i].tag == "VB") and (word_list[i-1].tag == "TO"):
-			word_list[i-1].isprop = False
-			word_list[i-1].rulenumber = 510
-
-		##### RULE 511 #####
-		## In sequences of the form 'for...TO VB', 'for' is not a proposition.
-		if (word_list[i].tag == "VB") and (word_list[i-1].tag == "TO"):
-			j = i
-			while j > i - 10:
-				j -= 1
-				if j == -1: break
-				if word_list[j].token == "for":
-					word_list[j].isprop = False
-					word_list[j].rulenumber = 511
-					break
-
-		##### RULE 512 #####
-		## When 'go', 'come', and their synonyms precede 'from' and 'to', 'from' and 'to' are considered to be one
-		## proposition, not two.
-		##
-		## Excluding this rule results in better agreement with Turner & Greene.
-
-		"""
-		if (word_list[i].token == "to" or word_list[i].token == "from") and \
-			contains(COMEGO, word_list[i-1].token or contains(COMEGO, word_list[i-2].token)):
-			word_list[i].isprop = False
-			word_list[i].rulenumber = 512
-		"""
-
-		################################################################################################################
-		##### RULE GROUP 600 - Fillers #################################################################################
-		################################################################################################################
-
-		##### RULE 610 #####
-		## A sentence consisting entirely of probable filler words is considered to be propositionless.
-		if speech_mode and word_list[i].tag == ".":
-			sent_start = sent_beginning(word_list, i)
-			k = 0
-			j = sent_start
-			while j < i:
-				if (word_list[j].tag != "UH") and not contains(FILLER, word_list[j].token): k += 1
-				j += 1
-			if k == 0:
-				j = sent_start
-				while j < i:
-					word_list[j].tag = ""
-					word_list[j].isprop = False
-					word_list[j].rulenumber = 610
-					j += 1
-
-		##### RULE 632 #####
-		## If speech_mode is True, 'like' is considered to be a filler when it does not immediately follow BE.
-		if speech_mode:
-			if word_list[i].token == "like" and not contains(BE, word_list[i - 1].token):
-				word_list[i].tag = ""
-				word_list[i].isprop = False
-				word_list[i].rulenumber = 632
-
-		##### RULE 634 #####
-		## If speech_mode is True, the bigram 'you know' is considered to be a single word, not two.
-		if speech_mode:
-			if word_list[i-1].token == "you" and word_list[i].token == "know":
-				i -= 1
-				word_list.pop(i+1)
-				word_list[i].token = "you_know"
-				word_list[i].tag = ""
-				word_list[i].isprop = False
-				word_list[i].isword = True
-				word_list[i].rulenumber = 634
-
-	####################################################################################################################
-	##### END RULES ####################################################################################################
-	####################################################################################################################
+		## If it's a null item, skip the rest of these tests.
+		word = word_list[i]
+		if word.token == "": continue
+
+		rules, k = triggered_rules(word, speech_mode), 0
+		while k < len(rules):
+			(number, rule) = rules[k]
+			(tag, token) = (word.tag, word.token)
+			i = rule(word_list, i)
+			k += 1
+			if word_list[i] is not word or word.tag != tag or word.token != token:
+				word = word_list[i]
+				rules, k = [(later, rule) for (later, rule) in triggered_rules(word, speech_mode) if later > number], 0
 
 	return word_list
 
 def calc_propositions(word_list):
 	""" Returns the number of propositions in the given list of words. """
-	props = 0
-	for word in word_list:
-		if word.isprop:
-			props += 1
-	return props
+	return sum(1 for word in word_list if word.isprop)
 
-def calc_idea(treestrings):
+def calc_idea(treestrings, speech_mode=False):
 	"""
 	Calculate the idea density (also known as proposition density or p-density).
 
@@ -592,21 +645,33 @@ def calc_idea(treestrings):
 		Brian Roark, John-Paul Hosom, Margaret Mitchell and Jeffrey A. Kaye. 2007. Automatically derived spoken language
 			markers for detecting Mild Cognitive Impairment. In Proceedings of the 2nd International Conference on
 			Technology and Aging (ICTA).
+
+	With speech_mode=True, the rules for transcribed speech are applied (see apply_counting_rules()).
+	"""
+	# return (mean, min, max) idea density
+	return splat.complexity.summarize_densities(calc_ideas(treestrings, speech_mode))
+
+def calc_ideas(treestrings, speech_mode=False):
+	"""
+	Calculate the idea density of each of the given parse trees (see calc_idea()).
+	:param treestrings:a list of parse trees
+	:type treestrings:list
+	:param speech_mode:whether to apply the rules for transcribed speech (see apply_counting_rules())
+	:type speech_mode:bool
+	:return:a list with the idea density of each tree, or None for a tree without any tagged words
+	:rtype:list
 	"""
 	results = []
+	# Only the words of the current tree are held at a time, so memory does not grow with the number of trees.
 	for utterance in treestrings:
-		word_list = []
-		tags_tokens = re.findall("\((\S+) ([^\(^\)]+)\)", utterance)
-		num_words = float(len(tags_tokens))
-		for (tag, token) in tags_tokens:
-			word = WordObj()
-			word.token = token
-			word.tag = tag
-			word_list += [word]
-		word_list = apply_counting_rules(word_list)
+		word_list = [WordObj(token, tag) for (tag, token) in TAG_TOKEN_PATTERN.findall(utterance)]
+		num_words = float(len(word_list))
+		if num_words == 0:
+			results.append(None)
+			continue
+		word_list = apply_counting_rules(word_list, speech_mode)
 		props = calc_propositions(word_list)
 		p_density = (float(props)) / float(num_words)
 		results.append(p_density)
 
-	# return (mean, min, max) idea density
-	return float(sum(results)/len(results)), float(min(results)), float(max(results))
+	return results
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+import math
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+"""
+Lexical diversity measures that, unlike the type-token ratio, do not depend on the length of the text. MATTR and MTLD
+walk the token stream once, as interned token IDs (see Vocabulary), keeping the count of each ID in a list and the
+number of distinct IDs as a running total, so each token costs a constant amount of work. HD-D, Yule's K and Honore's
+statistic only need the frequency of each type, so they work from (type, count) pairs.
+"""
+
+##### GLOBAL VARIABLES #################################################################################################
+# The default window size of MATTR, the TTR threshold of MTLD and the sample size of HD-D.
+mattr_window = 50
+mtld_threshold = 0.72
+hdd_sample = 42
+
+########################################################################################################################
+
+def calc_mattr(ids, window=mattr_window, vocab_size=None):
+	"""
+	Calculates the Moving-Average Type-Token Ratio: the mean TTR of every window of the given size. Each step of the
+	window adds one token and removes another, so the whole text is covered in a single pass. A text shorter than the
+	window has the TTR of the whole text.
+	:param ids:the token IDs, in order
+	:type ids:list,array
+	:param window:the number of tokens in each window
+	:type window:int
+	:param vocab_size:one more than the largest token ID (by default, computed from ids)
+	:type vocab_size:int
+	:return:the MATTR
+	:rtype:float
+	"""
+	if window < 1:
+		raise ValueError("WARNING: The MATTR window must be at least one token.")
+	if len(ids) == 0:
+		return 0.0
+	if vocab_size is None:
+		vocab_size = max(ids) + 1
+	window = min(window, len(ids))
+
+	counts, types = [0] * vocab_size, 0
+	for i in ids[:window]:
+		if counts[i] == 0:
+			types += 1
+		counts[i] += 1
+	total = types
+	for k in range(window, len(ids)):
+		(added, removed) = (ids[k], ids[k - window])
+		if added != removed:
+			counts[removed] -= 1
+			if counts[removed] == 0:
+				types -= 1
+			if counts[added] == 0:
+				types += 1
+			counts[added] += 1
+		total += types
+
+	return round(float(total) / float(window * (len(ids) - window + 1)), 4)
+
+def _mtld_factors(ids, threshold, counts):
+	""" Returns the number of factors in one pass of MTLD, counting the last, unfinished factor as part of one. """
+	factors, start, types = 0.0, 0, 0
+	for (k, i) in enumerate(ids):
+		if counts[i] == 0:
+			types += 1
+		counts[i] += 1
+		if float(types) / float(k - start + 1) <= threshold:
+			factors += 1.0
+			# Only the IDs of this factor are reset, so the resets add up to a single pass over the text.
+			for j in ids[start:k + 1]:
+				counts[j] = 0
+			(start, types) = (k + 1, 0)
+	if start < len(ids):
+		ttr = float(types) / float(len(ids) - start)
+		factors += (1.0 - ttr) / (1.0 - threshold)
+		for j in ids[start:]:
+			counts[j] = 0
+
+	return factors
+
+def calc_mtld(ids, threshold=mtld_threshold, vocab_size=None):
+	"""
+	Calculates the Measure of Textual Lexical Diversity: the mean number of tokens it takes for the TTR to fall to the
+	threshold, averaged over a forward and a backward pass through the text.
+	:param ids:the token IDs, in order
+	:type ids:list,array
+	:param threshold:the TTR at which a factor ends
+	:type threshold:float
+	:param vocab_size:one more than the largest token ID (by default, computed from ids)
+	:type vocab_size:int
+	:return:the MTLD
+	:rtype:float
+	"""
+	if not 0.0 < threshold < 1.0:
+		raise ValueError("WARNING: The MTLD threshold must be between 0 and 1.")
+	if len(ids) == 0:
+		return 0.0
+	if vocab_size is None:
+		vocab_size = max(ids) + 1
+
+	counts, scores = [0] * vocab_size, []
+	for direction in (ids, ids[::-1]):
+		factors = _mtld_factors(direction, threshold, counts)
+		# A text in which no word repeats has no factors at all; its MTLD is its length.
+		scores.append(float(len(ids)) / factors if factors != 0.0 else float(len(ids)))
+
+	return round(sum(scores) / 2.0, 4)
+
+def calc_hdd(types, sample=hdd_sample):
+	"""
+	Calculates HD-D: for each type, the probability of drawing it at least once in a random sample of the given number
+	of tokens (from the hypergeometric distribution), divided by the sample size and summed over the types.
+	:param types:a list of (type, count) pairs
+	:type types:list
+	:param sample:the number of tokens drawn
+	:type sample:int
+	:return:the HD-D
+	:rtype:float
+	"""
+	if sample < 1:
+		raise ValueError("WARNING: The HD-D sample must be at least one token.")
+	tokens = sum(count for (word, count) in types)
+	if tokens == 0:
+		return 0.0
+	sample = min(sample, tokens)
+
+	# The probability of drawing none of the count tokens of a type is C(tokens - count, sample) / C(tokens, sample).
+	log_total = math.lgamma(tokens + 1) - math.lgamma(tokens - sample + 1)
+	score = 0.0
+	for (word, count) in types:
+		if tokens - count < sample:
+			score += 1.0
+		else:
+			missing = math.lgamma(tokens - count + 1) - math.lgamma(tokens - count - sample + 1) - log_total
+			score += 1.0 - math.exp(missing)
+
+	return round(score / float(sample), 4)
+
+def calc_yules_k(types):
+	"""
+	Calculates Yule's Characteristic K, which is higher for texts that repeat their words more.
+	:param types:a list of (type, count) pairs
+	:type types:list
+	:return:Yule's K
+	:rtype:float
+	"""
+	tokens = sum(count for (word, count) in types)
+	if tokens == 0:
+		return 0.0
+	squares = sum(count * count for (word, count) in types)
+
+	return round(10000.0 * float(squares - tokens) / float(tokens * tokens), 4)
+
+def calc_honore(types):
+	"""
+	Calculates Honore's Statistic, which is higher for texts with more words that occur only once. It is undefined when
+	every word occurs only once, in which case 0.0 is returned.
+	:param types:a list of (type, count) pairs
+	:type types:list
+	:return:Honore's R
+	:rtype:float
+	"""
+	tokens = sum(count for (word, count) in types)
+	hapaxes = sum(1 for (word, count) in types if count == 1)
+	if tokens == 0 or hapaxes == len(types):
+		return 0.0
+
+	return round(100.0 * math.log(tokens) / (1.0 - float(hapaxes) / float(len(types))), 4)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+import math
+
+##### SPLAT IMPORTS ####################################################################################################
+import splat.corpora as corpora
+import splat.complexity as cUtil
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+"""
+Readability scores. Every score is a formula over a handful of counts (words, sentences, syllables, polysyllables,
+letters, characters, long words and difficult words), and count_readability() collects all of them in a single pass
+over the (type, count) pairs of a text, so computing every score costs about as much as computing one.
+
+Difficult words are only counted when they are asked for, because the list of familiar words they are checked against
+is read from the Brown Corpus. SPLAT does not ship the Dale-Chall list of words familiar to fourth-graders, so by
+default the 3000 most frequent words of the Brown Corpus stand in for it (see corpora.familiar_words()); the Dale-Chall
+score computed with them is an approximation of the published one.
+"""
+
+##### GLOBAL VARIABLES #################################################################################################
+# The names of the scores, in the order calc_readability() returns them.
+scores = ["flesch", "kincaid", "fog", "smog", "coleman_liau", "ari", "dale_chall", "lix"]
+# A word of at least this many syllables is a polysyllable (a "complex word" for the Gunning Fog Index).
+polysyllable_length = 3
+# A word of more than this many letters is a long word for LIX.
+long_word_length = 6
+
+########################################################################################################################
+
+def count_readability(types, wordcount, sentcount, syllables=None, familiar=None):
+	"""
+	Collects the counts behind every readability score in a single pass. Each type is only looked at once, no matter
+	how many times it occurs.
+	:param types:a list of (type, count) pairs
+	:type types:list
+	:param wordcount:the number of words
+	:type wordcount:int
+	:param sentcount:the number of sentences
+	:type sentcount:int
+	:param syllables:a function returning the number of syllables of a word (by default, cUtil.word_syllables)
+	:type syllables:function
+	:param familiar:the words that are not difficult for the Dale-Chall Score; difficult words are only counted if it
+	is given (see count_difficult_words())
+	:type familiar:set
+	:return:a dictionary mapping each count to its value
+	:rtype:dict
+	"""
+	if syllables is None:
+		syllables = cUtil.word_syllables
+	counts = {"words": wordcount, "sentences": sentcount, "syllables": 0, "polysyllables": 0, "letters": 0,
+			  "characters": 0, "long_words": 0}
+	if familiar is not None:
+		counts["difficult_words"] = 0
+	for (word, count) in types:
+		letters = sum(1 for char in word if char.isalpha())
+		if letters == 0:
+			continue
+		word_syllables = syllables(word)
+		counts["syllables"] += word_syllables * count
+		counts["letters"] += letters * count
+		counts["characters"] += sum(1 for char in word if char.isalnum()) * count
+		if word_syllables >= polysyllable_length:
+			counts["polysyllables"] += count
+		if letters > long_word_length:
+			counts["long_words"] += count
+		if familiar is not None and word.lower() not in familiar:
+			counts["difficult_words"] += count
+
+	return counts
+
+def count_difficult_words(types, familiar=None):
+	"""
+	Counts the words that are not familiar, for the Dale-Chall Score.
+	:param types:a list of (type, count) pairs
+	:type types:list
+	:param familiar:the words that are not difficult (by default, corpora.familiar_words(), which stands in for the
+	Dale-Chall list)
+	:type familiar:set
+	:return:the number of difficult words
+	:rtype:int
+	"""
+	if familiar is None:
+		familiar = corpora.familiar_words()
+	return sum(count for (word, count) in types
+			   if any(char.isalpha() for char in word) and word.lower() not in familiar)
+
+def calc_gunning_fog(wordcount, sentcount, polysyllables):
+	""" Calculates the Gunning Fog Index, treating every polysyllable as a complex word. """
+	return round(0.4 * (float(wordcount) / float(sentcount) + 100.0 * float(polysyllables) / float(wordcount)), 1)
+
+def calc_smog(sentcount, polysyllables):
+	""" Calculates the SMOG Grade, scaling the polysyllables to a sample of 30 sentences. """
+	return round(1.0430 * math.sqrt(float(polysyllables) * 30.0 / float(sentcount)) + 3.1291, 1)
+
+def calc_coleman_liau(wordcount, sentcount, letters):
+	""" Calculates the Coleman-Liau Index, from the letters and sentences per 100 words. """
+	letters_per_100 = 100.0 * float(letters) / float(wordcount)
+	sents_per_100 = 100.0 * float(sentcount) / float(wordcount)
+	return round(0.0588 * letters_per_100 - 0.296 * sents_per_100 - 15.8, 1)
+
+def calc_ari(wordcount, sentcount, characters):
+	""" Calculates the Automated Readability Index. """
+	return round(4.71 * float(characters) / float(wordcount) + 0.5 * float(wordcount) / float(sentcount) - 21.43, 1)
+
+def calc_dale_chall(wordcount, sentcount, difficult_words):
+	""" Calculates the (New) Dale-Chall Readability Score. """
+	percent_difficult = 100.0 * float(difficult_words) / float(wordcount)
+	score = 0.1579 * percent_difficult + 0.0496 * float(wordcount) / float(sentcount)
+	# The score is adjusted for texts in which more than 5% of the words are difficult.
+	if percent_difficult > 5.0:
+		score += 3.6365
+	return round(score, 1)
+
+def calc_lix(wordcount, sentcount, long_words):
+	""" Calculates the LIX (Lasbarhetsindex) Score. """
+	return round(float(wordcount) / float(sentcount) + 100.0 * float(long_words) / float(wordcount), 1)
+
+def calc_readability(counts):
+	"""
+	Calculates every readability score from the counts collected by count_readability(). The Dale-Chall score is only
+	calculated if the counts include difficult words. A text without sentence-ending punctuation is a single sentence,
+	and every score of a text without words is 0.0.
+	:param counts:a dictionary of counts, as returned by count_readability()
+	:type counts:dict
+	:return:a dictionary mapping each score name (see scores) to its value
+	:rtype:dict
+	"""
+	names = [name for name in scores if name != "dale_chall" or "difficult_words" in counts]
+	words = counts["words"]
+	if words == 0:
+		return {name: 0.0 for name in names}
+	sents = max(counts["sentences"], 1)
+
+	results = {"flesch": cUtil.calc_flesch_readability(words, sents, counts["syllables"]),
+			   "kincaid": cUtil.calc_flesch_kincaid(words, sents, counts["syllables"]),
+			   "fog": calc_gunning_fog(words, sents, counts["polysyllables"]),
+			   "smog": calc_smog(sents, counts["polysyllables"]),
+			   "coleman_liau": calc_coleman_liau(words, sents, counts["letters"]),
+			   "ari": calc_ari(words, sents, counts["characters"]),
+			   "lix": calc_lix(words, sents, counts["long_words"])}
+	if "difficult_words" in counts:
+		results["dale_chall"] = calc_dale_chall(words, sents, counts["difficult_words"])
+	return results
@@ -15,6 +15,7 @@ from nltk.corpus import brown
 from nltk.corpus import stopwords
 from nltk.corpus import names
 from nltk.corpus import cmudict
+from nltk.probability import FreqDist
 
 # The Brown University Standard Corpus of Present-Day American English (or just Brown Corpus) was compiled in the 1960s
 # by Henry Kucera and W. Nelson Francis at Brown University, Providence, Rhode Island as a general corpora (text
@@ -22,17 +23,77 @@ from nltk.corpus import cmudict
 # one million words, compiled from works published in the United States in 1961. Project Site:
 # <http://clu.uni.no/icame/brown/bcm.html>
 BROWN = brown
-BROWN_TAGS = dict(brown.tagged_words())
 
-# This is the Stopwords corpus available in NLTK. Project Site: <http://www.nltk.org/>
-STOPWORDS_EN = stopwords.words('english')
+# The corpora below take a while to read, so each one is only loaded the first time its function is called, and kept.
+_loaded = {}
 
-# This is the Names corpus available in NLTK. Project Site: <http://www.nltk.org/>
-PROPER_NAMES = names.words()
+def _load(name, loader):
+	""" Returns the named corpus, calling loader to read it the first time it is needed. """
+	if name not in _loaded:
+		_loaded[name] = loader()
+	return _loaded[name]
 
-# This is v6.0 of the Carnegie-Mellon Pronouncing Dictionary (cmudict) available in NLTK. Project Site:
-# <http://www.nltk.org/>
-CMUDICT = cmudict.dict()
+def brown_tags():
+	""" Returns a dictionary mapping each word of the Brown Corpus to its part-of-speech tag. """
+	return _load("BROWN_TAGS", lambda: dict(brown.tagged_words()))
+
+def stopwords_en():
+	""" Returns the Stopwords corpus available in NLTK. Project Site: <http://www.nltk.org/> """
+	return _load("STOPWORDS_EN", lambda: stopwords.words('english'))
+
+def proper_names():
+	""" Returns the Names corpus available in NLTK. Project Site: <http://www.nltk.org/> """
+	return _load("PROPER_NAMES", lambda: names.words())
+
+def cmu_dict():
+	"""
+	Returns v6.0 of the Carnegie-Mellon Pronouncing Dictionary (cmudict) available in NLTK. Project Site:
+	<http://www.nltk.org/>
+	"""
+	return _load("CMUDICT", lambda: cmudict.dict())
+
+def familiar_words():
+	"""
+	Returns the 3000 most frequent words of the Brown Corpus, standing in for the list of words familiar to
+	fourth-graders that the Dale-Chall Readability Score was built on.
+	"""
+	return _load("FAMILIAR_WORDS", lambda: set(word for (word, count) in FreqDist(
+		word.lower() for word in brown.words() if word.isalpha()).most_common(3000)))
+
+class _LazyCorpus:
+	"""
+	Stands in for a corpus under the name it had when every corpus was read at import time, such as CMUDICT, so that
+	code using those names keeps working. The corpus is only read the first time it is used.
+	"""
+	def __init__(self, loader):
+		self.__loader = loader
+
+	def __getattr__(self, name):
+		return getattr(self.__loader(), name)
+
+	def __getitem__(self, key):
+		return self.__loader()[key]
+
+	def __contains__(self, item):
+		return item in self.__loader()
+
+	def __iter__(self):
+		return iter(self.__loader())
+
+	def __len__(self):
+		return len(self.__loader())
+
+	def __eq__(self, other):
+		return self.__loader() == other
+
+	def __repr__(self):
+		return repr(self.__loader())
+
+# The names the corpora had before they were loaded lazily; new code should call the functions above instead.
+BROWN_TAGS = _LazyCorpus(brown_tags)
+STOPWORDS_EN = _LazyCorpus(stopwords_en)
+PROPER_NAMES = _LazyCorpus(proper_names)
+CMUDICT = _LazyCorpus(cmu_dict)
 
 PHONEME_DICT = {"vow":  ["AA", "AA0", "AA1", "AA2", "AE", "AE0", "AE1", "AE2",
                          "AH", "AH0", "AH1", "AH2", "OA", "OA0", "OA1", "OA2",
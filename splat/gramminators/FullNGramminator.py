@@ -22,40 +22,34 @@ class FullNGramminator(NGramminator):
 	Characters matching r"[\.,:;!\?\(\)\[\]\{\}]" are excluded from the ngram gramminators.
 	All characters in the given text are lowercased before being ngramminated.
 	"""
-	def ngrams(self, text, n):
+	def words(self, text):
 		"""
-		Generates a list of ngrams of size n.
-		:param text:the text selection to ngramminate
-		:type text:str
-		:param n:the size of each ngram
-		:type n:int
-		:return:a list of ngrams of size n
+		Returns the lowercased words of the given text with excluded characters removed, as used to build ngrams.
+		:param text:the text selection to split into words
+		:type text:str,list
+		:return:a list of normalized words
 		:rtype:list
 		"""
-		temp_text = []
-		if type(text) == str:
-			temp_text = text.split()
-		elif type(text) == list:
-			temp_text = text
-		else:
-			raise ValueError
-
-		temp_text = []
 		if type(text) == str:
 			temp_text = text.lower().split()
 		elif type(text) == list:
-			temp_text = text
-			text = []
-			for temp_word in temp_text:
-				text.append(temp_word.lower())
-			temp_text = text
+			temp_text = [temp_word.lower() for temp_word in text]
 		else:
 			raise ValueError
 
-		text = []
+		return [re.sub(r"[\.,:;!\?\(\)\[\]\{\}]", "", temp_word) for temp_word in temp_text]
 
-		for temp_word in temp_text:
-			text.append(re.sub(r"[\.,:;!\?\(\)\[\]\{\}]", "", temp_word))
+	def ngrams(self, text, n):
+		"""
+		Generates a list of ngrams of size n.
+		:param text:the text selection to ngramminate
+		:type text:str
+		:param n:the size of each ngram
+		:type n:int
+		:return:a list of ngrams of size n
+		:rtype:list
+		"""
+		text = self.words(text)
 
 		ngram_list = []
 		for i in range(len(text)-n+1):
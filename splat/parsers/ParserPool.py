@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+##### PYTHON IMPORTS ###################################################################################################
+from multiprocessing.managers import BaseManager
+import queue, subprocess, threading
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.parsers.TreeStringParser import TreeStringParser
+
+########################################################################################################################
+##### INFORMATION ######################################################################################################
+### @PROJECT_NAME:		SPLAT: Speech Processing and Linguistic Analysis Tool										 ###
+### @VERSION_NUMBER:																								 ###
+### @PROJECT_SITE:		github.com/meyersbs/SPLAT																     ###
+### @AUTHOR_NAME:		Benjamin S. Meyers																			 ###
+### @CONTACT_EMAIL:		ben@splat-library.org																		 ###
+### @LICENSE_TYPE:		MIT																							 ###
+########################################################################################################################
+########################################################################################################################
+
+class ParserPool:
+	"""
+	A ParserPool keeps a number of Berkeley Parser processes running, so that the JVM and the grammar are only loaded
+	once. Each process reads one sentence per line on stdin and writes one parse tree per line on stdout. Parsers are
+	started the first time they are needed, and a call to parse() waits until one of them is free.
+	"""
+	def __init__(self, size=1, command=None):
+		"""
+		Creates a ParserPool object.
+		:param size:the number of parser processes to keep running
+		:type size:int
+		:param command:the command that starts one parser process (by default, the Berkeley Parser on stdin)
+		:type command:list
+		"""
+		if command is None:
+			command = ['java', '-jar', TreeStringParser.curr_dir + '/BerkeleyParser-1.7.jar', '-gr',
+					   TreeStringParser.curr_dir + '/eng_sm6.gr', '-nThreads', '1']
+		self.__command = command
+		self.__size = size
+		self.__started = 0
+		self.__free = queue.Queue()
+		self.__processes = []
+		self.__lock = threading.Lock()
+
+	def __acquire(self):
+		""" Returns a free parser process, starting a new one if fewer than size are running. """
+		with self.__lock:
+			if self.__free.empty() and self.__started < self.__size:
+				process = subprocess.Popen(self.__command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+										   universal_newlines=True, bufsize=1)
+				self.__processes.append(process)
+				self.__started += 1
+				return process
+		return self.__free.get()
+
+	def parse(self, sentences):
+		"""
+		Returns a list of parse tree strings, one for each non-empty sentence.
+		:param sentences:a list of sentences, without newlines
+		:type sentences:list
+		:return:a list of parse tree strings
+		:rtype:list
+		"""
+		process = self.__acquire()
+		try:
+			parse_trees = []
+			for sentence in sentences:
+				if sentence.strip() == "":
+					continue
+				process.stdin.write(sentence + "\n")
+				process.stdin.flush()
+				tree = process.stdout.readline().rstrip("\n")
+				if tree != "":
+					parse_trees.append(tree)
+		finally:
+			self.__free.put(process)
+
+		return parse_trees
+
+	def close(self):
+		""" Stops every parser process. """
+		with self.__lock:
+			for process in self.__processes:
+				process.stdin.close()
+				process.wait()
+			self.__processes = []
+
+
+class ParserManager(BaseManager):
+	"""
+	A ParserManager serves a single ParserPool from its own process, so that worker processes can share the pool's
+	parsers through a proxy: ParserManager().start(), then manager.ParserPool(size).
+	"""
+	pass
+
+ParserManager.register("ParserPool", ParserPool)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 ##### PYTHON IMPORTS ###################################################################################################
-import subprocess, os
+import subprocess, os, tempfile
 
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
@@ -16,6 +16,9 @@ import subprocess, os
 
 class TreeStringParser:
 	curr_dir = os.path.dirname(__file__)
+	# When set to a ParserPool (or a proxy to one), parse trees come from the pool's running parsers instead of a new
+	# JVM for every call.
+	pool = None
 	__berkeley_path = ""
 	__grammar_path = ""
 	def __init__(self, berkeley_path=curr_dir + '/BerkeleyParser-1.7.jar', grammar_path=curr_dir + '/eng_sm6.gr'):
@@ -24,7 +27,10 @@ class TreeStringParser:
 
 	def get_parse_trees(self, sentences):
 		""" Use the Berkeley Parser to obtain parsers-tree-strings for each line in the input_file. """
-		parse_file = open("parse_file.txt", 'w')
+		if TreeStringParser.pool is not None:
+			return TreeStringParser.pool.parse(list(sentences))
+
+		parse_file = tempfile.NamedTemporaryFile('w', suffix=".txt", delete=False)
 		for sentence in sentences:
 			parse_file.write(sentence + "\n")
 		parse_file.close()
@@ -21,4 +21,6 @@ This package contains the following files:
 			A grammar file for English used by the Berkeley Parser
 	[03] TreeStringParser.py
 			Provides functions to run the Berkeley Parser and capture its output.
+	[04] ParserPool.py
+			Keeps Berkeley Parser processes running so that several workers can share them.
 """
\ No newline at end of file
@@ -27,8 +27,13 @@ class CleanSentenizer(Sentenizer):
 
 		temp = []
 		for sent in sentences:
-			temp.append(re.sub(r"\n", "", sent))
+			temp.append(self.normalize(sent))
 
 		sentences = temp
 
-		return sentences
\ No newline at end of file
+		return sentences
+
+	@staticmethod
+	def normalize(sentence):
+		""" Returns the given sentence with newlines removed. """
+		return re.sub(r"\n", "", sentence)
\ No newline at end of file
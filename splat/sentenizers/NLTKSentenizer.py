@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 
-##### PYTHON IMPORTS ###################################################################################################
-import os
-
 ##### NLTK IMPORTS #####################################################################################################
 from nltk import sent_tokenize
 
 ##### SPLAT IMPORTS ####################################################################################################
 from splat.sentenizers.Sentenizer import Sentenizer
+import splat.Util as Util
 
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
@@ -24,6 +22,10 @@ class NLTKSentenizer(Sentenizer):
 	"""
 	A RawSentenizer provides the functionality to generate a list of unprocessed sentences from a text input.
 	"""
+	def sentenize_file(self, path):
+		""" Returns a list of sentences from the given file, which is memory-mapped rather than read line by line. """
+		return self.sentenize("".join(Util.read_mapped_blocks(path, self.encoding)))
+
 	def sentenize(self, text):
 		"""
 
@@ -34,10 +36,7 @@ class NLTKSentenizer(Sentenizer):
 		"""
 		sentences = ""
 		if type(text) == str:
-			if os.path.exists(text):
-				sentences = " ".join(self.__sentenize_file(self, text))
-			else:
-				sentences = text
+			sentences = text
 		elif type(text) == list:
 			sentences = " ".join(text)
 		else:
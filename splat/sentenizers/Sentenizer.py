@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 
+##### PYTHON IMPORTS ###################################################################################################
+from array import array
+import re
+
 ##### SPLAT IMPORTS ####################################################################################################
-import os.path
+from splat.SpanList import SpanList
+import splat.Util as Util
 
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
@@ -19,6 +24,13 @@ class Sentenizer:
 	A Sentenizer provides the functionality to generate a list of sentences from a text input.
 	"""
 	punctlist = [".", "!", "?"]
+	# Matches a whole space-delimited word that contains sentence-final punctuation.
+	end_pattern = re.compile(r"(?<![^ ])[^ " + re.escape("".join(punctlist)) + r"]*[" + re.escape("".join(punctlist)) +
+							 r"][^ ]*")
+	# The encoding used to decode files given to sentenize_file().
+	encoding = "utf-8"
+	# Subclasses may provide a function to normalize each sentence when it is created from a span.
+	normalize = None
 
 	def __init__(self):
 		"""
@@ -26,6 +38,26 @@ class Sentenizer:
 		"""
 		pass
 
+	@staticmethod
+	def __sentence_offsets(self, text):
+		"""
+		Returns a flat array of the (start, end) offsets of each sentence in the given string. A sentence ends with the
+		first space-delimited word that contains punctuation from punctlist; trailing words without such punctuation do
+		not form a sentence. Runs in a single linear scan of the string.
+		:param text:a string to be sentenized
+		:type text:str
+		:return:a flat array of offsets: start0, end0, start1, end1, ...
+		:rtype:array
+		"""
+		offsets = array('L')
+		start = 0
+		for match in self.end_pattern.finditer(text):
+			offsets.append(start)
+			offsets.append(match.end())
+			start = match.end() + 1
+
+		return offsets
+
 	@staticmethod
 	def __sentenize_list(self, text):
 		"""
@@ -37,19 +69,7 @@ class Sentenizer:
 		"""
 		sentences = []
 		for item in text:
-			temp_sent = ""
-			for word in item.split(" "):
-				punct_flag = False
-				for punct in self.punctlist:
-					if punct in word:
-						punct_flag = True
-						break
-				if punct_flag:
-					temp_sent += word
-					sentences.append(temp_sent)
-					temp_sent = ""
-				else:
-					temp_sent += word + " "
+			sentences.extend(self.__sentenize_string(self, item))
 
 		return sentences
 
@@ -62,66 +82,55 @@ class Sentenizer:
 		:return:list of sentences
 		:rtype:list
 		"""
-		sentences = []
-		temp_sent = ""
-		for word in text.split(" "):
-			punct_flag = False
-			for punct in self.punctlist:
-				if punct in word:
-					punct_flag = True
-					break
-			if punct_flag:
-				temp_sent += word
-				sentences.append(temp_sent)
-				temp_sent = ""
-			else:
-				temp_sent += word + " "
+		return SpanList(text, self.__sentence_offsets(self, text)).strings()
 
-		return sentences
+	def spans(self, text):
+		"""
+		Returns the (start, end) character offsets of each sentence in the given string. Substrings are only created
+		when they are requested from the returned SpanList.
+		:param text:a string to be sentenized
+		:type text:str
+		:return:the offsets of each sentence
+		:rtype:SpanList
+		"""
+		if type(text) != str:
+			raise ValueError("Text to sentenize into spans must be of type str.")
 
-	@staticmethod
-	def __sentenize_file(self, text):
+		return SpanList(text, self.__sentence_offsets(self, text), self.normalize)
+
+	def sentenize_file(self, path):
 		"""
-		Returns a list of sentences.
-		:param text:a file to be sentenized
-		:type text:filename
+		Returns a list of sentences from the given file. The file is memory-mapped and scanned in large blocks with the
+		same compiled pattern as sentenize(), rather than being read line by line. Line breaks inside a sentence are
+		replaced by spaces.
+		:param path:a file to be sentenized
+		:type path:filename
 		:return:list of sentences
 		:rtype:list
 		"""
 		sentences = []
-		temp_sent = ""
-		with open(text, 'r') as f:
-			for line in f:
-				for word in line.split(" "):
-					punct_flag = False
-					for punct in self.punctlist:
-						if punct in word:
-							punct_flag = True
-							break
-					if punct_flag:
-						temp_sent += word
-						sentences.append(temp_sent)
-						temp_sent = ""
-					else:
-						temp_sent += word + " "
+		carry = ""
+		for block in Util.read_mapped_blocks(path, self.encoding):
+			# A sentence may continue into the next block, so the text after the last sentence is carried over.
+			text = carry + block
+			spans = self.spans(text)
+			sentences.extend(spans.strings())
+			carry = text[spans[-1][1] + 1:] if len(spans) > 0 else text
 
 		return sentences
 
 	def sentenize(self, text):
 		"""
-		Determines whether the given text is a string, a list of string, or a valid filename.
-		Generates a list of sentences.
-		:param text:some text to be tokenized
-		:type text:str,list,filename
+		Determines whether the given text is a string or a list of strings, and generates a list of sentences. Strings
+		are never treated as filenames; use sentenize_file() to sentenize a file.
+		:param text:some text to be sentenized
+		:type text:str,list
 		:return:list of sentences
 		:rtype:list
 		"""
 		sentences = []
 		if type(text) == str:
-			if os.path.exists(text):
-				sentences = self.__sentenize_file(self, text)
-			else:
-				sentences = self.__sentenize_string(self, text)
+			sentences = self.__sentenize_string(self, text)
 		elif type(text) == list:
 			sentences = self.__sentenize_list(self, text)
 		else:
@@ -18,5 +18,7 @@ This package contains the following files:
 	[02] RawSentenizer.py
 			Provides the functionality to generate a list of unprocessed sentences from a text input.
 	[03] Sentenizer.py
-			An abstract class that is implemented by the other Sentenizers in this directory.
+			An abstract class that is implemented by the other Sentenizers in this directory. Sentenizers can also
+			return (start, end) character offsets for each sentence as a SpanList (see splat/SpanList.py), and sentenize
+			files through a memory map with sentenize_file().
 """
\ No newline at end of file
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
 ##### NLTK IMPORTS #####################################################################################################
-from nltk import pos_tag
 from nltk import word_tokenize
+from nltk.tag.perceptron import PerceptronTagger
 
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
@@ -20,6 +20,8 @@ class NLTKPOSTagger:
 	An NLTKPOSTagger tokenizes the given input with punctuation as separate tokens, and then does a dictionary lookup to
 	determine the part-of-speech for each token.
 	"""
+	# The tagger model is loaded the first time it is needed, and then shared by every NLTKPOSTagger.
+	__tagger = None
 
 	def __init__(self):
 		"""
@@ -37,13 +39,24 @@ class NLTKPOSTagger:
 		"""
 		tagged_text = []
 		if type(text) == str:
-			tagged_text = pos_tag(word_tokenize(text))
+			tagged_text = self.tagger().tag(word_tokenize(text))
 		elif type(text) == list:
 			new_text = " ".join(text)
-			tagged_text = pos_tag(word_tokenize(new_text))
+			tagged_text = self.tagger().tag(word_tokenize(new_text))
 
 		return tagged_text
 
+	@classmethod
+	def tagger(cls):
+		"""
+		Returns the shared NLTK perceptron tagger, loading its model if this is the first call.
+		:return:the NLTK perceptron tagger
+		:rtype:PerceptronTagger
+		"""
+		if cls.__tagger is None:
+			cls.__tagger = PerceptronTagger()
+		return cls.__tagger
+
 	def untag(self, tagged_list):
 		"""
 		Return a string of untagged text
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 ##### SPLAT IMPORTS ####################################################################################################
-from splat.corpora import BROWN_TAGS
+import splat.corpora as corpora
 from tokenizers.PunctTokenizer import PunctTokenizer
 
 ########################################################################################################################
@@ -23,11 +23,11 @@ class POSTagger:
 	__tags_dict = {}
 	__p_tokenizer = PunctTokenizer()
 
-	def __init__(self, tag_dict=BROWN_TAGS, tokenizer=PunctTokenizer()):
+	def __init__(self, tag_dict=None, tokenizer=PunctTokenizer()):
 		"""
-		Creates a Tagger object.
+		Creates a Tagger object. By default, words are tagged with their tags in the Brown Corpus.
 		"""
-		self.__tags_dict = tag_dict
+		self.__tags_dict = corpora.brown_tags() if tag_dict is None else tag_dict
 		self.__p_tokenizer = tokenizer
 
 	def __tag_list(self, text_list):
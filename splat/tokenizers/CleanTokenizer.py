@@ -34,7 +34,11 @@ class CleanTokenizer(Tokenizer):
 		raw_tokens = temp
 
 		for word in raw_tokens:
-			clean_word = re.sub(r"[\.,!\?]", "", word)
-			clean_tokens.append(clean_word.lower())
+			clean_tokens.append(self.normalize(word))
 		
 		return clean_tokens
+
+	@staticmethod
+	def normalize(word):
+		""" Returns the given word lowercased, with basic punctuation removed. """
+		return re.sub(r"[\.,!\?]", "", word).lower()
@@ -1,8 +1,5 @@
 #!/usr/bin/env python3
 
-##### PYTHON IMPORTS ###################################################################################################
-import os
-
 ##### NLTK IMPORTS #####################################################################################################
 from nltk import wordpunct_tokenize
 
@@ -28,10 +25,7 @@ class NLTKPunctTokenizer(Tokenizer):
 		raw_text = ""
 		raw_tokens = []
 		if type(text) == str:
-			if os.path.exists(text):
-				raw_text = " ".join(self.__tokenize_file(text))
-			else:
-				raw_text = text
+			raw_text = text
 		elif type(text) == list:
 			raw_text = " ".join(text)
 		else:
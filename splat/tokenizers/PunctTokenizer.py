@@ -21,13 +21,16 @@ class PunctTokenizer(Tokenizer):
 	"""
 	A PuncTokenizer provides the ability to tokenize a text input, including punctuation as separate tokens.
 	"""
+	word_pattern = re.compile(r"[\w']+|[\.,!?;:]")
+	normalize = staticmethod(str.lower)
+
 	def tokenize(self, text):
 		punc_tokens = []
 		raw_tokens = Tokenizer.tokenize(self, text)
 		
 		temp = []
 		for token in raw_tokens:
-			temp_tokens = re.findall(r"[\w']+|[\.,!?;:]", token)
+			temp_tokens = self.word_pattern.findall(token)
 			for temp_token in temp_tokens:
 				if token != "" and token != " " and token != ' ' and token != '':
 					temp.append(temp_token.lower())
@@ -2,7 +2,12 @@
 
 ##### PYTHON IMPORTS ###################################################################################################
 from abc import abstractmethod
-import os.path
+from array import array
+import re
+
+##### SPLAT IMPORTS ####################################################################################################
+from splat.SpanList import SpanList
+import splat.Util as Util
 
 ########################################################################################################################
 ##### INFORMATION ######################################################################################################
@@ -19,6 +24,13 @@ class Tokenizer:
 	"""
 	A Tokenizer provides the functionality to generate a list of tokens from a text input.
 	"""
+	# A word is a run of characters delimited by spaces, with any leading or trailing newlines removed.
+	word_pattern = re.compile(r"[^ \n](?:[^ ]*[^ \n])?")
+	# The encoding used to decode files given to tokenize_file().
+	encoding = "utf-8"
+	# Subclasses may provide a function to normalize each token when it is created from a span.
+	normalize = None
+
 	def __init__(self):
 		"""
 		Creates a Tokenizer object.
@@ -50,37 +62,56 @@ class Tokenizer:
 		:return:a list of tokens
 		:rtype:list
 		"""
-		tokens = []
-		for word in text.split(" "):
-			tokens.append(word.strip("\n"))
+		if "\n" not in text:
+			# Without newlines, the word pattern is equivalent to a (much faster) split on spaces.
+			return list(filter(None, text.split(" ")))
+		return Tokenizer.word_pattern.findall(text)
 
-		return tokens
+	def spans(self, text):
+		"""
+		Returns the (start, end) character offsets of each token in the given string. Substrings are only created when
+		they are requested from the returned SpanList.
+		:param text:a string to be tokenized
+		:type text:str
+		:return:the offsets of each token
+		:rtype:SpanList
+		"""
+		if type(text) != str:
+			raise ValueError("Text to tokenize into spans must be of type str.")
+		offsets = array('L')
+		for match in self.word_pattern.finditer(text):
+			offsets.extend(match.span())
 
-	@staticmethod
-	def __tokenize_file(text):
+		return SpanList(text, offsets, self.normalize)
+
+	def tokenize_file(self, path):
 		"""
-		Returns a list of tokens.
-		:param text:a list of strings to be tokenized
-		:type text:filename
+		Returns a list of tokens from the given file. The file is memory-mapped and tokenized in large blocks with the
+		same compiled patterns as tokenize(), rather than being read line by line. Line breaks separate tokens.
+		:param path:a file to be tokenized
+		:type path:filename
 		:return:a list of tokens
 		:rtype:list
 		"""
 		tokens = []
-		with open(text, 'r') as f:
-			for line in f:
-				for word in line.split(" "):
-					tokens.append(word)
+		for block in Util.read_mapped_blocks(path, self.encoding):
+			tokens.extend(self.tokenize(block))
 
 		return tokens
 
 	@abstractmethod
 	def tokenize(self, text):
+		"""
+		Generates a list of tokens from a string or a list of strings. Strings are never treated as filenames; use
+		tokenize_file() to tokenize a file.
+		:param text:some text to be tokenized
+		:type text:str,list
+		:return:a list of tokens
+		:rtype:list
+		"""
 		raw_tokens = []
 		if type(text) == str:
-			if os.path.exists(text):
-				raw_tokens = self.__tokenize_file(text)
-			else:
-				raw_tokens = self.__tokenize_string(text)
+			raw_tokens = self.__tokenize_string(text)
 		elif type(text) == list:
 			raw_tokens = self.__tokenize_list(text)
 		else:
@@ -21,5 +21,7 @@ This package contains the following files:
 	[03] RawTokenizer.py
 			Provides the functionality to tokenize a given text input with no pre-processing or normalizing.
 	[04] Tokenizer.py
-			An abstract class that is implemented by the other Tokenizers in this directory.
+			An abstract class that is implemented by the other Tokenizers in this directory. Tokenizers can also return
+			(start, end) character offsets for each token as a SpanList (see splat/SpanList.py), and tokenize files
+			through a memory map with tokenize_file().
 """
\ No newline at end of file
@@ -1,10 +1,26 @@
 #!/usr/bin/env python3
 
 ##### PYTHON IMPORTS ###################################################################################################
-import unittest, sys
+import unittest, sys, json, io, math, os, subprocess, tempfile, time
 
 ##### SPLAT IMPORTS ####################################################################################################
 from splat.SPLAT import SPLAT
+from splat.Vocabulary import Vocabulary
+from splat.Extractor import Extractor
+from splat.Batch import Batch
+from splat.Server import Server
+from splat.FeatureStore import FeatureStore
+from splat.TextGrid import TextGrid
+from splat.classifiers.FeatureMatrix import FeatureMatrix
+from splat.parsers.ParserPool import ParserPool
+from splat.tokenizers.CleanTokenizer import CleanTokenizer
+from splat.tokenizers.RawTokenizer import RawTokenizer
+from splat.sentenizers.CleanSentenizer import CleanSentenizer
+import splat.Util as Util
+from splat.complexity import idea_density
+import splat.complexity as cUtil
+import splat.complexity.readability as rUtil
+import splat.complexity.lexical_diversity as ldUtil
 
 class TestBasics(unittest.TestCase):
     whitman_splat = SPLAT("tests/whitman_test.txt")
@@ -53,6 +69,8 @@ class TestBasics(unittest.TestCase):
         unexpected = self.frankenstein_splat.tokens()
         self.assertEqual(output, expected)
         self.assertNotEqual(output, unexpected)
+        self.assertIsInstance(output, list)
+        self.assertEqual(json.loads(json.dumps(output)), expected)
 
     def test_rawtokens(self):
         expected = ['I', 'celebrate', 'myself,', 'and', 'sing', 'myself,', 'And', 'what', 'I', 'assume', 'you', 'shall', 'assume,', 'For', 'every', 'atom', 'belonging', 'to', 'me', 'as', 'good', 'belongs', 'to', 'you.']
@@ -136,6 +154,349 @@ class TestBasics(unittest.TestCase):
         self.assertEqual(output, expected)
         self.assertNotEqual(output, unexpected)
 
+    def test_longest_shortest_words(self):
+        self.assertEqual(self.whitman_splat.longest_words(), {'belonging', 'celebrate'})
+        self.assertEqual(self.whitman_splat.shortest_words(), {'i'})
+
+    def test_word_lengths(self):
+        expected = [(1, 2), (2, 4), (3, 5), (4, 4), (5, 2), (6, 4), (7, 1), (9, 2)]
+        self.assertEqual(self.whitman_splat.word_length_histogram(), expected)
+        self.assertEqual(self.whitman_splat.average_word_length(), 4.1667)
+        self.assertEqual(self.whitman_splat.word_length_percentile(50), 4)
+        self.assertEqual(self.whitman_splat.word_length_percentile(90), 7)
+
+    def test_spans(self):
+        token_spans = self.whitman_splat.token_spans()
+        self.assertEqual(token_spans[:3], [(0, 1), (2, 11), (12, 19)])
+        self.assertEqual(token_spans.strings(), self.whitman_splat.tokens())
+        sent_spans = self.frankenstein_splat.sent_spans()
+        self.assertEqual(sent_spans.strings(), self.frankenstein_splat.sents())
+        self.assertEqual(self.frankenstein_splat.splat()[slice(*sent_spans[1])], self.frankenstein_splat.sents()[1])
+
+    def test_streaming(self):
+        streamed = SPLAT.from_file("tests/frankenstein_test.txt", streaming=True, chunk_size=16)
+        self.assertEqual(streamed.wordcount(), self.frankenstein_splat.wordcount())
+        self.assertEqual(streamed.sentcount(), self.frankenstein_splat.sentcount())
+        self.assertEqual(streamed.types(), self.frankenstein_splat.types())
+        self.assertEqual(streamed.dis(), self.frankenstein_splat.dis())
+        self.assertEqual(streamed.get_most_freq(5), self.frankenstein_splat.get_most_freq(5))
+        self.assertEqual(streamed.ngram_counts(3), self.frankenstein_splat.ngram_counts(3))
+        self.assertRaises(ValueError, streamed.tokens)
+
+    def test_file_ingestion(self):
+        self.assertEqual(CleanTokenizer().tokenize_file("tests/whitman_test.txt"), self.whitman_splat.tokens())
+        self.assertEqual(CleanSentenizer().sentenize_file("tests/frankenstein_test.txt"),
+                         self.frankenstein_splat.sents())
+        self.assertEqual(RawTokenizer().tokenize("tests/whitman_test.txt"), ["tests/whitman_test.txt"])
+
+    def test_lazy_features(self):
+        lazy_splat = SPLAT("tests/whitman_test.txt")
+        self.assertEqual(sorted(json.loads(lazy_splat.dumps())["_SPLAT__cache"]), ["text", "utterances"])
+        lazy_splat.wordcount()
+        self.assertNotIn("sentences", json.loads(lazy_splat.dumps())["_SPLAT__cache"])
+
+    def test_extract(self):
+        branches = Extractor().plan(["flesch", "yngve", "cfr"])
+        self.assertEqual(len(branches), 2)
+        self.assertIn(["treestrings", "yngve"], branches)
+        expected = {"wc": 49, "cfr": 0.75, "sentcount": 2}
+        self.assertEqual(Extractor().extract(self.frankenstein_splat, ["wc", "cfr", "sentcount"]), expected)
+
+    def test_batch(self):
+        out_file = io.StringIO()
+        sources = ["tests/frankenstein_test.txt", "tests/whitman_*.txt"]
+        count = Batch(["wc", "sentcount"], processes=2).run(sources, out_file)
+        self.assertEqual(count, 2)
+        rows = [json.loads(line) for line in out_file.getvalue().splitlines()]
+        self.assertEqual(rows[0], {"file": "tests/frankenstein_test.txt", "wc": 49, "sentcount": 2})
+        self.assertEqual(rows[1]["wc"], self.whitman_splat.wordcount())
+        pool = ParserPool(1, ["cat"])
+        self.assertEqual(pool.parse(["(S (NP it))", "", "(S (VP ran))"]), ["(S (NP it))", "(S (VP ran))"])
+        pool.close()
+
+    def test_server(self):
+        server = Server(workers=1, queue_size=0)
+        expected = {"features": {"wc": 49, "sentcount": 2}}
+        self.assertEqual(server.handle({"file": "tests/frankenstein_test.txt", "features": "wc,sentcount"}), expected)
+        self.assertEqual(server.handle_json('{"text": "I am here.", "features": ["wc"]}'), {"features": {"wc": 3}})
+        self.assertIn("error", server.handle({"text": "I am here."}))
+        self.assertIn("error", server.handle_json("{"))
+
+    def test_binary_cache(self):
+        path = os.path.join(tempfile.mkdtemp(), "whitman.splat")
+        self.whitman_splat.type_token_ratio()
+        self.whitman_splat.save_cache(path)
+        cached = SPLAT.load_cache(path)
+        self.assertEqual(cached.type_token_ratio(), self.whitman_splat.type_token_ratio())
+        self.assertEqual(cached.tokens(), self.whitman_splat.tokens())
+        size = os.path.getsize(path)
+        cached.save_cache(path)
+        self.assertEqual(os.path.getsize(path), size)
+        cached.get_most_freq(3)
+        cached.save_cache(path)
+        self.assertGreater(os.path.getsize(path), size)
+        self.assertEqual(SPLAT.load_cache(path).get_most_freq(3), self.whitman_splat.get_most_freq(3))
+        # The vocabulary grows when new tokens are interned after it was cached, so it is written again.
+        partial_path = os.path.join(os.path.dirname(path), "frankenstein.splat")
+        partial = SPLAT("tests/frankenstein_test.txt")
+        partial.wordcount()
+        partial.save_cache(partial_path)
+        partial = SPLAT.load_cache(partial_path)
+        partial.types()
+        partial.save_cache(partial_path)
+        self.assertEqual(SPLAT.load_cache(partial_path).get_most_freq(2), self.frankenstein_splat.get_most_freq(2))
+        with open(path, 'r+b') as f:
+            f.seek(8)
+            f.write(b"\xff\xff")
+        self.assertRaises(ValueError, SPLAT.load_cache, path)
+
+    def test_feature_store(self):
+        store = FeatureStore(tempfile.mkdtemp(), max_size=4096)
+        first = store.load("tests/whitman_test.txt")
+        first.type_token_ratio()
+        store.save(first)
+        self.assertEqual(store.path(first), store.path(SPLAT(self.whitman_splat.splat())))
+        self.assertNotEqual(store.path(first), store.path(SPLAT("tests/frankenstein_test.txt")))
+        second = store.load(SPLAT("tests/whitman_test.txt"))
+        self.assertEqual(second.type_token_ratio(), first.type_token_ratio())
+        self.assertEqual(second.tokens(), first.tokens())
+        other = store.load("tests/frankenstein_test.txt")
+        other.get_most_freq(2)
+        store.save(other)
+        self.assertLessEqual(store.size(), 4096)
+        self.assertEqual(store.load("tests/frankenstein_test.txt").get_most_freq(2), [('my', 4), ('of', 3)])
+
+    def test_extend(self):
+        lines = self.whitman_splat.utts()
+        extended = SPLAT("\n".join(lines[:1]))
+        (extended.wordcount(), extended.types(), extended.get_most_freq(), extended.bigrams(), extended.average_dpu())
+        extended.extend("\n".join(lines[1:]))
+        full = SPLAT("\n".join(lines))
+        self.assertEqual(extended.wordcount(), full.wordcount())
+        self.assertEqual(extended.types(), full.types())
+        self.assertEqual(extended.get_most_freq(), full.get_most_freq())
+        self.assertEqual(extended.bigrams(), full.bigrams())
+        self.assertEqual(extended.average_dpu(), full.average_dpu())
+        self.assertEqual(extended.sentcount(), full.sentcount())
+
+    def test_extend_keeps_returned_features(self):
+        doc = SPLAT("um the cat sat\nI I went- home")
+        (token_ids, matrix, freq_dist) = (doc.feature("token_ids"), doc.disfluency_matrix(), doc.feature("freq_dist"))
+        (old_ids, old_matrix, old_freq) = (list(token_ids), list(matrix), dict(freq_dist))
+        doc.extend("the cat ran")
+        self.assertEqual((list(token_ids), list(matrix), dict(freq_dist)), (old_ids, old_matrix, old_freq))
+        self.assertEqual(doc.feature("freq_dist")["cat"], 2)
+
+    def test_moving_window(self):
+        rows = self.frankenstein_splat.moving_window(["wc", "uwc", "ttr", "cfr"], 10, 7)
+        self.assertEqual([(row["start"], row["end"]) for row in rows], [(0, 10), (7, 17), (14, 24), (21, 31), (28, 38),
+                                                                       (35, 45)])
+        tokens = self.frankenstein_splat.rawtokens()
+        for row in rows:
+            window = SPLAT(" ".join(tokens[row["start"]:row["end"]]))
+            self.assertEqual(row["uwc"], window.unique_wordcount())
+            self.assertEqual(row["ttr"], window.type_token_ratio())
+            self.assertEqual(row["cfr"], window.content_function_ratio())
+        rows = self.whitman_splat.moving_window(["wc"], 2, 1, "utterances")
+        self.assertEqual(rows, [{"start": 0, "end": 2, "wc": 13}, {"start": 1, "end": 3, "wc": 18}])
+
+    def test_disfluency_matrix(self):
+        repeated = SPLAT("um I went\num I went\nuh a- a- store")
+        self.assertEqual(list(repeated.disfluency_matrix()), [1, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0,
+                                                              1, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0,
+                                                              0, 1, 0, 0, 0, 0, 1, 1, 4, 0, 1])
+        self.assertEqual(repeated.average_dpu(), 5 / 3)
+        self.assertEqual(repeated.dis()["UM"], 2)
+        self.assertEqual(repeated.dis()["Break"], 1)
+        self.assertEqual(repeated.dis()["Repetitions"], 1)
+        self.assertEqual(list(Util.disfluency_matrix(["I I went to the the store"]))[:9], [0, 0, 0, 0, 0, 0, 2, 0, 7])
+
+    def test_repetitions(self):
+        self.assertEqual(Util.find_repetitions("I went I went to the store".split(" ")), [(0, 2, "repetition")])
+        self.assertEqual(Util.find_repetitions("I went- I went to the store".split(" ")), [(0, 2, "restart")])
+        self.assertEqual(Util.find_repetitions("I wen- I went to the store".split(" ")), [(0, 2, "restart")])
+        self.assertEqual(Util.find_repetitions("the the the cat".split(" ")),
+                         [(0, 1, "repetition"), (1, 2, "repetition")])
+        self.assertEqual(Util.find_repetitions("that is that".split(" ")), [])
+        restarted = SPLAT("I went- I went to the store\nand then and then I left")
+        self.assertEqual(restarted.repetitions(), [(0, 0, 2, "restart"), (1, 0, 2, "repetition")])
+        self.assertEqual(restarted.dis()["Restarts"], 1)
+        self.assertEqual(restarted.dis()["Phrase Repetitions"], 1)
+
+    def test_dialog_acts(self):
+        annotated = SPLAT("um can you help me (Info-Request, Action-Request)\nno acts here\n"
+                          "I went- I went (Custom-Act)")
+        acts = annotated.dialog_acts()
+        self.assertEqual(list(acts.keys()), ["Info-Request", "Action-Request", "Custom-Act"])
+        self.assertEqual(acts["Info-Request"]["Utterances"], 1)
+        self.assertEqual(acts["Action-Request"]["Words"], 5)
+        self.assertEqual(acts["Action-Request"]["UM"], 1)
+        self.assertEqual(acts["Custom-Act"]["Restarts"], 1)
+        # The acts keep the order they were first seen in through JSON and the binary cache.
+        restored = SPLAT("")
+        restored.loads(annotated.dumps())
+        self.assertEqual(list(restored.dialog_acts().keys()), list(acts.keys()))
+        path = os.path.join(tempfile.mkdtemp(), "acts.splat")
+        annotated.save_cache(path)
+        self.assertEqual(list(SPLAT.load_cache(path).dialog_acts().keys()), list(acts.keys()))
+        self.assertEqual(Util.get_disfluencies_per_act(annotated.splat())["Info-Request"], [1, 0, 0, 0, 0, 0, 0, 0])
+        per_act = Util.get_disfluencies_per_act("I I went to the the store (Inform)\num -well I went- (Filler)")
+        self.assertEqual(per_act["Inform"], [0, 0, 0, 0, 0, 0, 2, 0])
+        self.assertEqual(per_act["Filler"], [1, 0, 0, 0, 0, 0, 0, 1])
+
+    def test_idea_density_rules(self):
+        trees = ["(ROOT (S (NP (PRP he)) (VP (VBZ is) (ADJP (RB very) (JJR taller))) (. .)))",
+                 "(ROOT (S (NP (DT the) (NN dog)) (VP (VBD had) (RB not) (VBN been) (VP (VBG running))) (. .)))",
+                 "(ROOT (SQ (VBZ is) (NP (PRP he)) (VP (VBG going) (S (VP (TO to) (VP (VB go))))) (. ?)))"]
+        self.assertEqual(idea_density.calc_ideas(trees), [3 / 5, 2 / 7, 2 / 6])
+        words = idea_density.apply_counting_rules([idea_density.WordObj(token, tag) for (token, tag) in
+                                                   [("is", "VBZ"), ("he", "PRP"), ("going", "VBG"), (".", ".")]])
+        self.assertEqual([word.token for word in words], ["is/moved", "he", "is", "going", "."])
+
+    def test_parallel_densities(self):
+        trees = ["(ROOT (S (NP (PRP he)) (VP (VBZ is) (ADJP (RB very) (JJR taller))) (. .)))",
+                 "(ROOT (S (NP (DT the) (NN dog)) (VP (VBD had) (RB not) (VBN been) (VP (VBG running))) (. .)))",
+                 "(ROOT (S (NP (PRP I)) (VP (VBD went) (PP (IN like) (NP (NN home)))) (. .)))"]
+        serial = cUtil.calc_densities(trees, processes=1)
+        self.assertEqual(cUtil.calc_densities(trees, processes=2, chunk_size=1), serial)
+        self.assertEqual(serial["content_densities"], cUtil.calc_content_densities(trees))
+        self.assertEqual(serial["idea_density"], idea_density.calc_idea(trees))
+        self.assertEqual(cUtil.calc_densities(trees, processes=1, speech_mode=True)["idea_densities"],
+                         idea_density.calc_ideas(trees, True))
+        self.assertEqual((idea_density.calc_ideas(trees)[2], idea_density.calc_ideas(trees, True)[2]), (2 / 5, 1 / 5))
+
+    def test_feature_table(self):
+        doc = SPLAT("um the dog ran home. It was big.\n\nI went- I went home")
+        table = doc.feature_table(columns=["words", "sentences", "UM", "Restarts"])
+        self.assertEqual(len(table), 3)
+        self.assertEqual(list(table.column("words")), [8, 0, 5])
+        self.assertEqual(list(table.column("sentences")), [2, 0, 0])
+        self.assertEqual(list(table.column("UM")), [1, 0, 0])
+        self.assertEqual(list(table.column("Restarts")), [0, 0, 1])
+        out = io.StringIO()
+        table.to_csv(out)
+        self.assertEqual(out.getvalue().splitlines(), ["words,sentences,UM,Restarts", "8,2,1,0", "0,0,0,0", "5,0,0,1"])
+        self.assertRaises(ValueError, doc.feature_table, "sentences", ["yngve"])
+
+    def test_feature_matrix(self):
+        matrix = FeatureMatrix(["wc", "disfluencies"], ngrams=[1, 2], alternate_sign=False)
+        matrix.add_all(SPLAT(text) for text in ["um the cat saw the cat", "the dog"])
+        self.assertEqual(len(matrix), 2)
+        self.assertEqual(matrix.columns[0], "wc")
+        self.assertEqual(matrix.columns[matrix.column("disfluencies:UM")], "disfluencies:UM")
+        (data, indices, indptr) = matrix.csr()
+        self.assertEqual(list(indptr), [0, 8, 11])
+        self.assertEqual(sum(data[indptr[0]:indptr[1]]), 11.0)
+        row = dict(zip(indices[indptr[0]:indptr[1]], data[indptr[0]:indptr[1]]))
+        self.assertEqual(row[matrix.hash(("the",))[0]], 2.0)
+        self.assertEqual(row[matrix.hash(("the", "cat"))[0]], 2.0)
+        self.assertRaises(ValueError, FeatureMatrix(["tokens"]).add, "the cat")
+
+    def test_feature_matrix_dense(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not installed.")
+        matrix = FeatureMatrix(["wc"], ngrams=[1])
+        matrix.add("the cat saw the dog")
+        dense = matrix.dense()
+        matrix.add("the dog")
+        dense[0, 0] = 99.0
+        self.assertEqual(dense.tolist(), [[99.0]])
+        self.assertEqual(matrix.dense().tolist(), [[5.0], [2.0]])
+        (data, indices, indptr) = matrix.csr()
+        data[0] = 99.0
+        self.assertNotEqual(matrix.csr()[0][0], 99.0)
+
+    def test_readability(self):
+        types = [("the", 4), ("cat", 2), ("extraordinary", 1), ("sat", 1)]
+        counts = rUtil.count_readability(types, 8, 2, syllables=lambda word: 6 if word == "extraordinary" else 1,
+                                         familiar={"the", "cat", "sat"})
+        self.assertEqual(counts, {"words": 8, "sentences": 2, "syllables": 13, "polysyllables": 1, "letters": 34,
+                                  "characters": 34, "long_words": 1, "difficult_words": 1})
+        self.assertEqual(rUtil.calc_readability(counts),
+                         {"flesch": 65.3, "kincaid": 5.1, "fog": 6.6, "smog": 7.2, "coleman_liau": 1.8, "ari": 0.6,
+                          "dale_chall": 5.8, "lix": 16.5})
+        self.assertEqual(set(rUtil.calc_readability(rUtil.count_readability([], 0, 0, familiar=set())).values()), {0.0})
+        # Without familiar words, difficult words are not counted and the Dale-Chall score is left out.
+        counts = rUtil.count_readability(types, 8, 2, syllables=lambda word: 1)
+        self.assertNotIn("difficult_words", counts)
+        self.assertNotIn("dale_chall", rUtil.calc_readability(counts))
+        self.assertEqual(rUtil.count_difficult_words(types, familiar={"the", "cat"}), 2)
+
+    def test_lexical_diversity(self):
+        ids = [0, 1, 0, 2, 1, 0, 3, 3]
+        self.assertEqual(ldUtil.calc_mattr(ids, 3), round((2 + 3 + 3 + 3 + 3 + 2) / 18.0, 4))
+        self.assertEqual(ldUtil.calc_mattr(ids, 50), 0.5)
+        self.assertEqual(ldUtil.calc_mtld([0, 1, 2, 3]), 4.0)
+        self.assertEqual(ldUtil.calc_mtld([0, 0, 0, 0], 0.5), 2.0)
+        types = [("a", 2), ("b", 1), ("c", 1)]
+        self.assertEqual(ldUtil.calc_yules_k(types), 1250.0)
+        self.assertEqual(ldUtil.calc_honore(types), round(100.0 * math.log(4) / (1.0 - 2.0 / 3.0), 4))
+        self.assertEqual(ldUtil.calc_hdd(types, 2), round((1.0 - 1.0 / 6.0 + 2 * (1.0 - 1.0 / 2.0)) / 2.0, 4))
+        doc = SPLAT("the cat saw the dog and the dog saw the cat")
+        self.assertEqual(doc.mattr(11), doc.type_token_ratio())
+        self.assertEqual(doc.mattr(), doc.mattr(50))
+
+    def test_legacy_corpus_names(self):
+        from splat.corpora import CMUDICT, STOPWORDS_EN, cmu_dict, stopwords_en
+        self.assertEqual(CMUDICT["the"], cmu_dict()["the"])
+        self.assertEqual(set(STOPWORDS_EN), set(stopwords_en()))
+
+    def test_textgrid(self):
+        textgrid = TextGrid("tests/textgrid_sample.TextGrid")
+        self.assertEqual(len(list(textgrid.intervals())), 8)
+        tiers = textgrid.tiers()
+        self.assertEqual(list(tiers.keys()), ["A", "B"])
+        self.assertEqual(tiers["A"].splat().utts(), ['um I went to the store', 'and {sl} I bought some "milk"',
+                                                     'it was cold'])
+        self.assertEqual(tiers["B"].splat().utts(), ['uh what did you buy'])
+        self.assertEqual(tiers["A"].silences(), 1)
+        self.assertEqual(list(textgrid.rows(["wc", "wpm", "ppm"])),
+                         [{"tier": "A", "wc": 13, "wpm": 65.0, "ppm": 10.0},
+                          {"tier": "B", "wc": 5, "wpm": 100.0, "ppm": 0.0}])
+        merged = TextGrid("tests/textgrid_sample.TextGrid", {"A": "AB", "B": "AB"}).tiers()
+        self.assertEqual(merged["AB"].splat().uttcount(), 4)
+
+    def test_vocabulary(self):
+        vocab = Vocabulary()
+        ids = vocab.encode(['to', 'be', 'or', 'not', 'to', 'be'])
+        self.assertEqual(list(ids), [0, 1, 2, 3, 0, 1])
+        self.assertEqual(vocab.typify(ids), [('be', 2), ('not', 1), ('or', 1), ('to', 2)])
+        self.assertEqual(vocab.view(ids), ['to', 'be', 'or', 'not', 'to', 'be'])
+
+    def test_json_roundtrip(self):
+        loaded = SPLAT("NULL")
+        loaded.loads(self.whitman_splat.dumps())
+        self.assertEqual(loaded.tokens(), self.whitman_splat.tokens())
+        self.assertEqual(loaded.content_words(), self.whitman_splat.content_words())
+
+    def test_char_ngrams(self):
+        expected = [('al', 1), ('an', 2), ('as', 3), ('at', 3), ('be', 2)]
+        output = self.whitman_splat.char_ngrams(2)[:5]
+        self.assertEqual(output, expected)
+
+class TestStartup(unittest.TestCase):
+
+    def run_splat(self, *args):
+        """ Runs the splat command line in a new interpreter, and returns how long it took in seconds. """
+        env = dict(os.environ, PYTHONPATH=os.getcwd(), SPLAT_CACHE_DIR=tempfile.mkdtemp())
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "splat/splat"] + list(args), stdin=subprocess.DEVNULL,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+        return time.perf_counter() - start
+
+    def test_import_has_no_side_effects(self):
+        output = subprocess.check_output([sys.executable, "-c", "import splat, sys; print('nltk' in sys.modules)"],
+                                         stdin=subprocess.DEVNULL)
+        self.assertEqual(output.decode("utf-8"), "False\n")
+
+    # Timing depends on the machine, so this benchmark only runs when SPLAT_BENCHMARK is set.
+    @unittest.skipUnless(os.environ.get("SPLAT_BENCHMARK"), "Set SPLAT_BENCHMARK to time the command line.")
+    def test_startup_time(self):
+        times = sorted(self.run_splat("wc", "tests/whitman_test.txt") for i in range(3))
+        self.assertLess(times[1], 1.0, "splat wc took " + str(round(times[1], 3)) + "s (median of 3 runs)")
+
 class TestParsing(unittest.TestCase):
 
     def test_garden_path(self):
@@ -404,6 +765,10 @@ def run_test_suite(cla):
         suite = unittest.TestSuite()
         suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(TestParsing))
         unittest.TextTestRunner(verbosity=2).run(suite)
+    elif cla == "TestStartup":
+        suite = unittest.TestSuite()
+        suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(TestStartup))
+        unittest.TextTestRunner(verbosity=2).run(suite)
     elif cla == "TestBasics":
         suite = unittest.TestSuite()
         suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(TestBasics))
@@ -418,6 +783,7 @@ if __name__ == '__main__':
             elif arg == "TestComplexity": run_test_suite(arg)
             elif arg == "TestParsing": run_test_suite(arg)
             elif arg == "TestBasics": run_test_suite(arg)
+            elif arg == "TestStartup": run_test_suite(arg)
             else:
                 print("WARNING: Invalid argument " + arg)
                 print("Running all tests...")